@@ -0,0 +1,79 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Calls per second of generated API methods with and without argument
+validation.
+
+Runs a GET and a PATCH loop against a stubbed connection pool, so that the
+numbers measure the client and not the network, once with the default
+``validate_arguments=True`` and once with ``validate_arguments=False``.
+Responses are built with ``validate_responses=False`` to keep model
+validation out of the comparison.
+
+Usage: python benchmarks/api_call_validation.py [calls]
+"""
+
+import sys
+import time
+from unittest import mock
+
+import urllib3
+
+from kubernetes import client
+
+BODY = (b'{"apiVersion":"apps/v1","kind":"Deployment",'
+        b'"metadata":{"name":"web","namespace":"default"}}')
+
+
+def make_api(validate):
+    api_client = client.ApiClient(client.Configuration(
+        validate_arguments=validate, validate_responses=False))
+    pool_manager = mock.Mock()
+    pool_manager.request.side_effect = lambda *args, **kwargs: urllib3.HTTPResponse(
+        body=BODY, status=200, reason="OK",
+        headers={"Content-Type": "application/json"}, preload_content=False)
+    api_client.rest_client.pool_manager = pool_manager
+    return client.AppsV1Api(api_client)
+
+
+CALLS = (
+    ("GET", lambda api: api.read_namespaced_deployment("web", "default")),
+    ("PATCH", lambda api: api.patch_namespaced_deployment(
+        "web", "default", {"spec": {"replicas": 3}})),
+)
+
+
+def rate(api, call, calls):
+    call(api)
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            call(api)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return calls / best
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for label, call in CALLS:
+        before = rate(make_api(True), call, calls)
+        after = rate(make_api(False), call, calls)
+        print("{:<6} validated {:8.0f}/s  unvalidated {:8.0f}/s  speedup {:5.2f}x".format(
+            label, before, after, after / before))
+
+
+if __name__ == '__main__':
+    main()
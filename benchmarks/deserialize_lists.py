@@ -0,0 +1,152 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Deserialization time of large list responses.
+
+Builds synthetic V1PodList, V1NodeList and CoreV1EventList documents and
+times ``ApiClient.deserialize_data`` on them with the default validating
+path and with ``Configuration(validate_responses=False)``, reporting the
+best of three runs after a warm-up.
+
+Usage: python benchmarks/deserialize_lists.py [objects]
+"""
+
+import sys
+import time
+
+from kubernetes import client
+
+TIMESTAMP = "2026-01-01T00:00:00Z"
+
+
+def make_meta(kind, i):
+    return {
+        "name": "{}-{}".format(kind, i),
+        "namespace": "default",
+        "uid": "00000000-0000-0000-0000-{:012d}".format(i),
+        "resourceVersion": str(1000 + i),
+        "creationTimestamp": TIMESTAMP,
+        "labels": {"app": "bench", "tier": "backend"},
+        "managedFields": [{
+            "manager": "kubelet",
+            "operation": "Update",
+            "apiVersion": "v1",
+            "time": TIMESTAMP,
+            "fieldsType": "FieldsV1",
+            "fieldsV1": {"f:status": {"f:phase": {}}},
+        }],
+    }
+
+
+def make_pod(i):
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": make_meta("pod", i),
+        "spec": {
+            "nodeName": "node-{}".format(i % 50),
+            "containers": [{
+                "name": "app",
+                "image": "registry.example/app:1.0",
+                "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                "env": [{"name": "MODE", "value": "bench"}],
+                "resources": {"limits": {"cpu": "1", "memory": "1Gi"}},
+            }],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": "10.0.0.1",
+            "startTime": TIMESTAMP,
+            "conditions": [{
+                "type": "Ready", "status": "True", "lastTransitionTime": TIMESTAMP,
+            }],
+        },
+    }
+
+
+def make_node(i):
+    return {
+        "apiVersion": "v1",
+        "kind": "Node",
+        "metadata": make_meta("node", i),
+        "spec": {"podCIDR": "10.0.0.0/24"},
+        "status": {
+            "capacity": {"cpu": "8", "memory": "32Gi", "pods": "110"},
+            "allocatable": {"cpu": "7", "memory": "30Gi", "pods": "110"},
+            "addresses": [{"type": "InternalIP", "address": "192.168.0.1"}],
+            "conditions": [{
+                "type": "Ready", "status": "True", "reason": "KubeletReady",
+                "lastHeartbeatTime": TIMESTAMP, "lastTransitionTime": TIMESTAMP,
+            }],
+            "nodeInfo": {
+                "architecture": "amd64", "bootID": "b", "containerRuntimeVersion": "c",
+                "kernelVersion": "6.1", "kubeProxyVersion": "", "kubeletVersion": "v1.31",
+                "machineID": "m", "operatingSystem": "linux", "osImage": "linux",
+                "systemUUID": "s",
+            },
+        },
+    }
+
+
+def make_event(i):
+    return {
+        "apiVersion": "v1",
+        "kind": "Event",
+        "metadata": make_meta("event", i),
+        "involvedObject": {"kind": "Pod", "name": "pod-{}".format(i), "namespace": "default"},
+        "reason": "Started",
+        "message": "Started container app",
+        "source": {"component": "kubelet", "host": "node-1"},
+        "firstTimestamp": TIMESTAMP,
+        "lastTimestamp": TIMESTAMP,
+        "count": 1,
+        "type": "Normal",
+    }
+
+
+def measure(label, response_type, data, repeat=3):
+    results = []
+    for validate in (True, False):
+        api_client = client.ApiClient(client.Configuration(validate_responses=validate))
+        # Build the models' validators and construct plans before timing.
+        api_client.deserialize_data(dict(data, items=data["items"][:1]), response_type)
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            api_client.deserialize_data(data, response_type)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append(best)
+    print("{:<16} validated {:7.2f}s  trusted {:7.2f}s  speedup {:5.1f}x".format(
+        label, results[0], results[1], results[0] / results[1]))
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    for response_type, make in (
+        ("V1PodList", make_pod),
+        ("V1NodeList", make_node),
+        ("CoreV1EventList", make_event),
+    ):
+        data = {
+            "apiVersion": "v1",
+            "kind": response_type,
+            "metadata": {"resourceVersion": "1"},
+            "items": [make(i) for i in range(total)],
+        }
+        measure(response_type, response_type, data)
+
+
+if __name__ == '__main__':
+    main()
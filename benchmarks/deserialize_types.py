@@ -0,0 +1,103 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-value cost of ApiClient type-string dispatch.
+
+Compares the previous ``ApiClient.__deserialize``, which parsed the type
+string and resolved the class for every value, with the current one,
+which calls functions compiled once per type.  Models are built with
+``validate_responses=False`` so that dispatch is not hidden behind
+pydantic validation.
+
+Usage: python benchmarks/deserialize_types.py [repeat]
+"""
+
+import datetime
+import re
+import sys
+import time
+
+import kubernetes.client.models
+from kubernetes import client
+
+
+def previous_deserialize(api_client, data, klass):
+    if data is None:
+        return None
+
+    if isinstance(klass, str):
+        if klass.startswith('List['):
+            sub_kls = re.match(r'List\[(.*)]', klass).group(1)
+            return [previous_deserialize(api_client, sub_data, sub_kls)
+                    for sub_data in data]
+
+        if klass.startswith('Dict['):
+            sub_kls = re.match(r'Dict\[([^,]*), (.*)]', klass).group(2)
+            return {k: previous_deserialize(api_client, v, sub_kls)
+                    for k, v in data.items()}
+
+        if klass in api_client.NATIVE_TYPES_MAPPING:
+            klass = api_client.NATIVE_TYPES_MAPPING[klass]
+        else:
+            klass = getattr(kubernetes.client.models, klass)
+
+    if klass in api_client.PRIMITIVE_TYPES:
+        return api_client._ApiClient__deserialize_primitive(data, klass)
+    elif klass is object:
+        return data
+    elif klass is datetime.datetime:
+        return api_client._ApiClient__deserialize_datetime(data)
+    return api_client._ApiClient__deserialize_model(data, klass)
+
+
+CASES = (
+    ("Dict[str, str]",
+     {"label-{}".format(i): "value" for i in range(1000)}),
+    ("List[int]", list(range(1000))),
+    ("Dict[str, List[str]]",
+     {"key-{}".format(i): ["a", "b", "c"] for i in range(300)}),
+    ("List[V1OwnerReference]", [
+        {"apiVersion": "v1", "kind": "Pod", "name": "p{}".format(i), "uid": "u"}
+        for i in range(300)
+    ]),
+)
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    api_client = client.ApiClient(client.Configuration(validate_responses=False))
+    for response_type, data in CASES:
+        assert (previous_deserialize(api_client, data, response_type)
+                == api_client.deserialize_data(data, response_type))
+        before = best_of(
+            lambda: previous_deserialize(api_client, data, response_type), repeat)
+        after = best_of(
+            lambda: api_client.deserialize_data(data, response_type), repeat)
+        print("{:<24} previous {:6.3f}s  compiled {:6.3f}s  speedup {:5.1f}x".format(
+            response_type, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
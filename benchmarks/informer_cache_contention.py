@@ -0,0 +1,105 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ObjectCache read throughput with N reader threads and a hot writer.
+
+Compares a store whose reads take the writer lock and copy the live
+dict with the current ObjectCache, whose get_by_key() takes no lock and
+whose list() reads a snapshot rebuilt at most once per write.  The
+writer updates objects back to back for the whole run.
+
+Usage: python benchmarks/informer_cache_contention.py [objects] [seconds]
+"""
+
+import sys
+import threading
+import time
+
+from kubernetes.informer.cache import ObjectCache, _meta_namespace_key
+
+
+class LockedCache:
+
+    def __init__(self):
+        self._objects = {}
+        self._rlock = threading.RLock()
+
+    def _put(self, obj):
+        key = _meta_namespace_key(obj)
+        with self._rlock:
+            self._objects[key] = obj
+
+    def list(self):
+        with self._rlock:
+            return list(self._objects.values())
+
+    def get_by_key(self, key):
+        with self._rlock:
+            return self._objects.get(key)
+
+
+def make_pod(i):
+    return {"metadata": {"namespace": "default", "name": "pod-{}".format(i)}}
+
+
+def measure(cache, objects, readers, seconds, lists_per_get=10):
+    for i in range(objects):
+        cache._put(make_pod(i))
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0]
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            cache._put(make_pod(i % objects))
+            i += 1
+        writes[0] = i
+
+    def reader(n):
+        count = 0
+        while not stop.is_set():
+            for j in range(lists_per_get):
+                cache.get_by_key("default/pod-{}".format(j))
+            cache.list()
+            count += lists_per_get + 1
+        reads[n] = count
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader, args=(n,))
+                for n in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(reads) / seconds, writes[0] / seconds
+
+
+def main():
+    objects = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    stores = (("locked", LockedCache), ("ObjectCache", ObjectCache))
+    print("{:>8} {:>14} {:>12} {:>12}".format(
+        "readers", "store", "reads/s", "writes/s"))
+    for readers in (0, 1, 4, 8):
+        for label, store in stores:
+            reads, writes = measure(store(), objects, readers, seconds)
+            print("{:>8} {:>14} {:>12.0f} {:>12.0f}".format(
+                readers, label, reads, writes))
+
+
+if __name__ == '__main__':
+    main()
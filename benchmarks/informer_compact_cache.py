@@ -0,0 +1,85 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory held by an informer cache of models versus compact JSON bytes.
+
+Decodes synthetic pods into V1Pod models and stores them in an ObjectCache,
+once as models and once through a JsonCodec, then reports the memory the
+cache retains and the time to read every object back.
+
+Usage: python benchmarks/informer_compact_cache.py [objects]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from kubernetes import client
+from kubernetes.informer import JsonCodec, ObjectCache
+
+
+def make_pod(i):
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": "pod-{}".format(i),
+            "namespace": "default",
+            "resourceVersion": str(1000 + i),
+            "uid": "00000000-0000-0000-0000-{:012d}".format(i),
+            "labels": {"app": "bench", "tier": "backend"},
+        },
+        "spec": {
+            "nodeName": "node-{}".format(i % 50),
+            "containers": [{
+                "name": "app",
+                "image": "registry.example/app:1.0",
+                "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                "env": [{"name": "MODE", "value": "bench"}],
+            }],
+        },
+        "status": {"phase": "Running", "podIP": "10.0.0.1"},
+    }
+
+
+def measure(label, api_client, pods, codec):
+    gc.collect()
+    tracemalloc.start()
+    cache = ObjectCache(codec=codec)
+    # Decode one object at a time as a watch would, so the only models
+    # still alive at the end are those the cache keeps.
+    for pod in pods:
+        cache._put(api_client.deserialize_data(pod, "V1Pod"))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for key in cache.list_keys():
+        cache.get_by_key(key).status.phase
+    elapsed = time.perf_counter() - start
+    print("{:<8} {:>8} objects  cache {:8.1f} MiB  read all {:6.2f}s".format(
+        label, len(cache.list_keys()), current / 2**20, elapsed))
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    api_client = client.ApiClient()
+    pods = [make_pod(i) for i in range(total)]
+    measure("models", api_client, pods, None)
+    measure("compact", api_client, pods, JsonCodec(api_client, "V1Pod"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Peak memory of the SharedInformer initial LIST, unpaged and paged.
+
+Serves a synthetic pod list as JSON text and decodes it with ApiClient,
+either as one response or in pages of ``page_size`` objects, then fills
+an informer cache from it.  The cached models are the same in both modes;
+the difference is the response text and decoded JSON held at once.
+
+Usage: python benchmarks/informer_paged_list.py [objects] [page_size]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from kubernetes import client
+from kubernetes.informer import SharedInformer
+
+
+def make_pod(i):
+    return {
+        "metadata": {
+            "name": "pod-{}".format(i),
+            "namespace": "default",
+            "resourceVersion": str(1000 + i),
+            "labels": {"app": "bench"},
+        },
+        "spec": {
+            "nodeName": "node-{}".format(i % 50),
+            "containers": [{"name": "app", "image": "registry.example/app:1.0"}],
+        },
+        "status": {"phase": "Running"},
+    }
+
+
+def make_list_func(api_client, total):
+    def list_pods(limit=None, _continue=None, **kwargs):
+        start = int(_continue or 0)
+        end = total if not limit else min(total, start + limit)
+        metadata = {"resourceVersion": "1"}
+        if end < total:
+            metadata["continue"] = str(end)
+        body = json.dumps({
+            "apiVersion": "v1",
+            "kind": "PodList",
+            "metadata": metadata,
+            "items": [make_pod(i) for i in range(start, end)],
+        })
+        return api_client.deserialize(body, "V1PodList", "application/json")
+    return list_pods
+
+
+def measure(label, list_func, page_size):
+    informer = SharedInformer(list_func=list_func, page_size=page_size)
+    tracemalloc.start()
+    start = time.perf_counter()
+    informer._initial_list()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:<10} {:>8} objects {:8.1f}s  cache {:8.1f} MiB  peak {:8.1f} MiB".format(
+        label, len(informer.cache.list_keys()), elapsed,
+        current / 2**20, peak / 2**20))
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    list_func = make_list_func(client.ApiClient(), total)
+    measure("unpaged", list_func, None)
+    measure("paged", list_func, page_size)
+
+
+if __name__ == '__main__':
+    main()
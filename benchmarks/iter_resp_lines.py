@@ -0,0 +1,71 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Line framing cost of kubernetes.watch.watch.iter_resp_lines.
+
+Feeds single multi-megabyte segments of small lines through the previous
+copy-per-line framing and the current offset-based framing.  The current
+implementation should scale linearly with the segment size.
+
+Usage: python benchmarks/iter_resp_lines.py
+"""
+
+import time
+
+from kubernetes.watch.watch import iter_resp_lines
+
+
+class FakeResponse:
+
+    def __init__(self, segments):
+        self._segments = segments
+
+    def stream(self, amt=None, decode_content=False):
+        return iter(self._segments)
+
+
+def legacy_iter_resp_lines(resp):
+    buffer = bytearray()
+    for segment in resp.stream(amt=None, decode_content=False):
+        buffer.extend(segment)
+        next_newline = buffer.find(b'\n')
+        while next_newline != -1:
+            line = buffer[:next_newline].decode("utf-8", errors="replace")
+            buffer = buffer[next_newline+1:]
+            yield line
+            next_newline = buffer.find(b'\n')
+
+
+def measure(fn, segment):
+    start = time.perf_counter()
+    for _ in fn(FakeResponse([segment])):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    line = b'{"type": "MODIFIED", "object": {"metadata": {"name": "p"}}}\n'
+    print("{:>8} {:>10} {:>12} {:>12}".format(
+        "MiB", "lines", "before (s)", "after (s)"))
+    for mib in (1, 2, 4):
+        count = (mib << 20) // len(line)
+        segment = line * count
+        before = measure(legacy_iter_resp_lines, segment)
+        after = measure(iter_resp_lines, segment)
+        print("{:>8} {:>10} {:>12.3f} {:>12.3f}".format(
+            mib, count, before, after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cost of reading a few fields of every object in a large pod list.
+
+Decodes a V1PodList response and reads ``metadata.name`` and
+``status.phase`` of each pod, with validated, trusted
+(``validate_responses=False``) and lazy (``lazy_responses=True``) models.
+Reports the best time of three runs and the memory held by the result.
+
+Usage: python benchmarks/lazy_models.py [objects]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from kubernetes import client
+
+from deserialize_lists import make_pod
+
+MODES = (
+    ("validated", {}),
+    ("trusted", {"validate_responses": False}),
+    ("lazy", {"lazy_responses": True}),
+)
+
+
+def inventory(api_client, body):
+    pods = api_client.deserialize_data(json.loads(body), "V1PodList")
+    summary = [(pod.metadata.name, pod.status.phase) for pod in pods.items]
+    return pods, summary
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    body = json.dumps({
+        "apiVersion": "v1",
+        "kind": "PodList",
+        "metadata": {"resourceVersion": "1"},
+        "items": [make_pod(i) for i in range(total)],
+    })
+    for label, options in MODES:
+        api_client = client.ApiClient(client.Configuration(**options))
+        inventory(api_client, body)
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            inventory(api_client, body)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        tracemalloc.start()
+        pods, _ = inventory(api_client, body)
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del pods
+        print("{:<10} {:7.2f}s {:8.1f} MiB".format(label, best, held / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Request body encoding time for large models.
+
+Compares the previous path, ``sanitize_for_serialization`` followed by
+``json.dumps``, with ``ApiClient.serialize_body``, which has pydantic write
+the JSON bytes in one pass.
+
+Usage: python benchmarks/serialize_body.py [keys]
+"""
+
+import json
+import sys
+import time
+
+from kubernetes import client
+
+from deserialize_lists import make_pod
+
+
+def best_of(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    keys = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    api_client = client.ApiClient()
+    bodies = (
+        ("V1ConfigMap", {
+            "metadata": {"name": "big", "namespace": "default"},
+            "data": {"key-{}".format(i): "value " * 10 for i in range(keys)},
+        }),
+        ("V1PodList", {
+            "metadata": {},
+            "items": [make_pod(i) for i in range(keys // 20)],
+        }),
+    )
+    for response_type, data in bodies:
+        model = api_client.deserialize_data(data, response_type)
+        before = best_of(
+            lambda: json.dumps(api_client.sanitize_for_serialization(model)))
+        after = best_of(lambda: api_client.serialize_body(model))
+        print("{:<12} previous {:6.3f}s  direct {:6.3f}s  speedup {:5.1f}x".format(
+            response_type, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
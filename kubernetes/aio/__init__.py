@@ -19,8 +19,9 @@ __version__ = "36.0.0+snapshot"
 import kubernetes.aio.client as client
 import kubernetes.aio.config as config
 import kubernetes.aio.dynamic as dynamic
+import kubernetes.aio.informer as informer
 import kubernetes.aio.stream as stream
 import kubernetes.aio.utils as utils
 import kubernetes.aio.watch as watch
 
-__all__ = ["client", "config", "dynamic", "stream", "utils", "watch"]
+__all__ = ["client", "config", "dynamic", "informer", "stream", "utils", "watch"]
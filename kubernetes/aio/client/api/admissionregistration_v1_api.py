@@ -11,7 +11,7 @@
 
 
 import warnings
-from pydantic import BaseModel, validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import BaseModel, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -34,7 +34,7 @@ from kubernetes.aio.client.models.v1_validating_admission_policy_list import V1V
 from kubernetes.aio.client.models.v1_validating_webhook_configuration import V1ValidatingWebhookConfiguration
 from kubernetes.aio.client.models.v1_validating_webhook_configuration_list import V1ValidatingWebhookConfigurationList
 
-from kubernetes.aio.client.api_client import ApiClient, RequestSerialized
+from kubernetes.aio.client.api_client import ApiClient, RequestSerialized, validate_call
 from kubernetes.aio.client.api_response import ApiResponse
 from kubernetes.aio.client.rest import RESTResponseType
 
@@ -11,7 +11,7 @@
 
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -22,7 +22,7 @@ from kubernetes.aio.client.models.v1_api_resource_list import V1APIResourceList
 from kubernetes.aio.client.models.v1_self_subject_review import V1SelfSubjectReview
 from kubernetes.aio.client.models.v1_token_review import V1TokenReview
 
-from kubernetes.aio.client.api_client import ApiClient, RequestSerialized
+from kubernetes.aio.client.api_client import ApiClient, RequestSerialized, validate_call
 from kubernetes.aio.client.api_response import ApiResponse
 from kubernetes.aio.client.rest import RESTResponseType
 
@@ -11,7 +11,7 @@
 
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -24,7 +24,7 @@ from kubernetes.aio.client.models.v1_self_subject_access_review import V1SelfSub
 from kubernetes.aio.client.models.v1_self_subject_rules_review import V1SelfSubjectRulesReview
 from kubernetes.aio.client.models.v1_subject_access_review import V1SubjectAccessReview
 
-from kubernetes.aio.client.api_client import ApiClient, RequestSerialized
+from kubernetes.aio.client.api_client import ApiClient, RequestSerialized, validate_call
 from kubernetes.aio.client.api_response import ApiResponse
 from kubernetes.aio.client.rest import RESTResponseType
 
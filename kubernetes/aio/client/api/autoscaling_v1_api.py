@@ -11,7 +11,7 @@
 
 
 import warnings
-from pydantic import BaseModel, validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import BaseModel, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -24,7 +24,7 @@ from kubernetes.aio.client.models.v1_horizontal_pod_autoscaler import V1Horizont
 from kubernetes.aio.client.models.v1_horizontal_pod_autoscaler_list import V1HorizontalPodAutoscalerList
 from kubernetes.aio.client.models.v1_status import V1Status
 
-from kubernetes.aio.client.api_client import ApiClient, RequestSerialized
+from kubernetes.aio.client.api_client import ApiClient, RequestSerialized, validate_call
 from kubernetes.aio.client.api_response import ApiResponse
 from kubernetes.aio.client.rest import RESTResponseType
 
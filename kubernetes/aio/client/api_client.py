@@ -15,16 +15,19 @@ import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
 import os
 import re
 import tempfile
 import uuid
+from threading import RLock
 
 from urllib.parse import quote
 from typing import Tuple, Optional, List, Dict, Union, Any
-from pydantic import SecretStr
+import pydantic
+from pydantic import BaseModel, SecretStr
 
 from kubernetes.aio.client.configuration import Configuration
 from kubernetes.aio.client.api_response import ApiResponse, T as ApiResponseT
@@ -43,6 +46,226 @@ from kubernetes.aio.client.exceptions import (
 
 _OPENAPI_GENERATOR_TO_DICT = "_openapi_generator_to_dict"
 
+# How __construct_model converts a field value taken from wire data.
+_KEEP, _COPY, _DATETIME, _MODEL, _MODEL_LIST, _DESERIALIZE = range(6)
+# bytes fields hold the base64 text from the wire, as validated models do.
+_KEPT_TYPES = frozenset(['str', 'bytes', 'bool', 'int', 'object'])
+_COPIED_TYPES = frozenset(
+    container.format(kind)
+    for container in ('List[{}]', 'Dict[str, {}]')
+    for kind in _KEPT_TYPES
+)
+
+# model class -> (all fields set to None,
+#                 {wire name: (field name, conversion, openapi type or model)})
+_CONSTRUCT_PLANS: Dict[type, Tuple[Dict[str, None], Dict[str, Tuple[str, int, Any]]]] = {}
+
+# type string or class -> function (api_client, data) deserializing data of
+# that type, built by ApiClient.__compile_deserializer
+_DESERIALIZERS: Dict[Any, Any] = {}
+
+
+def _model_class(name):
+    """Return the generated model class called name, or None."""
+    klass = getattr(kubernetes.aio.client.models, name, None)
+    if isinstance(klass, type) and hasattr(klass, 'model_fields'):
+        return klass
+    return None
+
+
+def _construct_plan(klass):
+    """Return how to read the fields of a model class from wire data."""
+    plan = _CONSTRUCT_PLANS.get(klass)
+    if plan is None:
+        openapi_types = getattr(klass, "openapi_types", {})
+        attribute_map = getattr(klass, "attribute_map", {})
+        fields = {}
+        for field_name, field in klass.model_fields.items():
+            # openapi_types and attribute_map use the public name, which
+            # is the alias of fields stored under another name.
+            public_name = field.alias or field_name
+            field_type = openapi_types.get(public_name)
+            if field_type is None or field_type in _KEPT_TYPES:
+                conversion = _KEEP
+            elif field_type in _COPIED_TYPES:
+                conversion = _COPY
+            elif field_type == 'datetime':
+                conversion = _DATETIME
+            elif _model_class(field_type) is not None:
+                conversion, field_type = _MODEL, _model_class(field_type)
+            elif (field_type.startswith('List[')
+                    and _model_class(field_type[5:-1]) is not None):
+                conversion, field_type = _MODEL_LIST, _model_class(field_type[5:-1])
+            else:
+                conversion = _DESERIALIZE
+            fields[attribute_map.get(public_name, public_name)] = (
+                field_name, conversion, field_type)
+        empty = dict.fromkeys(klass.model_fields)
+        plan = _CONSTRUCT_PLANS[klass] = (empty, fields)
+    return plan
+
+
+def _new_model(klass, fields):
+    """Create a model instance holding fields without running pydantic."""
+    if klass.__private_attributes__ or klass.__pydantic_post_init__:
+        return klass.model_construct(**fields)
+    # Equivalent to model_construct when every field is given.
+    obj = object.__new__(klass)
+    object.__setattr__(obj, '__dict__', fields)
+    object.__setattr__(obj, '__pydantic_fields_set__', set(fields))
+    object.__setattr__(obj, '__pydantic_extra__', None)
+    object.__setattr__(obj, '__pydantic_private__', None)
+    return obj
+
+
+# model class -> subclass of it used by lazily built models, or None
+_LAZY_CLASSES: Dict[type, Optional[type]] = {}
+_LAZY_LOCK = RLock()
+_MISSING = object()
+
+
+def _lazy_pending(obj):
+    """Return the unconverted fields of a lazily built model, or None."""
+    try:
+        return object.__getattribute__(obj, '_lazy_state')[1]
+    except AttributeError:
+        return None
+
+
+def _restore_model(klass, state):
+    """Unpickle a lazily built model as an instance of its generated class."""
+    obj = klass.__new__(klass)
+    obj.__setstate__(state)
+    return obj
+
+
+def _load_lazy_fields(obj, deep=False):
+    """Convert the pending fields of obj, and with deep of nested models."""
+    pending = _lazy_pending(obj)
+    if pending is not None:
+        with _LAZY_LOCK:
+            for name in list(pending):
+                getattr(obj, name)
+            # Fields were added to __dict__ as they were read; restore the
+            # declaration order that serialization follows.
+            fields = obj.__dict__
+            ordered = {name: fields[name] for name in type(obj).model_fields}
+            fields.clear()
+            fields.update(ordered)
+            object.__setattr__(obj, '_lazy_state', (None, None))
+    if deep and isinstance(obj, _LazyModel):
+        for value in obj.__dict__.values():
+            if isinstance(value, list):
+                for item in value:
+                    _load_lazy_fields(item, deep)
+            elif isinstance(value, dict):
+                for item in value.values():
+                    _load_lazy_fields(item, deep)
+            else:
+                _load_lazy_fields(value, deep)
+
+
+class _LazyModel:
+    """Base of the model subclasses built by ``lazy_responses``.
+
+    Fields not converted yet are missing from ``__dict__`` and are kept in
+    the ``_lazy_state`` slot as a ``(convert, pending)`` pair, pending
+    mapping field names to wire values.  Reading one converts it with
+    ``convert(value, conversion, field_type)``; methods that read
+    ``__dict__`` directly convert the fields they need first.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            convert, pending = object.__getattribute__(self, '_lazy_state')
+        except AttributeError:
+            pending = None
+        if pending is not None:
+            with _LAZY_LOCK:
+                fields = self.__dict__
+                value = pending.get(name, _MISSING)
+                if value is not _MISSING:
+                    conversion, field_type = type(self).__lazy_conversions__[name]
+                    fields[name] = convert(value, conversion, field_type)
+                    del pending[name]
+                if name in fields:
+                    return fields[name]
+        return super().__getattr__(name)
+
+    def __setattr__(self, name, value):
+        self.__discard_pending(name)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        self.__discard_pending(name)
+        super().__delattr__(name)
+
+    def __discard_pending(self, name):
+        pending = _lazy_pending(self)
+        if pending is not None:
+            with _LAZY_LOCK:
+                if pending.pop(name, _MISSING) is not _MISSING:
+                    self.__dict__[name] = None
+
+    def __iter__(self):
+        _load_lazy_fields(self)
+        return super().__iter__()
+
+    def __repr_args__(self):
+        _load_lazy_fields(self)
+        return super().__repr_args__()
+
+    def __copy__(self):
+        _load_lazy_fields(self)
+        return super().__copy__()
+
+    def __deepcopy__(self, memo=None):
+        _load_lazy_fields(self)
+        return super().__deepcopy__(memo)
+
+    def __reduce_ex__(self, protocol):
+        # Pickle as the generated class, which can be imported.
+        _load_lazy_fields(self)
+        return _restore_model, (type(self).__lazy_base__, self.__getstate__())
+
+    def model_dump(self, *args, **kwargs):
+        _load_lazy_fields(self, deep=True)
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args, **kwargs):
+        _load_lazy_fields(self, deep=True)
+        return super().model_dump_json(*args, **kwargs)
+
+
+def _lazy_class(klass):
+    """Return the lazily built subclass of a model class.
+
+    Returns None for classes that need model_construct, whose defaults
+    would fill in the pending fields.
+    """
+    try:
+        return _LAZY_CLASSES[klass]
+    except KeyError:
+        pass
+    lazy = None
+    if not (klass.__private_attributes__ or klass.__pydantic_post_init__):
+        conversions = {
+            field_name: (conversion, field_type)
+            for field_name, conversion, field_type
+            in _construct_plan(klass)[1].values()
+        }
+        lazy = type(klass)(klass.__name__, (_LazyModel, klass), {
+            '__module__': klass.__module__,
+            '__qualname__': klass.__qualname__,
+            '__slots__': ('_lazy_state',),
+            '__lazy_base__': klass,
+            '__lazy_conversions__': conversions,
+        })
+    _LAZY_CLASSES[klass] = lazy
+    return lazy
+
 
 def _get_openapi_to_dict(value: Any) -> Any:
     # Reciprocal function references preserve inherited generated methods
@@ -71,6 +294,25 @@ def _get_openapi_to_dict(value: Any) -> Any:
     return openapi_to_dict
 
 
+def validate_call(*, config=None):
+    """Decorates a generated API method like ``pydantic.validate_call``.
+
+    Arguments are validated unless the configuration of the method's
+    ApiClient has ``validate_arguments`` set to False, in which case the
+    method runs with its arguments as given.
+    """
+    def decorate(function):
+        validated = pydantic.validate_call(config=config)(function)
+
+        @functools.wraps(function)
+        async def method(self, *args, **kwargs):
+            if self.api_client.configuration.validate_arguments:
+                return await validated(self, *args, **kwargs)
+            return await function(self, *args, **kwargs)
+        return method
+    return decorate
+
+
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
 class ApiClient:
@@ -258,7 +500,7 @@ class ApiClient:
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            body = self.serialize_body(body)
 
         # request url
         if _host is None or self.configuration.ignore_operation_servers:
@@ -371,6 +613,22 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    def serialize_body(self, body):
+        """Serializes a request body.
+
+        Generated models are written straight to JSON bytes by pydantic in
+        a single pass.  The document is the one ``sanitize_for_serialization``
+        and ``json_dumps`` produce, apart from formatting: UTC times end in
+        ``Z`` and non-ASCII text is not escaped.  Other bodies are sanitized
+        for the REST client to encode.
+
+        :param body: The request body.
+        :return: bytes for generated models, else the sanitized body.
+        """
+        if isinstance(body, BaseModel) and _get_openapi_to_dict(body) is not None:
+            return body.model_dump_json(by_alias=True, exclude_none=True).encode('utf-8')
+        return self.sanitize_for_serialization(body)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -446,14 +704,14 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = self.configuration.json_loads(response_text)
             except ValueError:
                 data = response_text
         elif re.match(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
             if response_text == "":
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = self.configuration.json_loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -464,6 +722,21 @@ class ApiClient:
 
         return self.__deserialize(data, response_type)
 
+    def deserialize_data(self, data, response_type: str):
+        """Deserializes already decoded JSON data into an object.
+
+        Unlike `deserialize`, no text is parsed: callers that already hold
+        the decoded document (e.g. watch events) skip a redundant
+        dumps/loads round trip.
+
+        :param data: dict, list or primitive decoded from JSON.
+        :param response_type: class literal for
+            deserialized object, or string of class name.
+
+        :return: deserialized object.
+        """
+        return self.__deserialize(data, response_type)
+
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
 
@@ -474,21 +747,50 @@ class ApiClient:
         """
         if data is None:
             return None
+        return self.__deserializer(klass)(self, data)
+
+    def __deserializer(self, klass):
+        """Returns the cached deserializing function for klass.
+
+        :param klass: class literal, or string of class name.
+        :return: function (api_client, data) -> object.
+        """
+        try:
+            return _DESERIALIZERS[klass]
+        except KeyError:
+            deserialize = _DESERIALIZERS[klass] = self.__compile_deserializer(klass)
+            return deserialize
+
+    def __compile_deserializer(self, klass):
+        """Builds a function deserializing data of type klass.
 
+        Type strings are parsed and class names resolved here, once per
+        type, so the function only dispatches on the data.
+
+        :param klass: class literal, or string of class name.
+        :return: function (api_client, data) -> object.
+        """
         if isinstance(klass, str):
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                deserialize_item = self.__deserializer(m.group(1))
+
+                def deserialize_list(api_client, data):
+                    return [None if sub_data is None
+                            else deserialize_item(api_client, sub_data)
+                            for sub_data in data]
+                return deserialize_list
 
             if klass.startswith('Dict['):
                 m = re.match(r'Dict\[([^,]*), (.*)]', klass)
                 assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                deserialize_value = self.__deserializer(m.group(2))
+
+                def deserialize_dict(api_client, data):
+                    return {k: None if v is None else deserialize_value(api_client, v)
+                            for k, v in data.items()}
+                return deserialize_dict
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -497,21 +799,25 @@ class ApiClient:
                 klass = getattr(kubernetes.aio.client.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            def deserialize_primitive(api_client, data):
+                if data.__class__ is klass:
+                    return data
+                return api_client.__deserialize_primitive(data, klass)
+            return deserialize_primitive
         elif klass is object:
-            return self.__deserialize_object(data)
+            return ApiClient.__deserialize_object
         elif klass is datetime.date:
-            return self.__deserialize_date(data)
+            return ApiClient.__deserialize_date
         elif klass is datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return ApiClient.__deserialize_datetime
         elif klass is decimal.Decimal:
-            return decimal.Decimal(data)
+            return lambda api_client, data: decimal.Decimal(data)
         elif klass is uuid.UUID:
-            return uuid.UUID(data)
+            return lambda api_client, data: uuid.UUID(data)
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            return lambda api_client, data: api_client.__deserialize_enum(data, klass)
         else:
-            return self.__deserialize_model(data, klass)
+            return lambda api_client, data: api_client.__deserialize_model(data, klass)
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -848,5 +1154,103 @@ class ApiClient:
         :param klass: class literal.
         :return: model object.
         """
-
+        if isinstance(data, dict):
+            if self.configuration.lazy_responses:
+                return self.__construct_lazy_model(data, klass)
+            if not self.configuration.validate_responses:
+                return self.__construct_model(data, klass)
         return klass.from_dict(data)
+
+    def __construct_model(self, data, klass):
+        """Builds a model from trusted data without pydantic validation.
+
+        Fields are converted by their openapi type as ``from_dict`` would,
+        but values of JSON types are not checked.
+
+        :param data: dict.
+        :param klass: class literal.
+        :return: model object.
+        """
+        empty, wire_fields = _construct_plan(klass)
+        fields = empty.copy()
+        for wire_name, value in data.items():
+            field = wire_fields.get(wire_name)
+            if field is None or value is None:
+                continue
+            field_name, conversion, field_type = field
+            if conversion == _MODEL:
+                value = self.__construct_model(value, field_type)
+            elif conversion == _MODEL_LIST:
+                value = [self.__construct_model(item, field_type) for item in value]
+            elif conversion == _COPY:
+                value = value.copy()
+            elif conversion == _DATETIME:
+                value = self.__construct_datetime(value)
+            elif conversion == _DESERIALIZE:
+                value = self.__deserialize(value, field_type)
+            fields[field_name] = value
+        return _new_model(klass, fields)
+
+    def __construct_lazy_model(self, data, klass):
+        """Builds a model whose nested values are converted on first access.
+
+        Fields holding JSON scalars are set right away; the others are
+        converted by :meth:`__construct_lazy_field` when first read.
+
+        :param data: dict.
+        :param klass: class literal.
+        :return: model object.
+        """
+        lazy = _lazy_class(klass)
+        if lazy is None:
+            return self.__construct_model(data, klass)
+        empty, wire_fields = _construct_plan(klass)
+        fields = empty.copy()
+        pending = {}
+        for wire_name, value in data.items():
+            field = wire_fields.get(wire_name)
+            if field is None or value is None:
+                continue
+            field_name, conversion, field_type = field
+            if conversion == _KEEP:
+                fields[field_name] = value
+            else:
+                pending[field_name] = value
+        if not pending:
+            return _new_model(klass, fields)
+        obj = _new_model(lazy, fields)
+        for field_name in pending:
+            del fields[field_name]
+        object.__setattr__(obj, '_lazy_state', (self.__construct_lazy_field, pending))
+        return obj
+
+    def __construct_lazy_field(self, value, conversion, field_type):
+        """Converts a field value of a lazily built model.
+
+        :param value: wire value.
+        :param conversion: how __construct_model would convert it.
+        :param field_type: openapi type or model class.
+        :return: field value.
+        """
+        if conversion == _MODEL:
+            return self.__construct_lazy_model(value, field_type)
+        if conversion == _MODEL_LIST:
+            return [self.__construct_lazy_model(item, field_type) for item in value]
+        if conversion == _COPY:
+            return value.copy()
+        if conversion == _DATETIME:
+            return self.__construct_datetime(value)
+        return self.__deserialize(value, field_type)
+
+    def __construct_datetime(self, string):
+        """Parses an RFC 3339 timestamp, falling back to dateutil.
+
+        :param string: str.
+        :return: datetime.
+        """
+        try:
+            if string.endswith('Z'):
+                string = string[:-1] + '+00:00'
+            return datetime.datetime.fromisoformat(string)
+        except (TypeError, ValueError):
+            return self.__deserialize_datetime(string)
@@ -15,6 +15,7 @@ import aiohttp
 import aiohttp_retry
 import base64
 import copy
+import json
 import http.client as httplib
 import logging
 from logging import FileHandler
@@ -32,6 +33,23 @@ JSON_SCHEMA_VALIDATION_KEYWORDS = {
 
 ServerVariablesT = Dict[str, str]
 
+JSON_BACKENDS = ('json', 'orjson', 'msgspec')
+
+
+def _json_codec(backend: str) -> Any:
+    """Return the (loads, dumps) pair of a named JSON backend."""
+    if backend == 'json':
+        return json.loads, json.dumps
+    if backend == 'orjson':
+        import orjson
+        return orjson.loads, orjson.dumps
+    if backend == 'msgspec':
+        import msgspec.json
+        return msgspec.json.decode, msgspec.json.encode
+    raise ValueError(
+        "Unknown JSON backend {!r}. Use one of: {}".format(
+            backend, ", ".join(JSON_BACKENDS)))
+
 GenericAuthSetting = TypedDict(
     "GenericAuthSetting",
     {
@@ -186,6 +204,20 @@ class Configuration:
     :param socket_options: Options to pass down to the underlying urllib3 socket.
     :param datetime_format: Datetime format string for serialization.
     :param date_format: Date format string for serialization.
+    :param json_backend: JSON codec used for request and response bodies,
+      watch events and the dynamic client: "json" (default), "orjson" or
+      "msgspec". The latter two must be installed separately.
+    :param validate_responses: Validate deserialized response models with
+      pydantic. Default True. When False, models are built from the
+      response without validation, which is much faster for large lists
+      but trusts the API server to send well-formed objects.
+    :param lazy_responses: Build response models lazily. Default False.
+      Nested models, lists and timestamps are converted from the response
+      on first attribute access, so reading a few fields of each object
+      skips decoding the rest. Implies validate_responses=False.
+    :param validate_arguments: Validate the arguments of generated API
+      methods with pydantic. Default True. When False, calls skip argument
+      validation and pass their arguments through as given.
 
     :Example:
 
@@ -245,6 +277,10 @@ conf = client.Configuration(
         date_format: str="%Y-%m-%d",
         *,
         debug: Optional[bool] = None,
+        json_backend: str='json',
+        validate_responses: bool=True,
+        lazy_responses: bool=False,
+        validate_arguments: bool=True,
     ) -> None:
         """Constructor
         """
@@ -397,6 +433,26 @@ conf = client.Configuration(
         """date format
         """
 
+        self.json_backend = json_backend
+        """JSON backend; sets ``json_loads`` (decodes str or bytes) and
+           ``json_dumps`` (encodes a request body to str or bytes). Either
+           callable may also be assigned directly.
+        """
+
+        self.validate_responses = validate_responses
+        """Validate deserialized response models; False builds them
+           without pydantic validation.
+        """
+
+        self.lazy_responses = lazy_responses
+        """Build response models lazily, converting fields on first access.
+        """
+
+        self.validate_arguments = validate_arguments
+        """Validate the arguments of generated API methods; False skips
+           pydantic validation of each call.
+        """
+
     def __deepcopy__(self, memo:  Dict[int, Any]) -> Self:
         cls = self.__class__
         result = cls.__new__(cls)
@@ -524,6 +580,25 @@ conf = client.Configuration(
             # turn off httplib debug
             httplib.HTTPConnection.debuglevel = 0
 
+    @property
+    def json_backend(self) -> str:
+        """Name of the JSON backend behind json_loads and json_dumps.
+
+        :param value: One of "json", "orjson" or "msgspec".
+        :type: str
+        """
+        return self.__json_backend
+
+    @json_backend.setter
+    def json_backend(self, value: str) -> None:
+        """Name of the JSON backend behind json_loads and json_dumps.
+
+        :param value: One of "json", "orjson" or "msgspec".
+        :type: str
+        """
+        self.json_loads, self.json_dumps = _json_codec(value)
+        self.__json_backend = value
+
     @property
     def logger_format(self) -> str:
         """The logger format.
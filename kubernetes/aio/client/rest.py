@@ -240,10 +240,11 @@ class RESTClientObject:
                 re.search('json', headers['Content-Type'], re.IGNORECASE)
                 or headers['Content-Type'] == 'application/apply-patch+yaml'
             ):
-                if body is not None:
-                    body = json.dumps(body)
+                # Bytes were already encoded by ApiClient.serialize_body.
+                if body is not None and not isinstance(body, bytes):
+                    body = self.configuration.json_dumps(body)
                 if body is None and post_params:
-                    body = json.dumps(dict(post_params))
+                    body = self.configuration.json_dumps(dict(post_params))
                 args["data"] = body
             elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
                 args["data"] = aiohttp.FormData(post_params)
@@ -55,11 +55,12 @@ def meta_request(func):
         except ApiException as e:
             raise api_exception(e)
         if serialize_response:
+            loads = self.client.configuration.json_loads
             try:
-                data = await resp.json()
+                data = await resp.json(loads=loads)
                 return serializer(self, data)
             except ValueError:
-                data = await resp.json()
+                data = await resp.json(loads=loads)
                 return data
         return resp
 
@@ -0,0 +1,34 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from kubernetes.informer.cache import (
+    NAMESPACE_INDEX,
+    ObjectCache,
+    _meta_namespace_key,
+    meta_namespace_index_func,
+)
+from .informer import SharedInformer, ADDED, MODIFIED, DELETED, BOOKMARK, ERROR
+
+__all__ = [
+    "ObjectCache",
+    "_meta_namespace_key",
+    "NAMESPACE_INDEX",
+    "meta_namespace_index_func",
+    "SharedInformer",
+    "ADDED",
+    "MODIFIED",
+    "DELETED",
+    "BOOKMARK",
+    "ERROR",
+]
@@ -0,0 +1,330 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""asyncio informer implementation for the Kubernetes Python client.
+
+Provides SharedInformer: a background task that keeps a local
+ObjectCache in sync with the Kubernetes API server and notifies
+registered event handlers, which may be coroutine functions.
+"""
+
+import asyncio
+import inspect
+import logging
+
+from kubernetes.aio.client.exceptions import ApiException
+from kubernetes.aio.watch import Watch
+from kubernetes.informer.cache import ObjectCache
+from kubernetes.informer.predicates import resource_version_changed
+
+logger = logging.getLogger(__name__)
+
+
+# Event types emitted to registered handlers
+ADDED = "ADDED"
+MODIFIED = "MODIFIED"
+DELETED = "DELETED"
+BOOKMARK = "BOOKMARK"
+ERROR = "ERROR"
+
+# Seconds to wait before retrying a failed list.
+_LIST_RETRY_DELAY = 5
+
+
+class SharedInformer:
+    """Watch a Kubernetes resource and maintain a local cache on asyncio.
+
+    The asyncio counterpart of :class:`kubernetes.informer.SharedInformer`.
+    Each informer runs as a single task on the event loop instead of a
+    thread, so one loop can serve many informers.  On each event the local
+    :class:`ObjectCache` is updated and the registered handlers are
+    called in order; coroutine handlers are awaited.
+
+    Parameters
+    ----------
+    list_func:
+        Bound ``kubernetes.aio`` API method used for the initial list
+        **and** as the watch source (e.g. CoreV1Api().list_namespaced_pod).
+    namespace:
+        Kubernetes namespace to watch.  Pass None for cluster-scoped
+        or all-namespace list functions.
+    resync_period:
+        How often (seconds) to perform a full re-list from the API server.
+        Defaults to 0 which disables periodic resyncs.
+    label_selector:
+        Optional label selector string forwarded to the API server.
+    field_selector:
+        Optional field selector string forwarded to the API server.
+    key_func:
+        Optional callable (obj) -> str used to key objects in the
+        cache.  Defaults to namespace/name.
+    indexers:
+        Optional mapping of index name to callable (obj) -> list of str
+        registered as secondary indexes on the cache.
+    resync_from_cache:
+        When True, a periodic resync replays the cached objects to the
+        MODIFIED handlers instead of re-listing, so it makes no API call.
+    """
+
+    def __init__(
+        self,
+        list_func,
+        namespace=None,
+        resync_period=0,
+        label_selector=None,
+        field_selector=None,
+        key_func=None,
+        indexers=None,
+        resync_from_cache=False,
+    ):
+        self._list_func = list_func
+        self._namespace = namespace
+        self._resync_period = resync_period
+        self._label_selector = label_selector
+        self._field_selector = field_selector
+        self._resync_from_cache = resync_from_cache
+
+        self._cache = ObjectCache(key_func=key_func, indexers=indexers)
+        self._handlers = {ADDED: [], MODIFIED: [], DELETED: [], BOOKMARK: [], ERROR: []}
+
+        # One Watch serves every reconnect; it borrows the ApiClient of
+        # list_func rather than building its own.
+        self._watch = Watch()
+        self._task = None
+        self._resource_version = None  # most recent RV seen; None forces a full re-list
+        self._synced = asyncio.Event()
+
+    # ---------------------------------------------------------------- #
+    # Public API                                                        #
+    # ---------------------------------------------------------------- #
+
+    @property
+    def cache(self):
+        """The :class:`ObjectCache` maintained by this informer."""
+        return self._cache
+
+    def add_event_handler(self, event_type, handler):
+        """Register a callback for a specific event type.
+
+        Parameters
+        ----------
+        event_type:
+            One of :data:`ADDED`, :data:`MODIFIED`, :data:`DELETED`,
+            :data:`BOOKMARK` or :data:`ERROR`.
+        handler:
+            Callable or coroutine function invoked with the event object (or
+            the raw exception for ERROR events).  Handlers run on the
+            informer task; a slow handler delays the following events.
+        """
+        if event_type not in self._handlers:
+            raise ValueError(
+                "Unknown event_type {!r}. Use one of: {}".format(
+                    event_type, ", ".join(sorted(self._handlers)),
+                )
+            )
+        self._handlers[event_type].append(handler)
+
+    def remove_event_handler(self, event_type, handler):
+        """Deregister a previously registered *handler*.
+
+        No-op if *handler* is not registered.
+        """
+        try:
+            self._handlers[event_type].remove(handler)
+        except (KeyError, ValueError):
+            pass
+
+    def has_synced(self):
+        """Return True once the initial list has completed."""
+        return self._synced.is_set()
+
+    async def wait_for_sync(self, timeout=None):
+        """Wait until :meth:`has_synced` is True or *timeout* seconds pass.
+
+        Returns the value of :meth:`has_synced`.
+        """
+        try:
+            await asyncio.wait_for(self._synced.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.has_synced()
+
+    def start(self):
+        """Start the watch loop as a task on the running event loop.
+
+        Calling :meth:`start` more than once without an intervening
+        :meth:`stop` is a no-op.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.ensure_future(self._run_loop())
+
+    async def stop(self):
+        """Cancel the watch loop task and wait for it to finish."""
+        self._watch.stop()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    # ---------------------------------------------------------------- #
+    # Internal helpers                                                  #
+    # ---------------------------------------------------------------- #
+
+    def _build_kwargs(self):
+        kw = {}
+        if self._namespace is not None:
+            kw["namespace"] = self._namespace
+        if self._label_selector is not None:
+            kw["label_selector"] = self._label_selector
+        if self._field_selector is not None:
+            kw["field_selector"] = self._field_selector
+        return kw
+
+    async def _fire(self, event_type, obj):
+        """Call every registered handler for *event_type* with *obj*.
+
+        Handlers run sequentially and awaitable results are awaited.  Any
+        exception raised by an individual handler is logged and swallowed
+        so that remaining handlers still run.
+        """
+        for fn in list(self._handlers.get(event_type, [])):
+            try:
+                result = fn(obj)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception(
+                    "Exception in informer handler for %s", event_type
+                )
+
+    async def _fire_modified(self, old, new):
+        """Fire MODIFIED unless *new* has the same resourceVersion as *old*."""
+        if resource_version_changed(old, new):
+            await self._fire(MODIFIED, new)
+
+    async def _initial_list(self):
+        """List all objects and populate the cache, firing ADDED/MODIFIED/DELETED events.
+
+        On subsequent calls (resync or after a 410 Gone) the new list is
+        diffed against the existing cache as in the threaded informer.
+        """
+        resp = await self._list_func(**self._build_kwargs())
+        items = getattr(resp, "items", []) or []
+
+        new_items_map = {self._cache._key_func(item): item for item in items}
+        old_objects = self._cache.snapshot()
+
+        for key, old_obj in old_objects.items():
+            if key not in new_items_map:
+                await self._fire(DELETED, old_obj)
+
+        self._cache._replace_all(items)
+
+        for key, item in new_items_map.items():
+            if key in old_objects:
+                await self._fire_modified(old_objects[key], item)
+            else:
+                await self._fire(ADDED, item)
+
+        rv = None
+        meta = getattr(resp, "metadata", None)
+        if meta is not None:
+            rv = getattr(meta, "resource_version", None)
+        self._resource_version = rv or "0"
+        self._synced.set()
+
+    async def _replay_cache(self):
+        """Fire MODIFIED for every cached object without calling the API server."""
+        for obj in self._cache.list():
+            await self._fire(MODIFIED, obj)
+
+    async def _watch_once(self):
+        """Open one watch from the stored resource version and apply its events."""
+        kw = self._build_kwargs()
+        kw["resource_version"] = self._resource_version
+        kw["allow_watch_bookmarks"] = True
+        # As in the threaded informer, a server-side timeout ends the watch
+        # so that a quiet resource still gets its periodic resync.
+        if self._resync_period > 0:
+            kw["timeout_seconds"] = max(1, int(self._resync_period))
+        async with self._watch as watch:
+            async for event in watch.stream(self._list_func, **kw):
+                evt_type = event.get("type")
+                obj = event.get("object")
+                if watch.resource_version:
+                    self._resource_version = watch.resource_version
+                if evt_type == ADDED:
+                    self._cache._put(obj)
+                    await self._fire(ADDED, obj)
+                elif evt_type == MODIFIED:
+                    old_obj = self._cache.get(obj)
+                    self._cache._put(obj)
+                    await self._fire_modified(old_obj, obj)
+                elif evt_type == DELETED:
+                    self._cache._remove(obj)
+                    await self._fire(DELETED, obj)
+                elif evt_type == BOOKMARK:
+                    await self._fire(BOOKMARK, event.get("raw_object", obj))
+
+    async def _run_loop(self):
+        """Background loop: list then watch, reconnect on errors.
+
+        A full re-list is only performed when ``self._resource_version`` is
+        ``None`` (first start or after a 410 Gone response).
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._resource_version is None:
+                try:
+                    await self._initial_list()
+                except Exception as exc:
+                    logger.exception("Error during initial list; retrying")
+                    await self._fire(ERROR, exc)
+                    await asyncio.sleep(_LIST_RETRY_DELAY)
+                    continue
+
+            last_resync = loop.time()
+            try:
+                await self._watch_once()
+            except ApiException as exc:
+                if exc.status == 410:
+                    logger.warning(
+                        "Watch expired (410 Gone); will re-list from scratch"
+                    )
+                    self._resource_version = None
+                else:
+                    logger.warning(
+                        "Watch stream ended with ApiException (status=%s); reconnecting",
+                        exc.status,
+                    )
+                await self._fire(ERROR, exc)
+            except Exception as exc:
+                logger.exception("Unexpected error in watch loop; reconnecting")
+                await self._fire(ERROR, exc)
+
+            if (
+                self._resource_version is not None
+                and self._resync_period > 0
+                and loop.time() - last_resync >= self._resync_period
+            ):
+                logger.debug("Informer resync triggered")
+                if self._resync_from_cache:
+                    await self._replay_cache()
+                else:
+                    try:
+                        await self._initial_list()
+                    except Exception as exc:
+                        logger.exception("Error during resync list; continuing")
+                        await self._fire(ERROR, exc)
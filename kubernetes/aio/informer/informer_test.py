@@ -0,0 +1,232 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, Mock, patch
+
+from kubernetes.aio.client.exceptions import ApiException
+from kubernetes.aio.informer import (
+    ADDED,
+    BOOKMARK,
+    DELETED,
+    ERROR,
+    MODIFIED,
+    NAMESPACE_INDEX,
+    ObjectCache,
+    SharedInformer,
+    meta_namespace_index_func,
+)
+
+
+def _make_pod(name, rv=None):
+    pod = {"metadata": {"namespace": "default", "name": name}}
+    if rv is not None:
+        pod["metadata"]["resourceVersion"] = rv
+    return pod
+
+
+def _list_resp(items, rv="5"):
+    return SimpleNamespace(
+        items=items, metadata=SimpleNamespace(resource_version=rv))
+
+
+class FakeWatch:
+    """Stands in for the kubernetes.aio.watch.Watch of an informer.
+
+    Each script is a list of events, or an exception to raise, served to
+    successive watches.  Once the scripts run out the stream blocks until
+    the informer is stopped.
+    """
+
+    def __init__(self, scripts):
+        self._scripts = scripts
+        self.resource_version = None
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    def stop(self):
+        pass
+
+    async def stream(self, func, **kwargs):
+        self.calls.append(kwargs)
+        if not self._scripts:
+            await asyncio.Event().wait()
+        script = self._scripts.pop(0)
+        if isinstance(script, Exception):
+            raise script
+        for event in script:
+            rv = event.get("raw_object", {}).get("metadata", {}).get("resourceVersion")
+            if rv:
+                self.resource_version = rv
+            yield event
+
+
+def _event(evt_type, obj):
+    return {"type": evt_type, "object": obj, "raw_object": obj}
+
+
+class ObjectCacheTest(TestCase):
+
+    def test_put_remove_and_index(self):
+        cache = ObjectCache(indexers={NAMESPACE_INDEX: meta_namespace_index_func})
+        pod = _make_pod("p1")
+        cache._put(pod)
+        snap = cache.snapshot()
+        self.assertIs(cache.get_by_key("default/p1"), pod)
+        self.assertEqual(cache.by_index(NAMESPACE_INDEX, "default"), [pod])
+        cache._remove(pod)
+        self.assertEqual(cache.list(), [])
+        self.assertEqual(cache.by_index(NAMESPACE_INDEX, "default"), [])
+        self.assertEqual(dict(snap), {"default/p1": pod})
+
+    def test_replace_all(self):
+        cache = ObjectCache()
+        cache._put(_make_pod("p1"))
+        cache._replace_all([_make_pod("p2")])
+        self.assertEqual(cache.list_keys(), ["default/p2"])
+
+
+class SharedInformerTest(IsolatedAsyncioTestCase):
+
+    async def _run(self, informer, fake_watch, until):
+        informer._watch = fake_watch
+        informer.start()
+        for _ in range(200):
+            if until():
+                break
+            await asyncio.sleep(0.01)
+        await informer.stop()
+
+    async def test_list_then_watch_with_coroutine_handlers(self):
+        list_func = AsyncMock(return_value=_list_resp([_make_pod("p1", "1")]))
+        informer = SharedInformer(list_func, namespace="default")
+        received = []
+
+        async def on_event(obj):
+            received.append(obj["metadata"]["name"])
+
+        for event_type in (ADDED, MODIFIED, DELETED):
+            informer.add_event_handler(event_type, on_event)
+        fake_watch = FakeWatch([[
+            _event(ADDED, _make_pod("p2", "6")),
+            _event(MODIFIED, _make_pod("p1", "7")),
+            _event(DELETED, _make_pod("p2", "8")),
+        ]])
+
+        await self._run(informer, fake_watch, lambda: len(received) == 4)
+
+        self.assertEqual(received, ["p1", "p2", "p1", "p2"])
+        self.assertTrue(informer.has_synced())
+        self.assertEqual(informer.cache.list_keys(), ["default/p1"])
+        self.assertEqual(informer._resource_version, "8")
+        list_func.assert_awaited_once_with(namespace="default")
+        self.assertEqual(fake_watch.calls[0]["resource_version"], "5")
+
+    async def test_bookmark_fires_handler(self):
+        list_func = AsyncMock(return_value=_list_resp([]))
+        informer = SharedInformer(list_func)
+        bookmarks = []
+        informer.add_event_handler(BOOKMARK, bookmarks.append)
+        bookmark = {"metadata": {"resourceVersion": "42"}}
+        fake_watch = FakeWatch([[_event(BOOKMARK, bookmark)]])
+
+        await self._run(informer, fake_watch, lambda: bookmarks)
+
+        self.assertEqual(bookmarks, [bookmark])
+        self.assertEqual(informer._resource_version, "42")
+
+    async def test_410_triggers_relist(self):
+        list_func = AsyncMock(side_effect=[
+            _list_resp([_make_pod("old", "1")], rv="5"),
+            _list_resp([_make_pod("new", "9")], rv="9"),
+        ])
+        informer = SharedInformer(list_func)
+        deleted, errors = [], []
+        informer.add_event_handler(DELETED, deleted.append)
+        informer.add_event_handler(ERROR, errors.append)
+        fake_watch = FakeWatch([ApiException(status=410, reason="Gone")])
+
+        await self._run(informer, fake_watch, lambda: len(fake_watch.calls) == 2)
+
+        self.assertEqual(list_func.await_count, 2)
+        self.assertEqual([p["metadata"]["name"] for p in deleted], ["old"])
+        self.assertEqual(errors[0].status, 410)
+        self.assertEqual(fake_watch.calls[1]["resource_version"], "9")
+
+    async def test_one_watch_serves_every_reconnect(self):
+        fake_watch = FakeWatch([
+            [_event(ADDED, _make_pod("p1", "6"))],
+            [_event(MODIFIED, _make_pod("p1", "7"))],
+        ])
+        watch_cls = Mock(return_value=fake_watch)
+        with patch("kubernetes.aio.informer.informer.Watch", watch_cls):
+            informer = SharedInformer(AsyncMock(return_value=_list_resp([])))
+
+        await self._run(informer, fake_watch, lambda: len(fake_watch.calls) == 3)
+
+        watch_cls.assert_called_once_with()
+        self.assertEqual(
+            [call["resource_version"] for call in fake_watch.calls],
+            ["5", "6", "7"])
+
+    async def test_relist_skips_unchanged_resource_version(self):
+        informer = SharedInformer(AsyncMock(return_value=_list_resp(
+            [_make_pod("p1", "1"), _make_pod("p2", "2")])))
+        await informer._initial_list()
+        modified = []
+        informer.add_event_handler(MODIFIED, modified.append)
+        informer._list_func.return_value = _list_resp(
+            [_make_pod("p1", "1"), _make_pod("p2", "3")])
+
+        await informer._initial_list()
+
+        self.assertEqual([p["metadata"]["name"] for p in modified], ["p2"])
+
+    async def test_handler_exception_is_swallowed(self):
+        informer = SharedInformer(AsyncMock())
+        received = []
+
+        async def bad_handler(obj):
+            raise RuntimeError("boom")
+
+        informer.add_event_handler(ADDED, bad_handler)
+        informer.add_event_handler(ADDED, received.append)
+        await informer._fire(ADDED, _make_pod("p1"))
+        self.assertEqual(len(received), 1)
+
+    async def test_wait_for_sync_times_out(self):
+        informer = SharedInformer(AsyncMock())
+        self.assertFalse(await informer.wait_for_sync(timeout=0.01))
+
+    async def test_many_informers_share_one_loop(self):
+        with patch("kubernetes.aio.informer.informer.Watch",
+                   lambda: FakeWatch([])):
+            informers = [
+                SharedInformer(
+                    AsyncMock(return_value=_list_resp([_make_pod(str(n))])))
+                for n in range(200)
+            ]
+        for informer in informers:
+            informer.start()
+        synced = await asyncio.gather(
+            *(informer.wait_for_sync(timeout=5) for informer in informers))
+        await asyncio.gather(*(informer.stop() for informer in informers))
+        self.assertTrue(all(synced))
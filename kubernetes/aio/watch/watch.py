@@ -14,7 +14,6 @@
 
 import asyncio
 import inspect
-import json
 import pydoc
 from functools import partial
 from typing import Any
@@ -31,6 +30,22 @@ PYDOC_FOLLOW_PARAM = ":param follow:"
 # provide return_type to Watch class's __init__.
 TYPE_LIST_SUFFIX = "List"
 
+# Annotation carried by the BOOKMARK event that ends the synthetic ADDED
+# events of a watch opened with send_initial_events=True ("watch-list").
+INITIAL_EVENTS_END_ANNOTATION = "k8s.io/initial-events-end"
+
+
+def is_initial_events_end(event):
+    """Return True if *event* is the BOOKMARK closing a watch-list sync."""
+    if not isinstance(event, dict) or event.get('type') != 'BOOKMARK':
+        return False
+    obj = event.get('raw_object', event.get('object'))
+    metadata = obj.get('metadata') if isinstance(obj, dict) else None
+    annotations = (
+        metadata.get('annotations') if isinstance(metadata, dict) else None)
+    return (isinstance(annotations, dict)
+            and annotations.get(INITIAL_EVENTS_END_ANNOTATION) == "true")
+
 
 def _find_return_type(func):
     return_type = inspect.signature(func).return_annotation
@@ -51,6 +66,18 @@ def _find_return_type(func):
     return ""
 
 
+def _bound_api_client(func):
+    """Return the ApiClient of a bound generated API method, if any."""
+    # Look through partials, e.g. of CustomObjectsApi methods with their
+    # group, version and plural bound.
+    while isinstance(func, partial):
+        func = func.func
+    api_client = getattr(getattr(func, '__self__', None), 'api_client', None)
+    if isinstance(api_client, client.ApiClient):
+        return api_client
+    return None
+
+
 class Stream(object):
 
     def __init__(self, func, *args, **kwargs):
@@ -59,16 +86,33 @@ class Stream(object):
 
 class Watch(object):
 
-    def __init__(self, return_type=None):
+    def __init__(self, return_type=None, api_client=None):
         self._raw_return_type = return_type
         self._stop = False
-        self._api_client = client.ApiClient()
+        # Left unset so stream() can borrow the client (and connection pool)
+        # of the watched API method instead of building a new one.
+        self._api_client = api_client
+        # Only a client created here is closed by close().
+        self._owns_api_client = False
         self.resource_version = None
         self.resp = None
+        self._initial_events_pending = False
 
     def stop(self):
         self._stop = True
 
+    @property
+    def api_client(self):
+        """The ApiClient used to decode events.
+
+        Defaults to the client of the API method passed to :meth:`stream`,
+        or to a new ApiClient if that method is not bound to one.
+        """
+        if self._api_client is None:
+            self._api_client = client.ApiClient()
+            self._owns_api_client = True
+        return self._api_client
+
     def get_return_type(self, func):
         if self._raw_return_type:
             return self._raw_return_type
@@ -94,7 +138,7 @@ class Watch(object):
 
         """
         try:
-            js = json.loads(data)
+            js = self.api_client.configuration.json_loads(data)
         except ValueError:
             return data
 
@@ -124,11 +168,10 @@ class Watch(object):
             # If possible, compile the JSON response into a Python native response
             # type, eg `V1Namespace` or `V1Pod`,`ExtensionsV1beta1Deployment`, ...
             if response_type:
-                js['object'] = self._api_client.deserialize(
-                    response_text=json.dumps(js['raw_object']),
-                    response_type=response_type,
-                    content_type='application/json',
-                )
+                # Build the model straight from the decoded event instead of
+                # dumping raw_object back to text and parsing it again.
+                js['object'] = self.api_client.deserialize_data(
+                    js['raw_object'], response_type)
 
             # decode and save resource_version to continue watching
             if hasattr(js['object'], 'metadata'):
@@ -192,7 +235,7 @@ class Watch(object):
             except asyncio.TimeoutError:
                 # This exception can be raised by aiohttp (client timeout)
                 # but we don't retry if server side timeout is applied.
-                if watch_forever:
+                if watch_forever and not self._initial_events_pending:
                     self._reconnect()
                     continue
                 else:
@@ -209,8 +252,10 @@ class Watch(object):
 
             # Stop the iterator if K8s sends an empty response. This happens when
             # eg the supplied timeout has expired.
+            # A watch-list stream that ends before its initial-events-end
+            # bookmark cannot be resumed; let the caller start over.
             if line == '':
-                if watch_forever:
+                if watch_forever and not self._initial_events_pending:
                     self._reconnect()
                     continue
                 raise StopAsyncIteration
@@ -225,6 +270,12 @@ class Watch(object):
                     continue
                 raise
             retry_410 = watch_forever
+            if self._initial_events_pending and is_initial_events_end(event):
+                # The initial state has been delivered; reconnects resume
+                # from the bookmark.
+                self._initial_events_pending = False
+                self.func.keywords.pop('send_initial_events', None)
+                self.func.keywords.pop('resource_version_match', None)
             return event
 
     def stream(self, func, *args, **kwargs):
@@ -241,6 +292,14 @@ class Watch(object):
                              the func's doc string. If it cannot be determined,
                              'object' value will be the same as 'raw_object'.
 
+        When ``send_initial_events=True`` is passed (with
+        ``resource_version_match='NotOlderThan'``), the server first streams
+        the current state as synthetic ADDED events followed by a BOOKMARK
+        annotated with ``k8s.io/initial-events-end`` (see
+        :func:`is_initial_events_end`). Later reconnects resume from that
+        bookmark without replaying the state. If the stream ends before the
+        bookmark arrives, iteration stops instead of reconnecting.
+
         Example:
             v1 = kubernetes.aio.client.CoreV1Api()
             watch = kubernetes.aio.watch.Watch()
@@ -253,6 +312,8 @@ class Watch(object):
                     watch.stop()
         """
         self._stop = False
+        if self._api_client is None:
+            self._api_client = _bound_api_client(func)
         self.return_type = self.get_return_type(func)
         kwargs[self.get_watch_argument_name(func)] = True
         if inspect.ismethod(func):
@@ -269,11 +330,81 @@ class Watch(object):
             kwargs['_preload_content'] = False
         if 'resource_version' in kwargs:
             self.resource_version = kwargs['resource_version']
+        self._initial_events_pending = bool(kwargs.get('send_initial_events'))
 
         self.func = partial(func, *args, **kwargs)
 
         return self
 
+    async def stream_batches(self, func, *args, max_items=500,
+                             max_latency=1.0, **kwargs):
+        """Watch an API resource and yield the events in batches.
+
+        Takes the same arguments as :meth:`stream` and yields non-empty
+        lists of the events it would produce, in order. A batch is flushed
+        once it holds *max_items* events or *max_latency* seconds after its
+        first event arrived, whichever comes first; ``max_latency=None``
+        only flushes on size.
+
+        A read still in progress when a batch is flushed on time has not
+        decoded its event yet, so ``resource_version`` is the version of the
+        last event of each yielded batch and can be stored with it to
+        resume without skipping or repeating events.
+
+        After :meth:`stop` the events already read are yielded as a last
+        batch.
+
+        Example:
+            watch = kubernetes.aio.watch.Watch()
+            async for batch in watch.stream_batches(
+                    v1.list_namespaced_pod, 'default', max_items=500):
+                await store(batch, watch.resource_version)
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self.stream(func, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        batch = []
+        deadline = None
+        pending = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(self.next())
+                timeout = None
+                if batch and max_latency is not None:
+                    timeout = max(0.0, deadline - loop.time())
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                finished = False
+                error = None
+                if pending in done:
+                    task, pending = pending, None
+                    try:
+                        event = task.result()
+                    except StopAsyncIteration:
+                        finished = True
+                    except Exception as exc:
+                        error = exc
+                    else:
+                        if not batch and max_latency is not None:
+                            deadline = loop.time() + max_latency
+                        batch.append(event)
+                due = (max_latency is not None and batch
+                       and loop.time() >= deadline)
+                if batch and (finished or error is not None or self._stop
+                              or len(batch) >= max_items or due):
+                    flushed, batch = batch, []
+                    yield flushed
+                if error is not None:
+                    raise error
+                if finished or self._stop:
+                    return
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+            await self.close()
+
     async def __aenter__(self):
         return self
 
@@ -281,7 +412,11 @@ class Watch(object):
         await self.close()
 
     async def close(self):
-        await self._api_client.close()
+        if self._owns_api_client:
+            await self._api_client.close()
+            # A later stream() may borrow or create a client again.
+            self._api_client = None
+            self._owns_api_client = False
         if self.resp is not None:
             self.resp.release()
             self.resp = None
@@ -14,6 +14,7 @@
 
 import asyncio
 import json
+from functools import partial
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, Mock, call, create_autospec
 
@@ -75,6 +76,150 @@ class WatchTest(IsolatedAsyncioTestCase):
         # last resource_version has to be stored in the object
         self.assertEqual(watch.resource_version, '2')
 
+    async def test_watch_list_resumes_from_initial_events_end_bookmark(self):
+        fake_resp = Mock()
+        fake_resp.content.readline = AsyncMock()
+        fake_resp.release = Mock()
+        fake_resp.content.readline.side_effect = [
+            json.dumps({
+                "type": "ADDED",
+                "object": {"metadata": {"name": "test1", "resourceVersion": "1"}},
+            }).encode('utf8'),
+            json.dumps({
+                "type": "BOOKMARK",
+                "object": {"metadata": {
+                    "resourceVersion": "4",
+                    "annotations": {"k8s.io/initial-events-end": "true"},
+                }},
+            }).encode('utf8'),
+            b'',
+            AssertionError('Should not have been called'),
+        ]
+
+        fake_api = Mock()
+        fake_api.get_namespaces = create_autospec(
+            _watch_operation, return_value=fake_resp)
+        fake_api.get_namespaces.__doc__ = ':rtype: V1NamespaceList'
+
+        watch = kubernetes.aio.watch.Watch()
+        types = []
+        async with watch:
+            async for e in watch.stream(fake_api.get_namespaces,
+                                        send_initial_events=True,
+                                        resource_version_match='NotOlderThan'):
+                types.append(e['type'])
+                if e['type'] == 'BOOKMARK':
+                    self.assertEqual(
+                        watch.func.keywords,
+                        {'_preload_content': False, 'watch': True})
+                    watch.stop()
+
+        self.assertEqual(['ADDED', 'BOOKMARK'], types)
+        self.assertEqual(watch.resource_version, '4')
+
+    async def test_watch_list_stops_before_initial_events_end(self):
+        fake_resp = Mock()
+        fake_resp.content.readline = AsyncMock()
+        fake_resp.release = Mock()
+        fake_resp.content.readline.side_effect = [
+            json.dumps({
+                "type": "ADDED",
+                "object": {"metadata": {"name": "test1", "resourceVersion": "1"}},
+            }).encode('utf8'),
+            b'',
+            AssertionError('Should not have been called'),
+        ]
+
+        fake_api = Mock()
+        fake_api.get_namespaces = create_autospec(
+            _watch_operation, return_value=fake_resp)
+        fake_api.get_namespaces.__doc__ = ':rtype: V1NamespaceList'
+
+        watch = kubernetes.aio.watch.Watch()
+        events = []
+        async with watch:
+            async for e in watch.stream(fake_api.get_namespaces,
+                                        send_initial_events=True,
+                                        resource_version_match='NotOlderThan'):
+                events.append(e)
+
+        self.assertEqual(1, len(events))
+        fake_api.get_namespaces.assert_called_once()
+
+    def _fake_namespace_api(self, readline):
+        fake_resp = Mock()
+        fake_resp.content.readline = readline
+        fake_resp.release = Mock()
+        fake_api = Mock()
+        fake_api.get_namespaces = create_autospec(
+            _watch_operation, return_value=fake_resp)
+        fake_api.get_namespaces.__doc__ = ':rtype: V1NamespaceList'
+        return fake_api
+
+    def _namespace_event(self, rv):
+        return json.dumps({
+            "type": "ADDED",
+            "object": {"metadata": {"name": "test%d" % rv,
+                                    "resourceVersion": str(rv)}},
+        }).encode('utf8')
+
+    async def test_stream_batches_flushes_on_size(self):
+        fake_api = self._fake_namespace_api(AsyncMock(side_effect=[
+            self._namespace_event(rv) for rv in range(1, 6)] + [b'']))
+
+        watch = kubernetes.aio.watch.Watch()
+        batches = []
+        versions = []
+        async for batch in watch.stream_batches(
+                fake_api.get_namespaces, max_items=2, max_latency=None,
+                timeout_seconds=1):
+            batches.append([e['object'].metadata.name for e in batch])
+            versions.append(watch.resource_version)
+
+        self.assertEqual(
+            [['test1', 'test2'], ['test3', 'test4'], ['test5']], batches)
+        self.assertEqual(['2', '4', '5'], versions)
+
+    async def test_stream_batches_flushes_on_latency(self):
+        lines = [self._namespace_event(1), self._namespace_event(2), b'']
+
+        async def readline():
+            if len(lines) == 2:
+                await asyncio.sleep(0.5)
+            return lines.pop(0)
+
+        fake_api = self._fake_namespace_api(readline)
+
+        watch = kubernetes.aio.watch.Watch()
+        batches = []
+        async for batch in watch.stream_batches(
+                fake_api.get_namespaces, max_items=10, max_latency=0.05,
+                timeout_seconds=1):
+            batches.append([e['object'].metadata.name for e in batch])
+            if len(batches) == 1:
+                self.assertEqual('1', watch.resource_version)
+
+        self.assertEqual([['test1'], ['test2']], batches)
+
+    async def test_stream_batches_stop_flushes_pending_batch(self):
+        watch = kubernetes.aio.watch.Watch()
+        lines = [self._namespace_event(rv) for rv in range(1, 4)]
+
+        async def readline():
+            if len(lines) == 1:
+                watch.stop()
+            return lines.pop(0)
+
+        fake_api = self._fake_namespace_api(readline)
+
+        batches = []
+        async for batch in watch.stream_batches(
+                fake_api.get_namespaces, max_items=10, max_latency=None):
+            batches.append([e['object'].metadata.name for e in batch])
+
+        self.assertEqual([['test1', 'test2', 'test3']], batches)
+        self.assertEqual('3', watch.resource_version)
+
     async def test_watch_for_follow(self):
         fake_resp = Mock()
         fake_resp.content.readline = AsyncMock()
@@ -204,6 +349,55 @@ class WatchTest(IsolatedAsyncioTestCase):
                 r'\(401\)\nReason: Unauthorized: Unauthorized'):
             Watch().unmarshal_event(json.dumps(k8s_err), None)
 
+    async def test_watch_reuses_api_client_of_bound_method(self):
+        fake_resp = Mock()
+        fake_resp.content.readline = AsyncMock()
+        api_client = kubernetes.aio.client.ApiClient()
+        api_client.close = AsyncMock()
+        api_client.configuration.json_loads = Mock(side_effect=json.loads)
+
+        class FakeApi:
+            async def list_namespace(self, **kwargs):
+                """:rtype: V1NamespaceList"""
+                return fake_resp
+
+        api = FakeApi()
+        api.api_client = api_client
+        fake_resp.content.readline.side_effect = [json.dumps({
+            "type": "ADDED", "object": {"metadata": {"name": "test"}},
+        }).encode('utf8'), b'']
+
+        async with Watch() as w:
+            events = [e async for e in w.stream(
+                api.list_namespace, timeout_seconds=1)]
+
+        self.assertIs(api_client, w.api_client)
+        self.assertEqual("test", events[0]['object'].metadata.name)
+        api_client.configuration.json_loads.assert_called_once()
+        api_client.close.assert_not_called()
+
+        explicit = kubernetes.aio.client.ApiClient()
+        w = Watch(api_client=explicit)
+        w.stream(partial(api.list_namespace))
+        self.assertIs(explicit, w.api_client)
+
+        w = Watch()
+        w.stream(partial(api.list_namespace))
+        self.assertIs(api_client, w.api_client)
+
+    async def test_watch_without_bound_api_client_creates_one(self):
+        w = Watch()
+        self.assertIsInstance(w.api_client, kubernetes.aio.client.ApiClient)
+        self.assertIs(w.api_client, w.api_client)
+        await w.close()
+
+    async def test_closed_watch_can_stream_again(self):
+        w = Watch()
+        created = w.api_client
+        await w.close()
+        self.assertIsNot(w.api_client, created)
+        await w.close()
+
     async def test_unmarshal_with_custom_object(self):
         w = Watch()
         event = w.unmarshal_event('{"type": "ADDED", "object": {"apiVersion":'
@@ -217,6 +411,18 @@ class WatchTest(IsolatedAsyncioTestCase):
         self.assertEqual("1", event['object']['metadata']['resourceVersion'])
         self.assertEqual("1", w.resource_version)
 
+    async def test_unmarshal_builds_model_from_decoded_event(self):
+        w = Watch()
+        w.api_client.deserialize = Mock(
+            side_effect=AssertionError("event text parsed twice"))
+        event = w.unmarshal_event(
+            '{"type": "ADDED", "object": {"metadata": {"name": "test1",'
+            '"resourceVersion": "7"}, "spec": {}, "status": {}}}',
+            'V1Namespace')
+        self.assertIsInstance(event['object'], kubernetes.aio.client.V1Namespace)
+        self.assertEqual("test1", event['object'].metadata.name)
+        self.assertEqual("7", w.resource_version)
+
     async def test_watch_with_exception(self):
         fake_resp = Mock()
         fake_resp.content.readline = AsyncMock()
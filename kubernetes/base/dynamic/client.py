@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-
 from kubernetes import watch
 from kubernetes.client.rest import ApiException
 
@@ -56,7 +54,8 @@ def meta_request(func):
             raise api_exception(e)
         if serialize_response:
             try:
-                return serializer(self, json.loads(resp.data.decode('utf8')))
+                return serializer(self, self.client.configuration.json_loads(
+                    resp.data.decode('utf8')))
             except ValueError:
                 return resp.data.decode('utf8')
         return resp
@@ -189,7 +188,7 @@ class DynamicClient:
                 # If you want to gracefully stop the stream watcher
                 watcher.stop()
         """
-        if not watcher: watcher = watch.Watch()
+        if not watcher: watcher = watch.Watch(api_client=self.client)
 
         # Use field selector to query for named instance so the watch parameter is handled properly.
         if name:
@@ -247,6 +246,10 @@ class DynamicClient:
             query_params.append(('force', params['force_conflicts']))
         if params.get('allow_watch_bookmarks') is not None:
             query_params.append(('allowWatchBookmarks', params['allow_watch_bookmarks']))
+        if params.get('send_initial_events') is not None:
+            query_params.append(('sendInitialEvents', params['send_initial_events']))
+        if params.get('resource_version_match') is not None:
+            query_params.append(('resourceVersionMatch', params['resource_version_match']))
 
         header_params = params.get('header_params', {})
         form_params = []
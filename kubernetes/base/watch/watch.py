@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import http
 import inspect
-import json
 import pydoc
+import queue
+import threading
+import time
 from typing import Any
 
 from kubernetes import client
@@ -32,6 +35,22 @@ TYPE_LIST_SUFFIX = "List"
 
 HTTP_STATUS_GONE = http.HTTPStatus.GONE
 
+# Annotation carried by the BOOKMARK event that ends the synthetic ADDED
+# events of a watch opened with send_initial_events=True ("watch-list").
+INITIAL_EVENTS_END_ANNOTATION = "k8s.io/initial-events-end"
+
+
+def is_initial_events_end(event):
+    """Return True if *event* is the BOOKMARK closing a watch-list sync."""
+    if not isinstance(event, dict) or event.get('type') != 'BOOKMARK':
+        return False
+    obj = event.get('raw_object', event.get('object'))
+    metadata = obj.get('metadata') if isinstance(obj, dict) else None
+    annotations = (
+        metadata.get('annotations') if isinstance(metadata, dict) else None)
+    return (isinstance(annotations, dict)
+            and annotations.get(INITIAL_EVENTS_END_ANNOTATION) == "true")
+
 
 def _find_return_type(func):
     return_type = inspect.signature(func).return_annotation
@@ -52,16 +71,31 @@ def _find_return_type(func):
     return ""
 
 
+def _bound_api_client(func):
+    """Return the ApiClient of a bound generated API method, if any."""
+    # Look through partials, e.g. of CustomObjectsApi methods with their
+    # group, version and plural bound.
+    while isinstance(func, functools.partial):
+        func = func.func
+    api_client = getattr(getattr(func, '__self__', None), 'api_client', None)
+    if isinstance(api_client, client.ApiClient):
+        return api_client
+    return None
+
+
 def iter_resp_lines(resp):
+    """Yield complete utf-8 decoded lines from a streamed response.
+
+    Lines are located by scanning forward from a read offset instead of
+    slicing the consumed bytes off the front of the buffer after every
+    line, which made a segment holding many small events cost quadratic
+    time.  Consumed bytes are discarded once per segment.
+    """
     buffer = bytearray()
+    offset = 0
     for segment in resp.stream(amt=None, decode_content=False):
 
         # Append the segment (chunk) to the buffer
-        #
-        # Performance note: depending on contents of buffer and the type+value of segment,
-        # encoding segment into the buffer could be a wasteful step. The approach used here
-        # simplifies the logic farther down, but in the future it may be reasonable to
-        # sacrifice readability for performance.
         if isinstance(segment, bytes):
             buffer.extend(segment)
         elif isinstance(segment, str):
@@ -71,29 +105,37 @@ def iter_resp_lines(resp):
                 f"Received invalid segment type, {type(segment)}, from stream. Accepts only 'str' or 'bytes'.")
 
         # Split by newline (safe for utf-8 because multi-byte sequences cannot contain the newline byte)
-        next_newline = buffer.find(b'\n')
+        next_newline = buffer.find(b'\n', offset)
         while next_newline != -1:
             # Convert bytes to a valid utf-8 string, replacing any invalid utf-8 with the '�' character
-            line = buffer[:next_newline].decode(
+            line = buffer[offset:next_newline].decode(
                 "utf-8", errors="replace")
-            buffer = buffer[next_newline+1:]
-            if line:
-                yield line
-            else:
-                yield ''  # Only print one empty line
-            next_newline = buffer.find(b'\n')
+            offset = next_newline + 1
+            yield line
+            next_newline = buffer.find(b'\n', offset)
+
+        # Compact once per segment so only the trailing partial line is kept.
+        if offset:
+            del buffer[:offset]
+            offset = 0
 
 
 class Watch:
 
-    def __init__(self, return_type=None):
+    def __init__(self, return_type=None, api_client=None):
         self._raw_return_type = return_type
         self._stop = False
-        self._api_client = client.ApiClient()
+        # Left unset so stream() can borrow the client (and connection pool)
+        # of the watched API method instead of building a new one.
+        self._api_client = api_client
         self.resource_version = None
+        self._batch_source = None
 
     def stop(self):
         self._stop = True
+        batch_source = self._batch_source
+        if batch_source is not None:
+            batch_source.stop()
         if hasattr(self, '_resp') and self._resp:
             import socket
             try:
@@ -110,6 +152,17 @@ class Watch:
                 pass
 
 
+    @property
+    def api_client(self):
+        """The ApiClient used to decode events.
+
+        Defaults to the client of the API method passed to :meth:`stream`,
+        or to a new ApiClient if that method is not bound to one.
+        """
+        if self._api_client is None:
+            self._api_client = client.ApiClient()
+        return self._api_client
+
     def get_return_type(self, func):
         if self._raw_return_type:
             return self._raw_return_type
@@ -137,36 +190,36 @@ class Watch:
         if not data or data.isspace():
             return None
         try:
-            js = json.loads(data)
-            js['raw_object'] = js['object']
-
-            if not return_type:
-                return js
-
-            if js['type'] == 'BOOKMARK':
-                # Extract and store resource_version from BOOKMARK event for
-                # efficiency. No deserialization as event can be incomplete.
-                if isinstance(js['object'], dict) and 'metadata' in js['object']:
-                    metadata = js['object']['metadata']
-                    if isinstance(metadata, dict) and 'resourceVersion' in metadata:
-                        self.resource_version = metadata['resourceVersion']
-            elif js['type'] != 'ERROR':
-                js['object'] = self._api_client.deserialize(
-                    json.dumps(js['raw_object']),
-                    return_type,
-                    'application/json',
-                )
-                if hasattr(js['object'], 'metadata'):
-                    self.resource_version = js['object'].metadata.resource_version
-                # For custom objects that we don't have model defined, json
-                # deserialization results in dictionary
-                elif (isinstance(js['object'], dict) and 'metadata' in js['object']
-                      and 'resourceVersion' in js['object']['metadata']):
-                    self.resource_version = js['object']['metadata'][
-                        'resourceVersion']
-            return js
-        except json.JSONDecodeError:
+            js = self.api_client.configuration.json_loads(data)
+        except ValueError:
+            # json.JSONDecodeError or the decode error of another backend
             return None
+        js['raw_object'] = js['object']
+
+        if not return_type:
+            return js
+
+        if js['type'] == 'BOOKMARK':
+            # Extract and store resource_version from BOOKMARK event for
+            # efficiency. No deserialization as event can be incomplete.
+            if isinstance(js['object'], dict) and 'metadata' in js['object']:
+                metadata = js['object']['metadata']
+                if isinstance(metadata, dict) and 'resourceVersion' in metadata:
+                    self.resource_version = metadata['resourceVersion']
+        elif js['type'] != 'ERROR':
+            # Build the model straight from the decoded event instead of
+            # dumping raw_object back to text and parsing it again.
+            js['object'] = self.api_client.deserialize_data(
+                js['raw_object'], return_type)
+            if hasattr(js['object'], 'metadata'):
+                self.resource_version = js['object'].metadata.resource_version
+            # For custom objects that we don't have model defined, json
+            # deserialization results in dictionary
+            elif (isinstance(js['object'], dict) and 'metadata' in js['object']
+                  and 'resourceVersion' in js['object']['metadata']):
+                self.resource_version = js['object']['metadata'][
+                    'resourceVersion']
+        return js
 
     def stream(self, func, *args, **kwargs):
         """Watch an API resource and stream the result back via a generator.
@@ -190,6 +243,15 @@ class Watch:
                              the func's doc string. If it cannot be determined,
                              'object' value will be the same as 'raw_object'.
 
+        When ``send_initial_events=True`` is passed (with
+        ``resource_version_match='NotOlderThan'``), the server first streams
+        the current state as synthetic ADDED events followed by a BOOKMARK
+        annotated with ``k8s.io/initial-events-end`` (see
+        :func:`is_initial_events_end`). Later reconnects resume from that
+        bookmark without replaying the state. If the stream ends before the
+        bookmark arrives, the generator stops instead of retrying, since a
+        partial replay cannot be stitched to a new one.
+
         Example:
             v1 = kubernetes.client.CoreV1Api()
             watch = kubernetes.watch.Watch()
@@ -203,6 +265,8 @@ class Watch:
         """
 
         self._stop = False
+        if self._api_client is None:
+            self._api_client = _bound_api_client(func)
         return_type = self.get_return_type(func)
         watch_arg = self.get_watch_argument_name(func)
         kwargs[watch_arg] = True
@@ -215,13 +279,14 @@ class Watch:
         disable_retries = ('timeout_seconds' in kwargs)
         retry_after_410 = False
         deserialize = kwargs.pop('deserialize', True)
+        initial_events_pending = bool(kwargs.get('send_initial_events'))
         while True:
             resp = func(*args, **kwargs)
             self._resp = resp
             try:
                 status = getattr(resp, 'status', None)
                 if isinstance(status, int) and not 200 <= status <= 299:
-                    self._api_client.response_deserialize(resp, {})
+                    self.api_client.response_deserialize(resp, {})
                 for line in iter_resp_lines(resp):
                     # unmarshal when we are receiving events from watch,
                     # return raw string when we are streaming log
@@ -230,7 +295,7 @@ class Watch:
                             event = self.unmarshal_event(line, return_type)
                         else:
                             # Only do basic JSON parsing, no deserialize
-                            event = json.loads(line)
+                            event = self.api_client.configuration.json_loads(line)
                         if isinstance(event, dict) \
                                 and event['type'] == 'ERROR':
                             obj = event['raw_object']
@@ -247,6 +312,13 @@ class Watch:
                                     status=obj['code'], reason=reason)
                         else:
                             retry_after_410 = False
+                            if initial_events_pending and \
+                                    is_initial_events_end(event):
+                                # The initial state has been delivered;
+                                # reconnects resume from the bookmark.
+                                initial_events_pending = False
+                                kwargs.pop('send_initial_events', None)
+                                kwargs.pop('resource_version_match', None)
                             yield event
                     else:
                         if line:  
@@ -259,10 +331,112 @@ class Watch:
                 resp.close()
                 resp.release_conn()
                 self._resp = None
-                if self.resource_version is not None:
+                if self.resource_version is not None \
+                        and not initial_events_pending:
                     kwargs['resource_version'] = self.resource_version
                 else:
                     self._stop = True
 
             if self._stop or disable_retries:
                 break
+
+    def stream_batches(self, func, *args, max_items=500, max_latency=1.0,
+                       **kwargs):
+        """Watch an API resource and yield the events in batches.
+
+        Takes the same arguments as :meth:`stream` and yields non-empty
+        lists of the events it would produce, in order. A batch is flushed
+        once it holds *max_items* events or *max_latency* seconds after its
+        first event arrived, whichever comes first; ``max_latency=None``
+        only flushes on size. Events are read on a helper thread so a batch
+        is flushed on time even while the server is quiet; every call
+        starts its own reader thread, which ends with the generator.
+
+        After :meth:`stop` the events already batched are yielded as a last
+        batch; events read after it are dropped.
+
+        ``resource_version`` advances per batch: once a batch is yielded it
+        is the version of the last event in that batch, so it can be stored
+        together with the batch and used to resume without skipping or
+        repeating events.
+
+        Example:
+            w = kubernetes.watch.Watch()
+            for batch in w.stream_batches(v1.list_namespaced_pod, 'default',
+                                          max_items=500, max_latency=2):
+                store(batch, w.resource_version)
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self._stop = False
+        if 'resource_version' in kwargs:
+            self.resource_version = kwargs['resource_version']
+
+        # A private Watch reads ahead on the helper thread; its
+        # resource_version runs ahead of what has been handed out.
+        source = Watch(self._raw_return_type, api_client=self._api_client)
+        self._batch_source = source
+        items = queue.Queue(maxsize=max_items)
+
+        def put(item, final=False):
+            while not source._stop:
+                try:
+                    items.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+            if final:
+                # Wake a consumer blocked on an empty queue after stop().
+                try:
+                    items.put_nowait(item)
+                except queue.Full:
+                    pass
+
+        def produce():
+            try:
+                for event in source.stream(func, *args, **kwargs):
+                    put(('event', event, source.resource_version))
+            except Exception as exc:
+                put(('error', exc, None), final=True)
+            else:
+                put(('end', None, None), final=True)
+
+        reader = threading.Thread(
+            target=produce, name="WatchBatchReader", daemon=True)
+        reader.start()
+
+        batch = []
+        deadline = None
+        resource_version = self.resource_version
+        try:
+            while True:
+                timeout = None
+                if batch and max_latency is not None:
+                    timeout = max(0.0, deadline - time.monotonic())
+                try:
+                    kind, value, rv = items.get(timeout=timeout)
+                except queue.Empty:
+                    kind, value, rv = 'timeout', None, None
+                if self._stop:
+                    if batch:
+                        self.resource_version = resource_version
+                        yield batch
+                    return
+                if kind == 'event':
+                    if not batch and max_latency is not None:
+                        deadline = time.monotonic() + max_latency
+                    batch.append(value)
+                    resource_version = rv
+                    if len(batch) < max_items:
+                        continue
+                if batch:
+                    self.resource_version = resource_version
+                    pending, batch = batch, []
+                    yield pending
+                if kind == 'error':
+                    raise value
+                if kind == 'end':
+                    return
+        finally:
+            source.stop()
+            self._batch_source = None
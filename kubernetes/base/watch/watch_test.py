@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
 import os
+import threading
 import time
 from types import SimpleNamespace
 from typing import Any, Optional
@@ -23,7 +25,7 @@ from unittest.mock import Mock, call
 from kubernetes import client, config
 from kubernetes.client import ApiException
 
-from .watch import Watch
+from .watch import Watch, iter_resp_lines
 
 
 class WatchTests(unittest.TestCase):
@@ -46,6 +48,39 @@ class WatchTests(unittest.TestCase):
         self.assertEqual('test', events[0]['object'].metadata.name)
         api.api_client.call_api.assert_called_once()
 
+    def test_watch_reuses_api_client_of_bound_method(self):
+        fake_resp = Mock()
+        fake_resp.stream.return_value = [
+            '{"type": "ADDED", "object": {"metadata": {"name": "test"}}}\n'
+        ]
+
+        class FakeApi:
+            api_client = client.ApiClient()
+
+            def list_namespace(self, **kwargs):
+                """:rtype: V1NamespaceList"""
+                return fake_resp
+
+        api = FakeApi()
+
+        w = Watch()
+        list(w.stream(api.list_namespace, timeout_seconds=1))
+        self.assertIs(api.api_client, w.api_client)
+
+        explicit = client.ApiClient()
+        w = Watch(api_client=explicit)
+        list(w.stream(api.list_namespace, timeout_seconds=1))
+        self.assertIs(explicit, w.api_client)
+
+        w = Watch()
+        list(w.stream(functools.partial(api.list_namespace), timeout_seconds=1))
+        self.assertIs(api.api_client, w.api_client)
+
+    def test_watch_without_bound_api_client_creates_one(self):
+        w = Watch()
+        self.assertIsInstance(w.api_client, client.ApiClient)
+        self.assertIs(w.api_client, w.api_client)
+
     def test_typing_annotation_falls_back_to_documented_model(self):
         def list_pods() -> Optional[client.V1PodList]:
             """:rtype: V1PodList"""
@@ -136,6 +171,21 @@ class WatchTests(unittest.TestCase):
             self.assertEqual("test%d" % count, e['object'].metadata.name)
         self.assertEqual(3, count)
 
+    def test_iter_resp_lines_many_lines_per_segment(self):
+        fake_resp = Mock()
+        fake_resp.stream = Mock(
+            return_value=[
+                b''.join(b'line-%d\n' % i for i in range(1000)) + b'part',
+                b'ial\n\n',
+                'tail\nunterminated',
+            ])
+
+        lines = list(iter_resp_lines(fake_resp))
+
+        self.assertEqual(
+            ['line-%d' % i for i in range(1000)] + ['partial', '', 'tail'],
+            lines)
+
     def test_watch_with_multibyte_utf8(self):
         fake_resp = Mock()
         fake_resp.close = Mock()
@@ -321,6 +371,139 @@ class WatchTests(unittest.TestCase):
         # more strict test with worse error message
         self.assertEqual(fake_api.get_namespaces.mock_calls, calls)
 
+    def test_watch_list_resumes_from_initial_events_end_bookmark(self):
+        fake_resp = Mock()
+        fake_resp.close = Mock()
+        fake_resp.release_conn = Mock()
+        fake_resp.stream = Mock(return_value=[
+            '{"type": "ADDED", "object": {"metadata": {"name": "test1",'
+            '"resourceVersion": "1"}, "spec": {}, "status": {}}}\n',
+            '{"type": "BOOKMARK", "object": {"metadata": {"resourceVersion":'
+            '"4", "annotations": {"k8s.io/initial-events-end": "true"}}}}\n',
+        ])
+
+        fake_api = Mock()
+        fake_api.get_namespaces = Mock(return_value=fake_resp)
+        fake_api.get_namespaces.__doc__ = ':rtype: V1NamespaceList'
+
+        w = Watch()
+        types = []
+        for e in w.stream(fake_api.get_namespaces, send_initial_events=True,
+                          resource_version_match='NotOlderThan'):
+            types.append(e['type'])
+            if len(types) == 3:
+                w.stop()
+
+        self.assertEqual(['ADDED', 'BOOKMARK', 'ADDED'], types)
+        self.assertEqual(fake_api.get_namespaces.mock_calls, [
+            call(_preload_content=False, watch=True, send_initial_events=True,
+                 resource_version_match='NotOlderThan'),
+            call(_preload_content=False, watch=True, resource_version='4'),
+        ])
+
+    def test_watch_list_does_not_retry_before_initial_events_end(self):
+        fake_resp = Mock()
+        fake_resp.close = Mock()
+        fake_resp.release_conn = Mock()
+        fake_resp.stream = Mock(return_value=[
+            '{"type": "ADDED", "object": {"metadata": {"name": "test1",'
+            '"resourceVersion": "1"}, "spec": {}, "status": {}}}\n',
+        ])
+
+        fake_api = Mock()
+        fake_api.get_namespaces = Mock(return_value=fake_resp)
+        fake_api.get_namespaces.__doc__ = ':rtype: V1NamespaceList'
+
+        events = list(Watch().stream(
+            fake_api.get_namespaces, send_initial_events=True,
+            resource_version_match='NotOlderThan'))
+
+        self.assertEqual(1, len(events))
+        fake_api.get_namespaces.assert_called_once()
+
+    def _fake_namespace_api(self, segments):
+        fake_resp = Mock()
+        fake_resp.close = Mock()
+        fake_resp.release_conn = Mock()
+        fake_resp.stream = Mock(side_effect=lambda **kw: iter(segments()))
+        fake_api = Mock()
+        fake_api.get_namespaces = Mock(return_value=fake_resp)
+        fake_api.get_namespaces.__doc__ = ':rtype: V1NamespaceList'
+        return fake_api
+
+    def _namespace_event(self, rv):
+        return ('{"type": "ADDED", "object": {"metadata": {"name": "test%d",'
+                '"resourceVersion": "%d"}, "spec": {}, "status": {}}}\n'
+                % (rv, rv))
+
+    def test_stream_batches_flushes_on_size(self):
+        fake_api = self._fake_namespace_api(
+            lambda: [self._namespace_event(rv) for rv in range(1, 6)])
+
+        w = Watch()
+        batches = []
+        versions = []
+        for batch in w.stream_batches(fake_api.get_namespaces, max_items=2,
+                                      max_latency=None, timeout_seconds=1):
+            batches.append([e['object'].metadata.name for e in batch])
+            versions.append(w.resource_version)
+
+        self.assertEqual(
+            [['test1', 'test2'], ['test3', 'test4'], ['test5']], batches)
+        self.assertEqual(['2', '4', '5'], versions)
+
+    def test_stream_batches_flushes_on_latency(self):
+        def segments():
+            yield self._namespace_event(1)
+            time.sleep(0.5)
+            yield self._namespace_event(2)
+
+        fake_api = self._fake_namespace_api(segments)
+
+        w = Watch()
+        batches = []
+        for batch in w.stream_batches(fake_api.get_namespaces, max_items=10,
+                                      max_latency=0.05, timeout_seconds=1):
+            batches.append([e['object'].metadata.name for e in batch])
+            if len(batches) == 1:
+                self.assertEqual('1', w.resource_version)
+
+        self.assertEqual([['test1'], ['test2']], batches)
+
+    def test_stream_batches_stop(self):
+        fake_api = self._fake_namespace_api(
+            lambda: [self._namespace_event(rv) for rv in range(1, 100)])
+
+        w = Watch()
+        batches = []
+        for batch in w.stream_batches(fake_api.get_namespaces, max_items=3):
+            batches.append(batch)
+            w.stop()
+
+        self.assertEqual(1, len(batches))
+        self.assertEqual(3, len(batches[0]))
+        self.assertEqual('3', w.resource_version)
+
+    def test_stream_batches_stop_flushes_pending_batch(self):
+        def segments():
+            yield self._namespace_event(1)
+            yield self._namespace_event(2)
+            time.sleep(0.5)
+            yield self._namespace_event(3)
+
+        fake_api = self._fake_namespace_api(segments)
+
+        w = Watch()
+        threading.Timer(0.1, w.stop).start()
+        batches = [
+            [e['object'].metadata.name for e in batch]
+            for batch in w.stream_batches(fake_api.get_namespaces,
+                                          max_items=10, max_latency=None)
+        ]
+
+        self.assertEqual([['test1', 'test2']], batches)
+        self.assertEqual('2', w.resource_version)
+
     def test_watch_stream_twice(self):
         w = Watch(float)
         for step in ['first', 'second']:
@@ -409,6 +592,18 @@ class WatchTests(unittest.TestCase):
         self.assertEqual("1", event['object']['metadata']['resourceVersion'])
         self.assertEqual("1", w.resource_version)
 
+    def test_unmarshal_builds_model_from_decoded_event(self):
+        w = Watch()
+        w.api_client.deserialize = Mock(
+            side_effect=AssertionError("event text parsed twice"))
+        event = w.unmarshal_event(
+            '{"type": "ADDED", "object": {"metadata": {"name": "test1",'
+            '"resourceVersion": "7"}, "spec": {}, "status": {}}}',
+            'V1Namespace')
+        self.assertIsInstance(event['object'], client.V1Namespace)
+        self.assertEqual("test1", event['object'].metadata.name)
+        self.assertEqual("7", w.resource_version)
+
     def test_unmarshal_with_bookmark(self):
         w = Watch()
         event = w.unmarshal_event(
@@ -11,7 +11,7 @@
 
 
 import warnings
-from pydantic import BaseModel, validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import BaseModel, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -24,7 +24,7 @@ from kubernetes.client.models.v1_api_service_list import V1APIServiceList
 from kubernetes.client.models.v1_delete_options import V1DeleteOptions
 from kubernetes.client.models.v1_status import V1Status
 
-from kubernetes.client.api_client import ApiClient, RequestSerialized
+from kubernetes.client.api_client import ApiClient, RequestSerialized, validate_call
 from kubernetes.client.api_response import ApiResponse
 from kubernetes.client.rest import RESTResponseType
 
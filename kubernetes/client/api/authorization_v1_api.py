@@ -11,7 +11,7 @@
 
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -24,7 +24,7 @@ from kubernetes.client.models.v1_self_subject_access_review import V1SelfSubject
 from kubernetes.client.models.v1_self_subject_rules_review import V1SelfSubjectRulesReview
 from kubernetes.client.models.v1_subject_access_review import V1SubjectAccessReview
 
-from kubernetes.client.api_client import ApiClient, RequestSerialized
+from kubernetes.client.api_client import ApiClient, RequestSerialized, validate_call
 from kubernetes.client.api_response import ApiResponse
 from kubernetes.client.rest import RESTResponseType
 
@@ -11,7 +11,7 @@
 
 
 import warnings
-from pydantic import BaseModel, validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import BaseModel, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -26,7 +26,7 @@ from kubernetes.client.models.v1alpha3_device_taint_rule_list import V1alpha3Dev
 from kubernetes.client.models.v1alpha3_resource_pool_status_request import V1alpha3ResourcePoolStatusRequest
 from kubernetes.client.models.v1alpha3_resource_pool_status_request_list import V1alpha3ResourcePoolStatusRequestList
 
-from kubernetes.client.api_client import ApiClient, RequestSerialized
+from kubernetes.client.api_client import ApiClient, RequestSerialized, validate_call
 from kubernetes.client.api_response import ApiResponse
 from kubernetes.client.rest import RESTResponseType
 
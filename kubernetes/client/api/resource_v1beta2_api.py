@@ -11,7 +11,7 @@
 
 
 import warnings
-from pydantic import BaseModel, validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import BaseModel, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -32,7 +32,7 @@ from kubernetes.client.models.v1beta2_resource_claim_template_list import V1beta
 from kubernetes.client.models.v1beta2_resource_slice import V1beta2ResourceSlice
 from kubernetes.client.models.v1beta2_resource_slice_list import V1beta2ResourceSliceList
 
-from kubernetes.client.api_client import ApiClient, RequestSerialized
+from kubernetes.client.api_client import ApiClient, RequestSerialized, validate_call
 from kubernetes.client.api_response import ApiResponse
 from kubernetes.client.rest import RESTResponseType
 
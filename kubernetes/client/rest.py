@@ -282,9 +282,10 @@ class RESTClientObject:
                     and not isinstance(body, (str, bytes))
                 )
                 if is_json or is_structured_yaml:
-                    request_body = None
-                    if body is not None:
-                        request_body = json.dumps(body)
+                    # Bytes were already encoded by ApiClient.serialize_body.
+                    request_body = body
+                    if body is not None and not isinstance(body, bytes):
+                        request_body = self.configuration.json_dumps(body)
                     r = self.pool_manager.request(
                         method,
                         url,
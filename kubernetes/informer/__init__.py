@@ -12,13 +12,44 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .cache import ObjectCache, _meta_namespace_key
+from .cache import (
+    NAMESPACE_INDEX,
+    JsonCodec,
+    ObjectCache,
+    _meta_namespace_key,
+    meta_namespace_index_func,
+)
+from .dispatch import BLOCK, DROP_NEWEST, DROP_OLDEST, QueuedHandler
+from . import predicates, transforms
+from .factory import SharedInformerFactory
 from .informer import SharedInformer, ADDED, MODIFIED, DELETED, BOOKMARK, ERROR
+from .workqueue import (
+    BucketRateLimiter,
+    ItemExponentialFailureRateLimiter,
+    MaxOfRateLimiter,
+    WorkQueue,
+    default_controller_rate_limiter,
+)
 
 __all__ = [
     "ObjectCache",
+    "JsonCodec",
     "_meta_namespace_key",
+    "NAMESPACE_INDEX",
+    "meta_namespace_index_func",
     "SharedInformer",
+    "SharedInformerFactory",
+    "QueuedHandler",
+    "BLOCK",
+    "DROP_NEWEST",
+    "DROP_OLDEST",
+    "predicates",
+    "transforms",
+    "WorkQueue",
+    "ItemExponentialFailureRateLimiter",
+    "BucketRateLimiter",
+    "MaxOfRateLimiter",
+    "default_controller_rate_limiter",
     "ADDED",
     "MODIFIED",
     "DELETED",
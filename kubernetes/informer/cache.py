@@ -14,7 +14,13 @@
 
 """Thread-safe in-memory store for the Kubernetes informer."""
 
+import collections
+import collections.abc
+import itertools
 import threading
+from types import MappingProxyType
+
+from .predicates import resource_version
 
 
 def _meta_namespace_key(obj):
@@ -42,46 +48,347 @@ def _meta_namespace_key(obj):
     return name
 
 
+NAMESPACE_INDEX = "namespace"
+
+
+def meta_namespace_index_func(obj):
+    """Index function returning the namespace of obj.
+
+    Cluster-scoped objects are not indexed.
+    """
+    key = _meta_namespace_key(obj)
+    if "/" in key:
+        return [key.split("/", 1)[0]]
+    return []
+
+
+class JsonCodec:
+    """Encode cached objects as compact JSON bytes.
+
+    Objects are serialized with ``api_client.sanitize_for_serialization``
+    and decoded back into *return_type* models, or left as dicts when
+    *return_type* is empty.  The JSON codec of the client configuration is
+    used in both directions.
+    """
+
+    def __init__(self, api_client, return_type=""):
+        self.api_client = api_client
+        self.return_type = return_type
+
+    def encode(self, obj):
+        data = self.api_client.configuration.json_dumps(
+            self.api_client.sanitize_for_serialization(obj))
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return data
+
+    def decode(self, data):
+        obj = self.api_client.configuration.json_loads(data)
+        if self.return_type:
+            obj = self.api_client.deserialize_data(obj, self.return_type)
+        return obj
+
+
+# A compact cache entry: the encoded object with the fields writes need,
+# so that replacing it does not decode it.  index_values maps each index
+# name to the object's values, or is None without indexers.
+_Encoded = collections.namedtuple(
+    "_Encoded", ("data", "resource_version", "index_values"))
+
+_NO_INDEX_VALUES = frozenset()
+
+
+class _DecodingMapping(collections.abc.Mapping):
+    """Read-only mapping decoding the stored values of a compact cache."""
+
+    def __init__(self, stored, load):
+        self._stored = stored
+        self._load = load
+
+    def __getitem__(self, key):
+        return self._load(key, self._stored[key])
+
+    def __iter__(self):
+        return iter(self._stored)
+
+    def __len__(self):
+        return len(self._stored)
+
+    def __contains__(self, key):
+        return key in self._stored
+
+
 class ObjectCache:
     """Thread-safe in-memory mapping of Kubernetes objects.
 
     The SharedInformer keeps this store synchronised with the API server.
     Consumers can call list() and get_by_key() from any thread safely.
+
+    get_by_key() is a single lock-free dict lookup.  snapshot() returns a
+    read-only copy of the cache, built under the writer lock at most once
+    per write and shared by every reader until the next one; list() and
+    list_keys() read it.  Objects are kept in insertion order.
+
+    Secondary indexes can be registered through ``indexers``, a mapping of
+    index name to a callable (obj) -> list of str.  Each index is kept up
+    to date as objects are stored and removed, so by_index() only touches
+    the matching objects instead of scanning the whole cache.
+
+    With a ``codec`` such as :class:`JsonCodec` each object is stored in
+    its encoded form, which for generated models is several times smaller
+    than the model, and decoded whenever a reader accesses it.  Decoded
+    objects are new copies unless ``decoded_cache_size`` keeps the most
+    recently read ones in an LRU.  The resourceVersion and index values
+    are kept next to the encoded form, so replacing or removing an object
+    does not decode the stored copy.
     """
 
-    def __init__(self, key_func=None):
+    def __init__(self, key_func=None, indexers=None, codec=None, decoded_cache_size=0):
         self._key_func = key_func if key_func is not None else _meta_namespace_key
+        self._codec = codec
+        self._decoded_cache_size = decoded_cache_size
+        # key -> (stored value, decoded object), least recently used first
+        self._decoded = collections.OrderedDict()
+        self._decoded_lock = threading.Lock()
+        # key -> object, or its encoded form with a codec
         self._objects = {}
+        # Read-only copy of _objects; None once a write makes it stale.
+        self._published = MappingProxyType({})
+        # (published copy, decoding view of it) with a codec
+        self._view = (None, None)
+        self._indexers = {}
+        # index name -> indexed value -> set of object keys
+        self._indices = {}
         self._rlock = threading.RLock()
+        if indexers:
+            self.add_indexers(indexers)
+
+    # --- storage ---
+
+    def _encode(self, obj, data):
+        """Return the stored form of obj, given its encoded data.
+
+        Callers hold self._rlock, as the index values must match the
+        registered indexers.
+        """
+        index_values = None
+        if self._indexers:
+            index_values = self._all_index_values(obj)
+        return _Encoded(data, resource_version(obj), index_values)
+
+    def _load(self, key, stored):
+        """Return the object for a stored value, decoding it if needed."""
+        if self._codec is None or stored is None:
+            return stored
+        if not self._decoded_cache_size:
+            return self._codec.decode(stored.data)
+        with self._decoded_lock:
+            hit = self._decoded.get(key)
+            if hit is not None and hit[0] is stored:
+                self._decoded.move_to_end(key)
+                return hit[1]
+        obj = self._codec.decode(stored.data)
+        with self._decoded_lock:
+            self._decoded[key] = (stored, obj)
+            self._decoded.move_to_end(key)
+            while len(self._decoded) > self._decoded_cache_size:
+                self._decoded.popitem(last=False)
+        return obj
+
+    def _forget_decoded(self, key=None):
+        if self._decoded:
+            with self._decoded_lock:
+                if key is None:
+                    self._decoded.clear()
+                else:
+                    self._decoded.pop(key, None)
+
+    # --- index maintenance (callers hold self._rlock) ---
+
+    def _index_values(self, name, obj):
+        return frozenset(self._indexers[name](obj) or ())
+
+    def _all_index_values(self, obj):
+        return {name: self._index_values(name, obj) for name in self._indexers}
+
+    def _stored_index_values(self, key, stored):
+        """Return the index values of a stored value, or {} for None.
+
+        A compact entry carries its values unless an indexer was registered
+        after it was stored; only then is it decoded.
+        """
+        if stored is None:
+            return {}
+        if self._codec is None:
+            return self._all_index_values(stored)
+        values = stored.index_values
+        if values is None or len(values) != len(self._indexers):
+            return self._all_index_values(self._load(key, stored))
+        return values
+
+    def _index(self, key, old, new):
+        """Move key from the index values in old to those in new.
+
+        old and new map index names to values, as _stored_index_values()
+        returns them.
+        """
+        for name, index in self._indices.items():
+            old_values = old.get(name, _NO_INDEX_VALUES)
+            new_values = new.get(name, _NO_INDEX_VALUES)
+            for value in old_values - new_values:
+                keys = index.get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[value]
+            for value in new_values - old_values:
+                index.setdefault(value, set()).add(key)
+
+    def _build_index(self, name, objects):
+        index = {}
+        for key, obj in objects.items():
+            for value in self._index_values(name, obj):
+                index.setdefault(value, set()).add(key)
+        return index
 
     # --- mutation helpers (called by SharedInformer) ---
 
     def _put(self, obj):
+        """Store obj and return the stored value it replaced, or None."""
         key = self._key_func(obj)
+        data = None if self._codec is None else self._codec.encode(obj)
         with self._rlock:
-            self._objects[key] = obj
+            stored = obj if data is None else self._encode(obj, data)
+            old = self._objects.get(key)
+            self._objects[key] = stored
+            self._published = None
+            if self._indices:
+                self._index(
+                    key,
+                    self._stored_index_values(key, old),
+                    self._stored_index_values(key, stored),
+                )
+        return old
 
     def _remove(self, obj):
         key = self._key_func(obj)
         with self._rlock:
-            self._objects.pop(key, None)
+            old = self._objects.pop(key, None)
+            if old is not None:
+                self._published = None
+                if self._indices:
+                    self._index(key, self._stored_index_values(key, old), {})
+        self._forget_decoded(key)
 
     def _replace_all(self, objects):
-        rebuilt = {self._key_func(o): o for o in objects}
+        live = {self._key_func(o): o for o in objects}
+        if self._codec is not None:
+            encoded = {key: self._codec.encode(obj) for key, obj in live.items()}
+        with self._rlock:
+            if self._codec is None:
+                self._objects = live
+            else:
+                self._objects = {
+                    key: self._encode(live[key], data)
+                    for key, data in encoded.items()
+                }
+            self._published = None
+            self._indices = {
+                name: self._build_index(name, live)
+                for name in self._indexers
+            }
+        self._forget_decoded()
+
+    def _stored_resource_version(self, stored):
+        """Return the resourceVersion of a stored value without decoding it."""
+        if self._codec is None or stored is None:
+            return resource_version(stored)
+        return stored.resource_version
+
+    def _encoded_values(self):
+        """Return the encoded form of every cached object, or None without a codec."""
+        if self._codec is None:
+            return None
+        return [stored.data for stored in self._stored_snapshot().values()]
+
+    # --- index registration ---
+
+    def add_indexers(self, indexers):
+        """Register additional index functions by name.
+
+        Indexes are built immediately over the objects already cached.
+        Raises ValueError if an index name is already registered.
+        """
         with self._rlock:
-            self._objects = rebuilt
+            for name in indexers:
+                if name in self._indexers:
+                    raise ValueError("index {!r} already registered".format(name))
+            for name, func in indexers.items():
+                self._indexers[name] = func
+                self._indices[name] = self._build_index(name, self.snapshot())
 
     # --- public read API ---
 
+    def _stored_snapshot(self):
+        """Return a read-only copy of the stored values, built once per write."""
+        published = self._published
+        if published is None:
+            with self._rlock:
+                published = self._published
+                if published is None:
+                    published = MappingProxyType(dict(self._objects))
+                    self._published = published
+        return published
+
+    def snapshot(self):
+        """Return a read-only key -> object mapping of the cache.
+
+        The mapping never changes once returned; later writes publish a
+        new snapshot instead.  Repeated calls between writes return the
+        same mapping without copying.  With a codec, objects are decoded
+        as the mapping is read.
+        """
+        published = self._stored_snapshot()
+        if self._codec is None:
+            return published
+        stored, view = self._view
+        if stored is not published:
+            view = _DecodingMapping(published, self._load)
+            self._view = (published, view)
+        return view
+
     def list(self):
         """Return a snapshot list of all cached objects."""
-        with self._rlock:
-            return list(self._objects.values())
+        return list(self.snapshot().values())
 
     def list_keys(self):
         """Return a snapshot list of all cache keys."""
-        with self._rlock:
-            return list(self._objects.keys())
+        return list(self._stored_snapshot())
+
+    def __len__(self):
+        """Return the number of cached objects."""
+        return len(self._objects)
+
+    def stored_bytes(self, codec=None, sample_size=64):
+        """Return the total size of the encoded objects.
+
+        The size is exact with a cache codec.  Otherwise it is estimated by
+        encoding up to *sample_size* cached objects with *codec*, or None
+        when no codec is given.
+        """
+        if self._codec is None and codec is None:
+            return None
+        objects = self._stored_snapshot()
+        if self._codec is not None:
+            return sum(len(stored.data) for stored in objects.values())
+        if not objects:
+            return 0
+        # Spread the sample over the cache rather than its oldest objects.
+        step = max(1, len(objects) // sample_size)
+        sample = list(itertools.islice(
+            objects.values(), 0, step * sample_size, step))
+        sample_bytes = sum(len(codec.encode(obj)) for obj in sample)
+        return sample_bytes * len(objects) // len(sample)
 
     def get(self, obj):
         """Look up the cached copy of obj. Returns None when absent."""
@@ -90,5 +397,34 @@ class ObjectCache:
 
     def get_by_key(self, key):
         """Look up an object by key. Returns None when absent."""
+        # A single dict lookup is atomic; _replace_all swaps the whole dict.
+        stored = self._objects.get(key)
+        if self._codec is None:
+            return stored
+        return self._load(key, stored)
+
+    def by_index(self, index_name, value):
+        """Return the cached objects whose index_name values include value.
+
+        Raises KeyError if no index named index_name is registered.
+        """
+        with self._rlock:
+            keys = self._index_for(index_name).get(value, ())
+            stored = [(k, self._objects[k]) for k in keys]
+        return [self._load(k, v) for k, v in stored]
+
+    def index_keys(self, index_name, value):
+        """Return the keys of the objects matching value in index_name."""
         with self._rlock:
-            return self._objects.get(key)
+            return list(self._index_for(index_name).get(value, ()))
+
+    def list_index_values(self, index_name):
+        """Return every value currently present in index_name."""
+        with self._rlock:
+            return list(self._index_for(index_name).keys())
+
+    def _index_for(self, index_name):
+        try:
+            return self._indices[index_name]
+        except KeyError:
+            raise KeyError("index {!r} does not exist".format(index_name)) from None
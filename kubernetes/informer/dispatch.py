@@ -0,0 +1,231 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Queued, off-thread dispatch of informer event handlers."""
+
+import logging
+import queue
+import threading
+import time
+
+from .cache import _meta_namespace_key
+
+logger = logging.getLogger(__name__)
+
+
+# Overflow policies applied when a handler queue is full
+BLOCK = "block"
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+
+_OVERFLOW_POLICIES = (BLOCK, DROP_NEWEST, DROP_OLDEST)
+
+# Queued by stop() to end a worker once the items before it are handled.
+_STOP = object()
+
+
+class QueuedHandler:
+    """Run an event handler on worker threads fed by a bounded queue.
+
+    SharedInformer invokes handlers on its watch thread, so a slow handler
+    delays event intake.  Registering a QueuedHandler instead only enqueues
+    the object on that thread::
+
+        handler = QueuedHandler(reconcile, workers=4)
+        for event_type in (ADDED, MODIFIED, DELETED):
+            informer.add_event_handler(event_type, handler)
+
+    The handler is called with the object only, not the event type, so an
+    instance registered for several event types, as above, must be
+    level-triggered: it reconciles the object's current state, e.g. from
+    the informer's cache, whatever change was observed.  Such an instance
+    shares one queue between those types, so ordering holds across them.
+    Register a separate instance per event type when the handler needs to
+    tell them apart.
+
+    Workers start on the first event.  The caller owns the handler and
+    stops it with :meth:`stop`, typically after stopping every informer
+    it is registered with; :meth:`SharedInformer.stop` leaves it running.
+
+    Parameters
+    ----------
+    handler:
+        Callable invoked with each event object, without its event type.
+    max_queue:
+        Capacity of each queue.
+    workers:
+        Number of worker threads.
+    ordered:
+        When True, objects are sharded by key so that events for one object
+        are handled in order by a single worker, each worker with its own
+        queue.  When False, all workers take from one shared queue and
+        events may be handled in any order.
+    overflow:
+        What to do when a queue is full: :data:`BLOCK` the informer until
+        there is room, :data:`DROP_NEWEST` to discard the incoming event or
+        :data:`DROP_OLDEST` to discard the oldest queued event.
+    key_func:
+        Optional callable (obj) -> str used to shard ordered events.
+        Defaults to namespace/name.
+    """
+
+    def __init__(
+        self,
+        handler,
+        max_queue=1000,
+        workers=1,
+        ordered=True,
+        overflow=BLOCK,
+        key_func=None,
+    ):
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(
+                "Unknown overflow policy {!r}. Use one of: {}".format(
+                    overflow, ", ".join(_OVERFLOW_POLICIES),
+                )
+            )
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        self._handler = handler
+        self._workers = workers
+        self._ordered = ordered
+        self._overflow = overflow
+        self._key_func = key_func if key_func is not None else _meta_namespace_key
+        self._queues = [
+            queue.Queue(maxsize=max_queue)
+            for _ in range(workers if ordered else 1)
+        ]
+        self._threads = []
+        self._lock = threading.Lock()
+        self._processed = 0
+        self._dropped = 0
+        self._failed = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def __call__(self, obj):
+        self._ensure_started()
+        q = self._queue_for(obj)
+        if self._overflow == BLOCK:
+            q.put(obj)
+            return
+        while True:
+            try:
+                q.put_nowait(obj)
+                return
+            except queue.Full:
+                pass
+            if self._overflow == DROP_NEWEST:
+                self._count_dropped()
+                return
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                continue
+            q.task_done()
+            self._count_dropped()
+
+    def _queue_for(self, obj):
+        if len(self._queues) == 1:
+            return self._queues[0]
+        try:
+            key = self._key_func(obj)
+        except Exception:
+            key = ""
+        return self._queues[hash(key) % len(self._queues)]
+
+    def _count_dropped(self):
+        with self._lock:
+            self._dropped += 1
+
+    def _ensure_started(self):
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for n in range(self._workers):
+                q = self._queues[n if self._ordered else 0]
+                t = threading.Thread(
+                    target=self._work,
+                    args=(q,),
+                    name="QueuedHandler-{}".format(n),
+                    daemon=True,
+                )
+                t.start()
+                self._threads.append(t)
+
+    def _work(self, q):
+        while True:
+            obj = q.get()
+            try:
+                if obj is _STOP:
+                    return
+                start = time.monotonic()
+                failed = False
+                try:
+                    self._handler(obj)
+                except Exception:
+                    failed = True
+                    logger.exception("Exception in queued informer handler")
+                elapsed = time.monotonic() - start
+                with self._lock:
+                    self._processed += 1
+                    self._failed += failed
+                    self._latency_total += elapsed
+                    self._latency_max = max(self._latency_max, elapsed)
+            finally:
+                q.task_done()
+
+    # --- public API ---
+
+    def join(self):
+        """Block until every queued event has been handled."""
+        for q in self._queues:
+            q.join()
+
+    def stop(self):
+        """Handle the events already queued, then stop the workers.
+
+        The handler starts again on its next event.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        if not threads:
+            return
+        for n in range(len(threads)):
+            self._queues[n if self._ordered else 0].put(_STOP)
+        for t in threads:
+            t.join()
+
+    def metrics(self):
+        """Return a dict of queue and handler statistics.
+
+        ``queue_depth`` is the number of events waiting, ``processed``,
+        ``failed`` and ``dropped`` count events since creation, and
+        ``latency_avg``/``latency_max`` are handler run times in seconds.
+        """
+        depth = sum(q.qsize() for q in self._queues)
+        with self._lock:
+            processed = self._processed
+            return {
+                "queue_depth": depth,
+                "processed": processed,
+                "failed": self._failed,
+                "dropped": self._dropped,
+                "latency_avg": self._latency_total / processed if processed else 0.0,
+                "latency_max": self._latency_max,
+            }
@@ -0,0 +1,139 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Factory sharing one SharedInformer per watched resource."""
+
+import functools
+import threading
+import time
+
+from kubernetes.dynamic.resource import Resource
+
+from .informer import SharedInformer
+
+
+def _host(api_client):
+    configuration = getattr(api_client, "configuration", None)
+    return getattr(configuration, "host", None)
+
+
+def _list_func_key(list_func):
+    """Return a hashable identity of what *list_func* lists.
+
+    Methods of separate API objects, and equal partials of them, share an
+    identity when they call the same method on the same API server.  Other
+    callables are their own identity.
+    """
+    if isinstance(list_func, Resource):
+        return (Resource, list_func.group_version, list_func.kind,
+                _host(getattr(list_func.client, "client", None)))
+    func, args, keywords = list_func, (), {}
+    while isinstance(func, functools.partial):
+        args = func.args + args
+        keywords = {**func.keywords, **keywords}
+        func = func.func
+    owner = getattr(func, "__self__", None)
+    api_client = getattr(owner, "api_client", None)
+    if api_client is None:
+        return list_func
+    key = (type(owner), func.__name__, _host(api_client),
+           args, tuple(sorted(keywords.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return list_func
+    return key
+
+
+class SharedInformerFactory:
+    """Hand out one shared :class:`SharedInformer` per watched resource.
+
+    Components of a process that watch the same resource receive the same
+    informer, and with it a single watch connection and object cache::
+
+        factory = SharedInformerFactory(resync_period=300)
+        core = CoreV1Api()
+        pods = factory.informer_for(core.list_namespaced_pod, namespace="default")
+        pods.add_event_handler(ADDED, on_pod_added)
+        factory.start_all()
+        factory.wait_for_cache_sync(timeout=30)
+
+    Informers are keyed by list function, namespace and selectors.  List
+    functions are compared by API class, method name, bound arguments and
+    API server host, so consumers that each create their own API object
+    (e.g. ``CoreV1Api()``) still share one informer.
+
+    Keyword arguments (e.g. ``resync_period``, ``page_size``) are passed
+    to every informer the factory creates.
+    """
+
+    def __init__(self, **informer_kwargs):
+        self._informer_kwargs = informer_kwargs
+        self._informers = {}
+        self._lock = threading.Lock()
+
+    def informer_for(
+        self,
+        list_func,
+        namespace=None,
+        label_selector=None,
+        field_selector=None,
+    ):
+        """Return the shared informer for a resource, creating it if needed.
+
+        Informers created after :meth:`start_all` are started by the next
+        call to :meth:`start_all`.
+        """
+        key = (_list_func_key(list_func), namespace, label_selector, field_selector)
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is None:
+                informer = SharedInformer(
+                    list_func,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                    **self._informer_kwargs,
+                )
+                self._informers[key] = informer
+            return informer
+
+    def informers(self):
+        """Return a list of the informers created so far."""
+        with self._lock:
+            return list(self._informers.values())
+
+    def start_all(self):
+        """Start every informer that is not already running."""
+        for informer in self.informers():
+            informer.start()
+
+    def stop_all(self):
+        """Stop every informer."""
+        for informer in self.informers():
+            informer.stop()
+
+    def wait_for_cache_sync(self, timeout=None):
+        """Block until every informer has synced or *timeout* seconds pass.
+
+        Returns True when all informers have synced.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for informer in self.informers():
+            remaining = None
+            if deadline is not None:
+                remaining = max(0, deadline - time.monotonic())
+            if not informer.wait_for_sync(timeout=remaining):
+                return False
+        return True
@@ -19,14 +19,23 @@ ObjectCache in sync with the Kubernetes API server and notifies
 registered event-handler callbacks.
 """
 
+import functools
 import logging
+import os
 import threading
 import time
 
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.configuration import Configuration
 from kubernetes.client.exceptions import ApiException
+from kubernetes.dynamic.resource import Resource
 from kubernetes.watch import Watch
+from kubernetes.watch.watch import _bound_api_client, is_initial_events_end
 
-from .cache import ObjectCache, _meta_namespace_key
+from .cache import JsonCodec, ObjectCache, _meta_namespace_key
+from .metrics import InformerMetrics
+from .persistence import load_snapshot, save_snapshot
+from .predicates import resource_version
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +47,88 @@ DELETED = "DELETED"
 BOOKMARK = "BOOKMARK"
 ERROR = "ERROR"
 
+# Status codes with which servers lacking the WatchList feature reject a
+# watch that sets sendInitialEvents.
+_WATCH_LIST_UNSUPPORTED = (400, 422)
+
+# Page size of the LIST that replaces an unsupported watch-list sync when
+# no page_size is set.
+_WATCH_LIST_FALLBACK_PAGE_SIZE = 500
+
+
+def _continue_token(meta):
+    """Return the continue token of list metadata, or None on the last page."""
+    if isinstance(meta, dict):
+        token = meta.get("continue")
+    else:
+        token = getattr(meta, "var_continue", None) or getattr(meta, "_continue", None)
+    if isinstance(token, str) and token:
+        return token
+    return None
+
+
+def _list_response(resp):
+    """Return the items, resourceVersion and continue token of a list response.
+
+    Handles generated list models and the dicts returned by
+    CustomObjectsApi and raw dynamic lists.
+    """
+    if isinstance(resp, dict):
+        meta = resp.get("metadata") or {}
+        return resp.get("items") or [], meta.get("resourceVersion"), _continue_token(meta)
+    meta = getattr(resp, "metadata", None)
+    if meta is None:
+        return getattr(resp, "items", []) or [], None, None
+    return (
+        getattr(resp, "items", []) or [],
+        getattr(meta, "resource_version", None),
+        _continue_token(meta),
+    )
+
+
+def _dynamic_list_func(resource):
+    """Return a list_func listing and watching a dynamic *resource* as dicts."""
+    dynamic_client = resource.client
+
+    def list_func(**kwargs):
+        resp = dynamic_client.get(resource, serialize=False, **kwargs)
+        if kwargs.get("watch"):
+            return resp  # streamed by Watch
+        return dynamic_client.client.configuration.json_loads(resp.data)
+
+    return list_func
+
+
+def _callable_name(func):
+    """Return a name for *func* that is stable across processes."""
+    if func is None:
+        return None
+    if isinstance(func, functools.partial):
+        args = [repr(a) for a in func.args]
+        args += ["{}={!r}".format(k, v) for k, v in sorted(func.keywords.items())]
+        return "{}({})".format(_callable_name(func.func), ", ".join(args))
+    if isinstance(func, Resource):
+        return "{}/{}".format(func.group_version, func.kind)
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    module = getattr(func, "__module__", None)
+    return "{}.{}".format(module, name) if module else name
+
+
+def _raw_list_func(list_func, api_client):
+    """Return a list_func whose LIST responses are decoded dicts, not models."""
+    configuration = (
+        api_client.configuration if api_client is not None
+        else Configuration.get_default()
+    )
+
+    def raw_list_func(**kwargs):
+        if kwargs.get("watch"):
+            return list_func(**kwargs)  # streamed by Watch
+        resp = list_func(_preload_content=False, **kwargs)
+        return configuration.json_loads(resp.data)
+
+    return raw_list_func
+
 
 class SharedInformer:
     """Watch a Kubernetes resource and maintain a local cache.
@@ -52,13 +143,57 @@ class SharedInformer:
     list_func:
         Bound API method used for the initial list **and** as the watch
         source.  It must accept a watch keyword argument (e.g.
-        CoreV1Api().list_namespaced_pod).
+        CoreV1Api().list_namespaced_pod).  A
+        :class:`kubernetes.dynamic.Resource` is also accepted; it is listed
+        and watched through its DynamicClient as plain dicts.
     namespace:
         Kubernetes namespace to watch.  Pass None for cluster-scoped
         or all-namespace list functions.
     resync_period:
         How often (seconds) to perform a full re-list from the API server.
         Defaults to 0 which disables periodic resyncs.
+    resync_from_cache:
+        When True, a periodic resync replays the cached objects to the
+        MODIFIED handlers instead of re-listing, so it makes no API call.
+        A full re-list then only happens after a 410 Gone response.
+    page_size:
+        When set, LIST requests are split into pages of at most this many
+        objects using ``limit`` and ``_continue``.  Each page is stored in
+        the cache as it arrives, so only one page of the response is held
+        in memory at a time.  Defaults to None, a single unbounded LIST.
+    transform:
+        Optional callable (obj) -> obj applied to every listed or watched
+        object before it is cached and handed to handlers, e.g. to drop
+        fields that are never read.  See :mod:`kubernetes.informer.transforms`.
+    snapshot_path:
+        Optional file to which the cache and its resource version are
+        saved every ``snapshot_period`` seconds and on :meth:`stop`.  When
+        the file exists at start, the cache is loaded from it and the
+        watch resumes from the saved resource version instead of listing.
+        A snapshot saved for another resource, namespace, selector, key
+        function or transform is ignored.
+    snapshot_period:
+        Seconds between snapshots.  Defaults to 60; 0 only saves on stop.
+    compact_cache:
+        When True, the cache keeps each object as compact JSON bytes and
+        decodes it into a model whenever it is read, trading CPU on reads
+        for a much smaller cache.  Handlers still receive the decoded
+        objects of each event.
+    decoded_cache_size:
+        With ``compact_cache``, how many recently read objects to keep
+        decoded.  Defaults to 0, decoding on every read.
+    metrics_hook:
+        Optional callable (name, value, labels) called with each metric
+        observation, e.g. to feed a Prometheus exporter.  See
+        :mod:`kubernetes.informer.metrics` and :meth:`metrics`.
+    deserialize:
+        When False, watch events and listed items are kept as the dicts
+        decoded from JSON instead of being built into models, as for
+        ``CustomObjectsApi`` list functions, whose objects have no model.
+        LIST requests are then made with ``_preload_content=False`` and
+        their bodies decoded directly, so generated list functions also
+        fill the cache with dicts only.  Always False when ``list_func``
+        is a dynamic ``Resource``.
     label_selector:
         Optional label selector string forwarded to the API server.
     field_selector:
@@ -66,6 +201,21 @@ class SharedInformer:
     key_func:
         Optional callable (obj) -> str used to key objects in the
         cache.  Defaults to namespace/name.
+    indexers:
+        Optional mapping of index name to callable (obj) -> list of str
+        registered as secondary indexes on the cache, e.g.
+        ``{NAMESPACE_INDEX: meta_namespace_index_func}``.  Look objects up
+        with ``informer.cache.by_index(name, value)``.
+    watch_list:
+        When True, populate the cache from a single watch opened with
+        ``send_initial_events=True`` instead of a full LIST.  Objects are
+        streamed into the cache one at a time and the
+        ``k8s.io/initial-events-end`` BOOKMARK marks the sync point.  Falls
+        back to a paged LIST (``page_size``, else 500 objects per page) if
+        the server rejects the request, or ends the stream without that
+        BOOKMARK as servers without WatchList support do.  With a
+        ``resync_period`` the watch is reopened after the BOOKMARK, so the
+        following watches time out and resync as usual.
     """
 
     def __init__(
@@ -76,21 +226,83 @@ class SharedInformer:
         label_selector=None,
         field_selector=None,
         key_func=None,
+        watch_list=False,
+        indexers=None,
+        resync_from_cache=False,
+        page_size=None,
+        transform=None,
+        snapshot_path=None,
+        snapshot_period=60,
+        compact_cache=False,
+        decoded_cache_size=0,
+        metrics_hook=None,
+        deserialize=True,
     ):
+        resource = _callable_name(list_func)
+        if isinstance(list_func, Resource):
+            self._api_client = list_func.client.client
+            list_func = _dynamic_list_func(list_func)
+            deserialize = False
+        else:
+            self._api_client = _bound_api_client(list_func)
+            if not deserialize:
+                list_func = _raw_list_func(list_func, self._api_client)
         self._list_func = list_func
+        self._deserialize = deserialize
         self._namespace = namespace
         self._resync_period = resync_period
         self._label_selector = label_selector
         self._field_selector = field_selector
-
-        self._cache = ObjectCache(key_func=key_func)
+        self._watch_list = watch_list
+        self._resync_from_cache = resync_from_cache
+        self._page_size = page_size
+        self._transform = transform
+        self._snapshot_path = snapshot_path
+        self._snapshot_period = snapshot_period
+        self._codec = None
+        if snapshot_path or compact_cache:
+            # Encodes objects of the model type list_func returns.
+            watch = Watch(api_client=self._api_client)
+            return_type = watch.get_return_type(list_func) if deserialize else ""
+            self._codec = JsonCodec(watch.api_client, return_type)
+        # A snapshot is only loaded back by an informer with this identity.
+        self._snapshot_identity = {
+            "resource": resource,
+            "namespace": namespace,
+            "labelSelector": label_selector,
+            "fieldSelector": field_selector,
+            "keyFunc": _callable_name(key_func),
+            "transform": _callable_name(transform),
+            "deserialize": deserialize,
+        }
+
+        self._cache = ObjectCache(
+            key_func=key_func,
+            indexers=indexers,
+            codec=self._codec if compact_cache else None,
+            decoded_cache_size=decoded_cache_size,
+        )
         self._handlers = {ADDED: [], MODIFIED: [], DELETED: [], BOOKMARK: [], ERROR: []}
         self._handler_lock = threading.Lock()
+        self._metrics = InformerMetrics(metrics_hook)
+        # Sizes the cache for metrics() when there is no _codec.
+        self._sizing_codec = None
 
         self._watch = None
         self._thread = None
+        self._snapshot_thread = None
         self._stop_event = threading.Event()
+        self._synced = threading.Event()  # set once the cache is first populated
         self._resource_version = None  # most recent RV seen; None forces a full re-list
+        # RV whose events are all applied to the cache; saved with snapshots.
+        self._committed_rv = None
+
+        # Watch-list bookkeeping, only meaningful while the initial events
+        # of a send_initial_events watch are still arriving.
+        self._initial_events_pending = False
+        self._initial_events_started = None
+        self._initial_old_keys = None
+        self._initial_keys = None
 
     # ---------------------------------------------------------------- #
     # Public API                                                        #
@@ -101,7 +313,7 @@ class SharedInformer:
         """The :class:`ObjectCache` maintained by this informer."""
         return self._cache
 
-    def add_event_handler(self, event_type, handler):
+    def add_event_handler(self, event_type, handler, predicate=None):
         """Register a callback for a specific event type.
 
         Parameters
@@ -111,7 +323,12 @@ class SharedInformer:
             :data:`BOOKMARK` or :data:`ERROR`.
         handler:
             Callable invoked with the event object (or the raw exception for
-            ERROR events).
+            ERROR events).  Handlers run on the watch thread; wrap slow ones
+            in a :class:`QueuedHandler` to run them on worker threads.
+        predicate:
+            Optional callable (old, new) -> bool, only for MODIFIED.  The
+            handler is skipped when it returns False, e.g.
+            :func:`~kubernetes.informer.predicates.generation_changed`.
         """
         if event_type not in self._handlers:
             raise ValueError(
@@ -119,8 +336,10 @@ class SharedInformer:
                     event_type, ", ".join(sorted(self._handlers)),
                 )
             )
+        if predicate is not None and event_type != MODIFIED:
+            raise ValueError("predicate is only supported for MODIFIED handlers")
         with self._handler_lock:
-            self._handlers[event_type].append(handler)
+            self._handlers[event_type].append((handler, predicate))
 
     def remove_event_handler(self, event_type, handler):
         """Deregister a previously registered *handler*.
@@ -128,10 +347,49 @@ class SharedInformer:
         No-op if *handler* is not registered.
         """
         with self._handler_lock:
-            try:
-                self._handlers[event_type].remove(handler)
-            except (KeyError, ValueError):
-                pass
+            handlers = self._handlers.get(event_type, [])
+            for i, (fn, _) in enumerate(handlers):
+                if fn == handler:
+                    del handlers[i]
+                    break
+
+    def has_synced(self):
+        """Return True once the initial list (or watch-list sync) has completed."""
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout=None):
+        """Block until :meth:`has_synced` is True or *timeout* seconds pass.
+
+        Returns the value of :meth:`has_synced`.
+        """
+        return self._synced.wait(timeout=timeout)
+
+    def metrics(self):
+        """Return a dict of informer statistics.
+
+        ``events`` counts watch events by type and ``event_lag_seconds``
+        summarises how far they trailed the server's last write of their
+        object.  ``handler_seconds`` summarises handler run times by event
+        type; summaries hold ``count``, ``sum`` and ``max``.  ``reconnects``
+        counts reopened watches, ``expired_relists`` those ending in 410
+        Gone, and ``lists`` the completed lists, whose durations in seconds
+        are ``initial_list_seconds`` for the first and ``last_list_seconds``.
+        ``cache_objects`` is the number of cached objects and
+        ``cache_bytes`` their size as JSON: exact with ``compact_cache``,
+        else estimated from a sample of the cached objects.  Lag is not
+        recorded for the initial events of a watch-list sync, whose
+        objects were written before the sync began.
+        """
+        stats = self._metrics.as_dict()
+        stats["cache_objects"] = len(self._cache)
+        codec = self._codec
+        if codec is None:
+            codec = self._sizing_codec
+            if codec is None:
+                codec = self._sizing_codec = JsonCodec(
+                    self._api_client or ApiClient())
+        stats["cache_bytes"] = self._cache.stored_bytes(codec)
+        return stats
 
     def start(self):
         """Start the background watch loop in a daemon thread.
@@ -148,15 +406,33 @@ class SharedInformer:
             daemon=True,
         )
         self._thread.start()
+        if self._snapshot_path and self._snapshot_period > 0:
+            self._snapshot_thread = threading.Thread(
+                target=self._snapshot_loop,
+                name="SharedInformer-snapshot",
+                daemon=True,
+            )
+            self._snapshot_thread.start()
 
     def stop(self):
-        """Ask the background watch loop to stop and join the thread."""
+        """Ask the background watch loop to stop and join the thread.
+
+        With a ``snapshot_path`` a final snapshot of the cache is written.
+        Registered :class:`QueuedHandler` instances keep running, as they
+        may be shared with other informers; stop them with their own
+        :meth:`~QueuedHandler.stop`.
+        """
         self._stop_event.set()
         if self._watch is not None:
             self._watch.stop()
         if self._thread is not None:
             self._thread.join()
         self._thread = None
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
+        if self._snapshot_path:
+            self._save_snapshot()
 
     # ---------------------------------------------------------------- #
     # Internal helpers                                                  #
@@ -172,23 +448,46 @@ class SharedInformer:
             kw["field_selector"] = self._field_selector
         return kw
 
-    def _fire(self, event_type, obj):
+    def _fire(self, event_type, obj, old=None):
         """Execute all registered callbacks for *event_type*, passing *obj*.
 
-        Callbacks are invoked sequentially on the informer's background thread.
-        Any exception raised by an individual handler is logged and swallowed so
+        Callbacks are invoked sequentially on the informer's background thread;
+        a :class:`QueuedHandler` only enqueues *obj* there.  Handlers whose
+        predicate rejects (*old*, *obj*) are skipped.  Any exception raised
+        by an individual handler or predicate is logged and swallowed so
         that remaining handlers still run.
         """
         with self._handler_lock:
             handlers = list(self._handlers.get(event_type, []))
-        for fn in handlers:
+        for fn, predicate in handlers:
             try:
-                fn(obj)
+                if predicate is not None and not predicate(old, obj):
+                    continue
+                started = self._metrics.clock()
+                try:
+                    fn(obj)
+                finally:
+                    self._metrics.handler(event_type, started)
             except Exception:
                 logger.exception(
                     "Exception in informer handler for %s", event_type
                 )
 
+    def _fire_modified(self, key, old_stored, new):
+        """Fire MODIFIED unless *new* has the resourceVersion of *old_stored*.
+
+        *old_stored* is the cache's stored value for *key* before *new*
+        replaced it.  It is only decoded for handlers with a predicate.
+        """
+        rv = resource_version(new)
+        if rv is not None and rv == self._cache._stored_resource_version(old_stored):
+            return
+        with self._handler_lock:
+            needs_old = any(
+                predicate is not None for _, predicate in self._handlers[MODIFIED])
+        old = self._cache._load(key, old_stored) if needs_old else None
+        self._fire(MODIFIED, new, old)
+
     def _initial_list(self):
         """List all objects and populate the cache, firing ADDED/MODIFIED/DELETED events.
 
@@ -196,12 +495,22 @@ class SharedInformer:
         On subsequent calls (resync or after a 410 Gone) the new list is
         diffed against the existing cache:
         * Items absent from the new list fire DELETED.
-        * Items present in both fire MODIFIED.
+        * Items present in both fire MODIFIED, unless their resourceVersion
+          is unchanged.
         * Items only in the new list fire ADDED.
+
+        With a ``page_size`` the list is fetched by :meth:`_paged_list`.
         """
+        started = self._metrics.clock()
+        if self._page_size:
+            self._paged_list()
+            self._metrics.list_done(started)
+            return
         kw = self._build_kwargs()
         resp = self._list_func(**kw)
-        items = getattr(resp, "items", []) or []
+        items, rv, _ = _list_response(resp)
+        if self._transform is not None:
+            items = [self._transform(item) for item in items]
 
         # Build key → item map for incoming items.
         new_items_map = {}
@@ -209,31 +518,184 @@ class SharedInformer:
             key = self._cache._key_func(item)
             new_items_map[key] = item
 
-        # Snapshot the old keys before replacing the cache.
-        old_keys = set(self._cache.list_keys())
+        # Keep the old stored values before replacing the cache.
+        old_stored = self._cache._objects
 
         # Fire DELETED for items no longer present in the new list.
-        for key in old_keys:
+        for key in old_stored:
             if key not in new_items_map:
-                old_obj = self._cache.get_by_key(key)
-                if old_obj is not None:
-                    self._fire(DELETED, old_obj)
+                self._fire(DELETED, self._cache._load(key, old_stored[key]))
 
         # Atomically replace the cache.
         self._cache._replace_all(items)
 
-        # Fire ADDED for genuinely new items, MODIFIED for existing ones.
+        # Fire ADDED for genuinely new items, MODIFIED for changed ones.
         for key, item in new_items_map.items():
-            if key in old_keys:
-                self._fire(MODIFIED, item)
+            if key in old_stored:
+                self._fire_modified(key, old_stored[key], item)
             else:
                 self._fire(ADDED, item)
 
+        self._resource_version = rv or "0"
+        self._committed_rv = self._resource_version
+        self._synced.set()
+        self._metrics.list_done(started)
+
+    def _paged_list(self):
+        """List all objects page by page, updating the cache as pages arrive.
+
+        Each item fires ADDED, or MODIFIED when it is already cached with a
+        different resourceVersion, as soon as its page is stored.  Cached
+        objects missing from every page fire DELETED after the last page.
+        If a continue token expires (410 Gone), the list restarts from the
+        first page so that the result reflects a single consistent snapshot.
+        """
+        kw = self._build_kwargs()
+        kw["limit"] = self._page_size
+        seen = set()
+        token = None
         rv = None
-        meta = getattr(resp, "metadata", None)
-        if meta is not None:
-            rv = getattr(meta, "resource_version", None)
+        while True:
+            if token:
+                kw["_continue"] = token
+            else:
+                kw.pop("_continue", None)
+            try:
+                resp = self._list_func(**kw)
+            except ApiException as exc:
+                if exc.status != 410 or not token:
+                    raise
+                logger.warning("List continue token expired; restarting list")
+                seen = set()
+                token = None
+                continue
+            items, page_rv, token = _list_response(resp)
+            for item in items:
+                if self._transform is not None:
+                    item = self._transform(item)
+                key = self._cache._key_func(item)
+                seen.add(key)
+                old_stored = self._cache._put(item)
+                if old_stored is None:
+                    self._fire(ADDED, item)
+                else:
+                    self._fire_modified(key, old_stored, item)
+            rv = page_rv or rv
+            # Let the page be freed before the next one is requested.
+            resp = items = None
+            if not token:
+                break
+
+        for key in set(self._cache.list_keys()) - seen:
+            old_obj = self._cache.get_by_key(key)
+            if old_obj is not None:
+                self._cache._remove(old_obj)
+                self._fire(DELETED, old_obj)
         self._resource_version = rv or "0"
+        self._committed_rv = self._resource_version
+        self._synced.set()
+
+    def _replay_cache(self):
+        """Fire MODIFIED for every cached object without calling the API server.
+
+        The replayed object is passed as both old and new, so handlers with
+        a change predicate such as ``generation_changed`` are skipped.
+        """
+        for obj in self._cache.list():
+            self._fire(MODIFIED, obj, obj)
+
+    def _begin_initial_events(self):
+        """Prepare to diff the cache against a watch-list initial state."""
+        self._initial_events_pending = True
+        self._initial_events_started = self._metrics.clock()
+        self._initial_old_keys = set(self._cache.list_keys())
+        self._initial_keys = set()
+
+    def _on_initial_event(self, obj):
+        """Store one synthetic ADDED event of a watch-list initial state.
+
+        Objects already cached before the sync fire MODIFIED, mirroring
+        :meth:`_initial_list`.
+        """
+        key = self._cache._key_func(obj)
+        self._initial_keys.add(key)
+        old_stored = self._cache._put(obj)
+        if key in self._initial_old_keys and old_stored is not None:
+            self._fire_modified(key, old_stored, obj)
+        else:
+            self._fire(ADDED, obj)
+
+    def _fall_back_to_list(self):
+        """Sync with paged LISTs from now on instead of watch-list watches."""
+        self._watch_list = False
+        if not self._page_size:
+            self._page_size = _WATCH_LIST_FALLBACK_PAGE_SIZE
+
+    def _finish_initial_events(self):
+        """Drop cached objects absent from the watch-list initial state."""
+        for key in self._initial_old_keys - self._initial_keys:
+            old_obj = self._cache.get_by_key(key)
+            if old_obj is not None:
+                self._cache._remove(old_obj)
+                self._fire(DELETED, old_obj)
+        self._initial_events_pending = False
+        self._initial_old_keys = None
+        self._initial_keys = None
+        self._synced.set()
+        self._metrics.list_done(self._initial_events_started)
+
+    def _save_snapshot(self):
+        """Write the cache and the resource version it reflects to disk."""
+        # Read the committed RV before the cache: the cache may then hold
+        # later events, which a resumed watch replays harmlessly.
+        rv = self._committed_rv
+        if rv is None:
+            return
+        # A compact cache already holds each object as the JSON line the
+        # snapshot needs.
+        encoded = self._cache._encoded_values()
+        objects = encoded if encoded is not None else self._cache.snapshot().values()
+        try:
+            save_snapshot(
+                self._snapshot_path, objects, rv, self._codec.api_client,
+                identity=self._snapshot_identity, encoded=encoded is not None)
+        except Exception:
+            logger.exception("Error writing informer snapshot %s", self._snapshot_path)
+
+    def _load_snapshot(self):
+        """Populate the cache from the snapshot file, if there is one.
+
+        Every loaded object fires ADDED and the informer reports synced;
+        the watch then resumes from the saved resource version.  An
+        unreadable snapshot, or one saved by an informer of another
+        resource, namespace, selector, key function or transform, is
+        logged and ignored.
+        """
+        if not os.path.exists(self._snapshot_path):
+            return
+        try:
+            rv, objects = load_snapshot(
+                self._snapshot_path, self._codec.return_type, self._codec.api_client,
+                identity=self._snapshot_identity)
+        except Exception:
+            logger.warning(
+                "Ignoring informer snapshot %s", self._snapshot_path,
+                exc_info=True,
+            )
+            return
+        if not rv:
+            return
+        self._cache._replace_all(objects)
+        for obj in objects:
+            self._fire(ADDED, obj)
+        self._resource_version = rv
+        self._committed_rv = rv
+        self._synced.set()
+
+    def _snapshot_loop(self):
+        """Write a snapshot every ``snapshot_period`` seconds until stopped."""
+        while not self._stop_event.wait(timeout=self._snapshot_period):
+            self._save_snapshot()
 
     def _run_loop(self):
         """Background loop: list then watch, reconnect on errors.
@@ -243,10 +705,21 @@ class SharedInformer:
         reconnects the most recent ``resourceVersion`` is reused so that no
         events are missed and the API server does not need to send a full
         object snapshot.
+
+        In watch-list mode the re-list is replaced by a watch that streams
+        the initial state; ``self._resource_version`` stays ``None`` until
+        its initial-events-end BOOKMARK arrives.
+
+        With a ``snapshot_path`` the first start loads the cache from the
+        saved snapshot and resumes the watch from its resource version, so
+        a full list is only needed if that version has expired.
         """
+        if self._snapshot_path and self._resource_version is None:
+            self._load_snapshot()
         while not self._stop_event.is_set():
+            watch_list = self._resource_version is None and self._watch_list
             # Full re-list only when we have no resource version to resume from.
-            if self._resource_version is None:
+            if self._resource_version is None and not watch_list:
                 try:
                     self._initial_list()
                 except Exception as exc:
@@ -257,15 +730,26 @@ class SharedInformer:
 
             # Watch loop
             last_resync = time.monotonic()
-            self._watch = Watch()
+            if self._deserialize:
+                self._watch = Watch(api_client=self._api_client)
+            else:
+                # "object" leaves each event object as its decoded dict.
+                self._watch = Watch(return_type="object", api_client=self._api_client)
             kw = self._build_kwargs()
-            kw["resource_version"] = self._resource_version
+            if watch_list:
+                self._begin_initial_events()
+                kw["send_initial_events"] = True
+                kw["resource_version_match"] = "NotOlderThan"
+                kw["allow_watch_bookmarks"] = True
+            else:
+                kw["resource_version"] = self._resource_version
             # When a resync period is configured, set a matching server-side
             # watch timeout so that the stream exits after resync_period seconds
             # even if no events arrive.  Without this, a quiet period longer
             # than resync_period would never trigger a resync because the check
-            # below only runs when the generator yields an event.
-            if self._resync_period > 0:
+            # below only runs when the generator yields an event.  A watch-list
+            # sync is not cut short, as it would have to start over.
+            if self._resync_period > 0 and not watch_list:
                 kw["timeout_seconds"] = max(1, int(self._resync_period))
             try:
                 for event in self._watch.stream(self._list_func, **kw):
@@ -273,18 +757,33 @@ class SharedInformer:
                         break
                     evt_type = event.get("type")
                     obj = event.get("object")
+                    # Synthetic watch-list ADDED events carry objects written
+                    # long before, so their age is not lag.
+                    self._metrics.event(
+                        evt_type,
+                        obj if evt_type in (ADDED, MODIFIED, DELETED)
+                        and not self._initial_events_pending else None)
+                    if self._transform is not None and evt_type in (ADDED, MODIFIED, DELETED):
+                        obj = self._transform(obj)
                     # Sync the most recent resource version from the Watch
                     # instance (updated by unmarshal_event before yielding).
                     # Do this before firing handlers so consumers that wake on
                     # an event immediately see the advanced resource version.
-                    if self._watch is not None and self._watch.resource_version:
+                    if (
+                        not self._initial_events_pending
+                        and self._watch is not None
+                        and self._watch.resource_version
+                    ):
                         self._resource_version = self._watch.resource_version
-                    if evt_type == ADDED:
+                    if evt_type == ADDED and self._initial_events_pending:
+                        self._on_initial_event(obj)
+                    elif evt_type == ADDED:
                         self._cache._put(obj)
                         self._fire(ADDED, obj)
                     elif evt_type == MODIFIED:
-                        self._cache._put(obj)
-                        self._fire(MODIFIED, obj)
+                        old_stored = self._cache._put(obj)
+                        self._fire_modified(
+                            self._cache._key_func(obj), old_stored, obj)
                     elif evt_type == DELETED:
                         self._cache._remove(obj)
                         self._fire(DELETED, obj)
@@ -292,9 +791,25 @@ class SharedInformer:
                         # BOOKMARK events carry an updated resource version but
                         # no object state change; the Watch instance already
                         # records the new resource_version internally.
+                        if self._initial_events_pending and is_initial_events_end(event):
+                            self._finish_initial_events()
+                            self._resource_version = self._watch.resource_version
                         self._fire(BOOKMARK, event.get("raw_object", obj))
                     elif evt_type == ERROR:
                         self._fire(ERROR, obj)
+                    if not self._initial_events_pending:
+                        self._committed_rv = self._resource_version
+                        if watch_list and self._resync_period > 0:
+                            # The watch-list stream has no timeout; reopen a
+                            # watch that has one so that resyncs happen.
+                            break
+                else:
+                    if self._initial_events_pending and not self._stop_event.is_set():
+                        logger.warning(
+                            "Watch-list stream ended without its initial-events-end "
+                            "bookmark; falling back to LIST"
+                        )
+                        self._fall_back_to_list()
             except ApiException as exc:
                 if exc.status == 410:
                     # The stored resource version is too old; force a full re-list.
@@ -302,6 +817,14 @@ class SharedInformer:
                         "Watch expired (410 Gone); will re-list from scratch"
                     )
                     self._resource_version = None
+                    self._metrics.expired()
+                elif self._initial_events_pending and exc.status in _WATCH_LIST_UNSUPPORTED:
+                    logger.warning(
+                        "Watch-list rejected (status=%s); falling back to LIST",
+                        exc.status,
+                    )
+                    self._fall_back_to_list()
+                    continue
                 else:
                     logger.warning(
                         "Watch stream ended with ApiException (status=%s); reconnecting",
@@ -323,6 +846,11 @@ class SharedInformer:
                 ):
                     self._resource_version = self._watch.resource_version
                 self._watch = None
+                # A watch-list sync cut short is restarted from scratch.
+                self._initial_events_pending = False
+
+            if not self._stop_event.is_set():
+                self._metrics.reconnect()
 
             # Periodic resync: after the watch stream exits (whether due to the
             # server-side timeout_seconds, a stop request, or an error) check if
@@ -335,8 +863,11 @@ class SharedInformer:
                 and (time.monotonic() - last_resync) >= self._resync_period
             ):
                 logger.debug("Informer resync triggered")
-                try:
-                    self._initial_list()
-                except Exception as exc:
-                    logger.exception("Error during resync list; continuing")
-                    self._fire(ERROR, exc)
+                if self._resync_from_cache:
+                    self._replay_cache()
+                else:
+                    try:
+                        self._initial_list()
+                    except Exception as exc:
+                        logger.exception("Error during resync list; continuing")
+                        self._fire(ERROR, exc)
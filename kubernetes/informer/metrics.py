@@ -0,0 +1,186 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Counters and timings recorded by SharedInformer.
+
+Read them with :meth:`SharedInformer.metrics`, or pass a ``metrics_hook``
+to the informer to receive every observation as it is made::
+
+    def hook(name, value, labels):
+        if name == "events":
+            EVENTS.labels(**labels).inc(value)
+        elif name == "event_lag_seconds":
+            LAG.labels(**labels).observe(value)
+
+Observation names are ``events``, ``event_lag_seconds``,
+``handler_seconds``, ``reconnects``, ``expired_relists`` and
+``list_seconds``.
+"""
+
+import collections
+import datetime
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _get(obj, attr, key):
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, attr, None)
+
+
+def _parse_time(value):
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value
+    return None
+
+
+def event_time(event_type, obj):
+    """Return when the server last wrote *obj*, or None if it is unknown.
+
+    Uses the newest ``metadata.managedFields`` time, the creation time of
+    ADDED objects and the deletion time of DELETED objects.  These are
+    server timestamps, so the lag derived from them includes clock skew.
+    """
+    meta = _get(obj, "metadata", "metadata")
+    if meta is None:
+        return None
+    times = [
+        _parse_time(_get(entry, "time", "time"))
+        for entry in _get(meta, "managed_fields", "managedFields") or ()
+    ]
+    if event_type == "ADDED":
+        times.append(_parse_time(_get(meta, "creation_timestamp", "creationTimestamp")))
+    elif event_type == "DELETED":
+        times.append(_parse_time(_get(meta, "deletion_timestamp", "deletionTimestamp")))
+    times = [t for t in times if t is not None]
+    return max(times) if times else None
+
+
+class _Summary:
+    __slots__ = ("count", "sum", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def as_dict(self):
+        return {"count": self.count, "sum": self.sum, "max": self.max}
+
+
+class InformerMetrics:
+    """Thread-safe statistics of one informer, with an optional hook.
+
+    *hook* is a callable (name, value, labels) invoked after each
+    observation; exceptions it raises are logged and swallowed.
+    """
+
+    def __init__(self, hook=None):
+        self._hook = hook
+        self._lock = threading.Lock()
+        self._events = collections.Counter()
+        self._lag = _Summary()
+        self._handlers = collections.defaultdict(_Summary)
+        self._reconnects = 0
+        self._expired_relists = 0
+        self._lists = 0
+        self._initial_list_seconds = None
+        self._last_list_seconds = None
+
+    def _emit(self, name, value, labels=None):
+        if self._hook is None:
+            return
+        try:
+            self._hook(name, value, labels or {})
+        except Exception:
+            logger.exception("Exception in informer metrics hook")
+
+    def event(self, event_type, obj=None):
+        """Count a watch event and record its lag behind the server."""
+        written = event_time(event_type, obj) if obj is not None else None
+        lag = None
+        if written is not None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            lag = max(0.0, (now - written).total_seconds())
+        with self._lock:
+            self._events[event_type] += 1
+            if lag is not None:
+                self._lag.observe(lag)
+        self._emit("events", 1, {"type": event_type})
+        if lag is not None:
+            self._emit("event_lag_seconds", lag, {"type": event_type})
+
+    @staticmethod
+    def clock():
+        """Return the start time to pass to :meth:`handler` or :meth:`list_done`."""
+        return time.perf_counter()
+
+    def handler(self, event_type, started):
+        """Record a handler for *event_type* that ran from *started* until now."""
+        seconds = time.perf_counter() - started
+        with self._lock:
+            self._handlers[event_type].observe(seconds)
+        self._emit("handler_seconds", seconds, {"type": event_type})
+
+    def reconnect(self):
+        with self._lock:
+            self._reconnects += 1
+        self._emit("reconnects", 1)
+
+    def expired(self):
+        """Count a watch that expired (410 Gone) and forces a relist."""
+        with self._lock:
+            self._expired_relists += 1
+        self._emit("expired_relists", 1)
+
+    def list_done(self, started):
+        """Record a list or watch-list sync that ran from *started* until now."""
+        seconds = time.perf_counter() - started
+        with self._lock:
+            self._lists += 1
+            if self._initial_list_seconds is None:
+                self._initial_list_seconds = seconds
+            self._last_list_seconds = seconds
+        self._emit("list_seconds", seconds)
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "events": dict(self._events),
+                "event_lag_seconds": self._lag.as_dict(),
+                "handler_seconds": {
+                    event_type: summary.as_dict()
+                    for event_type, summary in self._handlers.items()
+                },
+                "reconnects": self._reconnects,
+                "expired_relists": self._expired_relists,
+                "lists": self._lists,
+                "initial_list_seconds": self._initial_list_seconds,
+                "last_list_seconds": self._last_list_seconds,
+            }
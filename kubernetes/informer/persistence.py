@@ -0,0 +1,101 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""On-disk snapshots of informer caches for warm restarts.
+
+A snapshot is a JSON-lines file: a header line holding the format version,
+the resource version the cache reflects and the identity of the informer
+that wrote it, then one line per object.
+"""
+
+import os
+import tempfile
+
+_FORMAT_VERSION = 1
+
+
+def _encode(dumps, data):
+    line = dumps(data)
+    if isinstance(line, str):
+        line = line.encode("utf-8")
+    return line + b"\n"
+
+
+def save_snapshot(path, objects, resource_version, api_client, identity=None,
+                  encoded=False):
+    """Write *objects* and *resource_version* to *path*.
+
+    With *encoded*, *objects* are already JSON bytes, as
+    :class:`~kubernetes.informer.cache.JsonCodec` produces them, and are
+    written unchanged.
+
+    *identity* is a JSON-serializable description of what the cache holds,
+    e.g. the resource and selectors; :func:`load_snapshot` only accepts the
+    snapshot back for the same identity.
+
+    The file is written to a temporary file in the same directory and then
+    renamed over *path*, so readers never see a partial snapshot.
+    """
+    dumps = api_client.configuration.json_dumps
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".{}.".format(os.path.basename(path)),
+        dir=os.path.dirname(os.path.abspath(path)),
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_encode(dumps, {
+                "version": _FORMAT_VERSION,
+                "resourceVersion": resource_version,
+                "identity": identity,
+            }))
+            for obj in objects:
+                if encoded:
+                    f.write(obj + b"\n")
+                else:
+                    f.write(_encode(dumps, api_client.sanitize_for_serialization(obj)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_snapshot(path, return_type, api_client, identity=None):
+    """Read a snapshot written by :func:`save_snapshot`.
+
+    Returns a ``(resource_version, objects)`` tuple.  Objects are decoded
+    into *return_type* models, or left as dicts when it is empty.  Raises
+    ValueError if the file is not a snapshot of a supported version, or if
+    it was saved with an identity other than *identity*.
+    """
+    loads = api_client.configuration.json_loads
+    with open(path, "rb") as f:
+        header = loads(f.readline() or b"{}")
+        if not isinstance(header, dict) or header.get("version") != _FORMAT_VERSION:
+            raise ValueError("{} is not an informer snapshot".format(path))
+        if header.get("identity") != identity:
+            raise ValueError(
+                "{} is a snapshot of {!r}, not {!r}".format(
+                    path, header.get("identity"), identity))
+        objects = []
+        for line in f:
+            data = loads(line)
+            if return_type:
+                data = api_client.deserialize_data(data, return_type)
+            objects.append(data)
+    return header.get("resourceVersion"), objects
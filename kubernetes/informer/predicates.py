@@ -0,0 +1,71 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Change predicates for informer MODIFIED handlers.
+
+Each predicate is a callable (old, new) -> bool that returns True when the
+handler should run.  Pass one as the ``predicate`` of
+:meth:`SharedInformer.add_event_handler`.  Objects may be dicts or
+generated model objects.
+"""
+
+
+def _field(obj, key, attr=None):
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, attr or key, None)
+
+
+def _meta_field(obj, key, attr=None):
+    return _field(_field(obj, "metadata"), key, attr)
+
+
+def resource_version(obj):
+    """Return metadata.resourceVersion of obj, or None if unset."""
+    return _meta_field(obj, "resourceVersion", "resource_version") or None
+
+
+def resource_version_changed(old, new):
+    """True unless both objects carry the same resourceVersion."""
+    rv = resource_version(new)
+    return rv is None or rv != resource_version(old)
+
+
+def generation_changed(old, new):
+    """True when metadata.generation differs, i.e. the spec was updated."""
+    return _meta_field(old, "generation") != _meta_field(new, "generation")
+
+
+def labels_changed(old, new):
+    """True when metadata.labels differ."""
+    return (_meta_field(old, "labels") or {}) != (_meta_field(new, "labels") or {})
+
+
+def annotations_changed(old, new):
+    """True when metadata.annotations differ."""
+    return (
+        (_meta_field(old, "annotations") or {})
+        != (_meta_field(new, "annotations") or {})
+    )
+
+
+def spec_changed(old, new):
+    """True when the spec differs.
+
+    Prefer :func:`generation_changed` for resources whose generation is
+    bumped on spec updates; it avoids comparing the whole spec.
+    """
+    return _field(old, "spec") != _field(new, "spec")
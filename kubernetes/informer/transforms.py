@@ -0,0 +1,70 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Object transforms applied by SharedInformer before caching.
+
+A transform is a callable (obj) -> obj passed as the ``transform`` of
+:class:`SharedInformer`.  It may modify obj in place and return it.
+Objects may be dicts or generated model objects.
+"""
+
+LAST_APPLIED_CONFIGURATION = "kubectl.kubernetes.io/last-applied-configuration"
+
+
+def _metadata(obj):
+    if isinstance(obj, dict):
+        return obj.get("metadata")
+    return getattr(obj, "metadata", None)
+
+
+def strip_managed_fields(obj):
+    """Drop metadata.managedFields."""
+    meta = _metadata(obj)
+    if isinstance(meta, dict):
+        meta.pop("managedFields", None)
+    elif getattr(meta, "managed_fields", None) is not None:
+        meta.managed_fields = None
+    return obj
+
+
+def strip_annotations(*names):
+    """Return a transform dropping the named metadata annotations.
+
+    Defaults to the ``kubectl.kubernetes.io/last-applied-configuration``
+    annotation.
+    """
+    names = names or (LAST_APPLIED_CONFIGURATION,)
+
+    def transform(obj):
+        meta = _metadata(obj)
+        if isinstance(meta, dict):
+            annotations = meta.get("annotations")
+        else:
+            annotations = getattr(meta, "annotations", None)
+        if annotations:
+            for name in names:
+                annotations.pop(name, None)
+        return obj
+
+    return transform
+
+
+def chain(*transforms):
+    """Return a transform applying *transforms* in order."""
+    def transform(obj):
+        for fn in transforms:
+            obj = fn(obj)
+        return obj
+
+    return transform
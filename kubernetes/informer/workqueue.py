@@ -0,0 +1,318 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rate-limited, deduplicating work queue for controllers.
+
+Modelled on client-go's workqueue.  Informer handlers add object keys and
+worker threads process them::
+
+    queue = WorkQueue()
+    for event_type in (ADDED, MODIFIED, DELETED):
+        informer.add_event_handler(event_type, queue.add_object)
+
+    def worker():
+        while True:
+            key = queue.get()
+            if key is None:  # shut down
+                return
+            try:
+                reconcile(key)
+                queue.forget(key)
+            except Exception:
+                queue.add_rate_limited(key)
+            finally:
+                queue.done(key)
+
+A key added several times while queued is processed once, and a key is
+never handed to two workers at the same time: adding it while it is being
+processed queues it again once :meth:`WorkQueue.done` is called.
+"""
+
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+from .cache import _meta_namespace_key
+
+
+class ItemExponentialFailureRateLimiter:
+    """Delay each item by base_delay * 2**failures, capped at max_delay."""
+
+    def __init__(self, base_delay=0.005, max_delay=1000.0):
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._failures = collections.Counter()
+        self._lock = threading.Lock()
+
+    def when(self, item):
+        with self._lock:
+            exp = self._failures[item]
+            self._failures[item] += 1
+        if exp > 64:
+            return self._max_delay
+        return min(self._base_delay * 2 ** exp, self._max_delay)
+
+    def num_requeues(self, item):
+        with self._lock:
+            return self._failures[item]
+
+    def forget(self, item):
+        with self._lock:
+            self._failures.pop(item, None)
+
+
+class BucketRateLimiter:
+    """Token bucket shared by all items: qps tokens per second, up to burst."""
+
+    def __init__(self, qps=10.0, burst=100):
+        self._qps = float(qps)
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def when(self, item):
+        """Reserve a token and return the seconds until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._last) * self._qps)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._qps
+
+    def num_requeues(self, item):
+        return 0
+
+    def forget(self, item):
+        pass
+
+
+class MaxOfRateLimiter:
+    """Combine rate limiters, delaying each item by the longest of them."""
+
+    def __init__(self, *limiters):
+        self._limiters = limiters
+
+    def when(self, item):
+        return max(limiter.when(item) for limiter in self._limiters)
+
+    def num_requeues(self, item):
+        return max(limiter.num_requeues(item) for limiter in self._limiters)
+
+    def forget(self, item):
+        for limiter in self._limiters:
+            limiter.forget(item)
+
+
+def default_controller_rate_limiter():
+    """Per-item exponential backoff combined with a 10 qps, 100 burst bucket."""
+    return MaxOfRateLimiter(
+        ItemExponentialFailureRateLimiter(0.005, 1000.0),
+        BucketRateLimiter(qps=10, burst=100),
+    )
+
+
+class WorkQueue:
+    """Deduplicating work queue with delayed and rate-limited adds.
+
+    Parameters
+    ----------
+    rate_limiter:
+        Object with ``when(item)``, ``num_requeues(item)`` and
+        ``forget(item)`` used by :meth:`add_rate_limited`.  Defaults to
+        :func:`default_controller_rate_limiter`.
+    key_func:
+        Optional callable (obj) -> str used by :meth:`add_object`.
+        Defaults to namespace/name.
+    """
+
+    def __init__(self, rate_limiter=None, key_func=None):
+        self._rate_limiter = (
+            rate_limiter if rate_limiter is not None
+            else default_controller_rate_limiter()
+        )
+        self._key_func = key_func if key_func is not None else _meta_namespace_key
+        self._lock = threading.RLock()
+        # Getters wait on _cond, the delayed-add thread on _delay_cond.
+        self._cond = threading.Condition(self._lock)
+        self._delay_cond = threading.Condition(self._lock)
+        self._queue = collections.deque()
+        self._dirty = set()
+        self._processing = set()
+        self._shutting_down = False
+        # Delayed adds: heap of (ready_at, seq, item) with the earliest
+        # ready time of each waiting item.
+        self._waiting = []
+        self._waiting_at = {}
+        self._seq = itertools.count()
+        self._delay_thread = None
+        # Metrics
+        self._added_at = {}
+        self._started_at = {}
+        self._adds = 0
+        self._retries = 0
+        self._latency_total = 0.0
+        self._work_total = 0.0
+        self._work_count = 0
+
+    def __len__(self):
+        with self._cond:
+            return len(self._queue)
+
+    def add(self, item):
+        """Queue *item* unless it is already queued."""
+        with self._cond:
+            if self._shutting_down or item in self._dirty:
+                return
+            self._adds += 1
+            self._dirty.add(item)
+            self._added_at.setdefault(item, time.monotonic())
+            if item in self._processing:
+                return
+            self._queue.append(item)
+            self._cond.notify()
+
+    def add_object(self, obj):
+        """Queue the key of *obj*; register as an informer event handler."""
+        self.add(self._key_func(obj))
+
+    def add_after(self, item, delay):
+        """Queue *item* once *delay* seconds have passed."""
+        if delay <= 0:
+            self.add(item)
+            return
+        ready_at = time.monotonic() + delay
+        with self._cond:
+            if self._shutting_down:
+                return
+            current = self._waiting_at.get(item)
+            if current is not None and current <= ready_at:
+                return
+            self._waiting_at[item] = ready_at
+            heapq.heappush(self._waiting, (ready_at, next(self._seq), item))
+            if self._delay_thread is None:
+                self._delay_thread = threading.Thread(
+                    target=self._delay_loop,
+                    name="WorkQueue-delay",
+                    daemon=True,
+                )
+                self._delay_thread.start()
+            self._delay_cond.notify()
+
+    def add_rate_limited(self, item):
+        """Queue *item* after the delay chosen by the rate limiter."""
+        with self._cond:
+            self._retries += 1
+        self.add_after(item, self._rate_limiter.when(item))
+
+    def forget(self, item):
+        """Reset the rate limiter's failure history for *item*."""
+        self._rate_limiter.forget(item)
+
+    def num_requeues(self, item):
+        """Return how many times *item* was rate-limited since it was forgotten."""
+        return self._rate_limiter.num_requeues(item)
+
+    def get(self, timeout=None):
+        """Return the next item, blocking until one is available.
+
+        Returns None once the queue is shut down and empty, or when
+        *timeout* seconds pass.  Every returned item must be passed to
+        :meth:`done` when its processing ends.
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                    lambda: self._queue or self._shutting_down, timeout):
+                return None
+            if not self._queue:
+                return None
+            item = self._queue.popleft()
+            now = time.monotonic()
+            self._processing.add(item)
+            self._dirty.discard(item)
+            self._latency_total += now - self._added_at.pop(item, now)
+            self._started_at[item] = now
+            return item
+
+    def done(self, item):
+        """Mark *item* as processed, requeueing it if it was added meanwhile."""
+        with self._cond:
+            self._processing.discard(item)
+            started = self._started_at.pop(item, None)
+            if started is not None:
+                self._work_total += time.monotonic() - started
+                self._work_count += 1
+            if item in self._dirty:
+                self._queue.append(item)
+                self._cond.notify()
+
+    def shut_down(self):
+        """Stop accepting items and wake every waiting :meth:`get`.
+
+        Items already queued are still handed out.
+        """
+        with self._cond:
+            self._shutting_down = True
+            self._waiting = []
+            self._waiting_at.clear()
+            self._cond.notify_all()
+            self._delay_cond.notify()
+            thread, self._delay_thread = self._delay_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def shutting_down(self):
+        with self._cond:
+            return self._shutting_down
+
+    def metrics(self):
+        """Return a dict of queue statistics.
+
+        ``depth`` is the number of queued items, ``processing`` and
+        ``waiting`` count items being handled and delayed adds, ``adds``
+        and ``retries`` count calls since creation.  ``latency_avg`` is the
+        mean time items waited in the queue and ``work_duration_avg`` the
+        mean time between :meth:`get` and :meth:`done`, in seconds.
+        """
+        with self._cond:
+            handed_out = self._work_count + len(self._started_at)
+            return {
+                "depth": len(self._queue),
+                "processing": len(self._processing),
+                "waiting": len(self._waiting_at),
+                "adds": self._adds,
+                "retries": self._retries,
+                "latency_avg": self._latency_total / handed_out if handed_out else 0.0,
+                "work_duration_avg": (
+                    self._work_total / self._work_count if self._work_count else 0.0),
+            }
+
+    def _delay_loop(self):
+        with self._lock:
+            while not self._shutting_down:
+                now = time.monotonic()
+                while self._waiting and self._waiting[0][0] <= now:
+                    ready_at, _, item = heapq.heappop(self._waiting)
+                    # Skip entries superseded by an earlier add_after.
+                    if self._waiting_at.get(item) != ready_at:
+                        continue
+                    del self._waiting_at[item]
+                    self.add(item)
+                timeout = self._waiting[0][0] - now if self._waiting else None
+                self._delay_cond.wait(timeout)
@@ -1,6 +1,11 @@
 # coding: utf-8
 
 
+import copy
+import importlib.util
+import inspect
+import json
+import pickle
 import unittest
 from unittest import mock
 import weakref
@@ -9,6 +14,7 @@ import kubernetes
 from kubernetes.aio.client.configuration import Configuration as AsyncConfiguration
 from kubernetes.client.configuration import Configuration
 from kubernetes.client.rest import RESTClientObject
+import pydantic
 import urllib3
 
 
@@ -43,6 +49,20 @@ class TestApiClient(unittest.TestCase):
                     expected,
                 )
 
+    def test_deserializers_are_compiled_once_per_type(self):
+        client = kubernetes.client.ApiClient()
+        response_type = 'Dict[str, List[V1OwnerReference]]'
+        data = {'a': [{'apiVersion': 'v1', 'kind': 'Pod', 'name': 'p', 'uid': 'u'}, None]}
+
+        value = client.deserialize_data(data, response_type)
+
+        self.assertIsInstance(value['a'][0], kubernetes.client.V1OwnerReference)
+        self.assertIsNone(value['a'][1])
+        self.assertEqual(client.deserialize_data(['1', 2], 'List[int]'), [1, 2])
+        self.assertIs(
+            kubernetes.client.ApiClient()._ApiClient__deserializer(response_type),
+            client._ApiClient__deserializer(response_type))
+
     def test_rest_proxycare(self):
 
         pool = { 'proxy': urllib3.ProxyManager, 'direct': urllib3.PoolManager }
@@ -87,6 +107,397 @@ class TestApiClient(unittest.TestCase):
         self.assertNotIn('retries', rest_client.pool_manager.request.call_args.kwargs)
 
 
+class TestJsonBackend(unittest.TestCase):
+    def test_default_backend_is_stdlib_json(self):
+        config = Configuration()
+        self.assertEqual('json', config.json_backend)
+        self.assertIs(json.loads, config.json_loads)
+        self.assertIs(json.dumps, config.json_dumps)
+
+    def test_unknown_backend_raises(self):
+        with self.assertRaises(ValueError):
+            Configuration(json_backend='yaml')
+
+    def test_deepcopy_keeps_codec(self):
+        def loads(data):
+            return json.loads(data)
+
+        config = Configuration()
+        config.json_loads = loads
+        self.assertIs(loads, copy.deepcopy(config).json_loads)
+
+    def test_deserialize_uses_configured_loads(self):
+        config = Configuration()
+        config.json_loads = mock.Mock(return_value={'key': 'value'})
+        client = kubernetes.client.ApiClient(configuration=config)
+
+        data = client.deserialize(
+            '{"key": "value"}', 'Dict[str, str]', 'application/json')
+
+        self.assertEqual({'key': 'value'}, data)
+        config.json_loads.assert_called_once_with('{"key": "value"}')
+
+    def test_request_body_uses_configured_dumps(self):
+        config = Configuration(proxy='', no_proxy='')
+        config.json_dumps = mock.Mock(return_value=b'{"a":1}')
+        rest_client = RESTClientObject(config)
+        rest_client.pool_manager = mock.Mock()
+
+        rest_client.request(
+            'POST', 'http://example.test/api/v1/namespaces',
+            headers={'Content-Type': 'application/json'}, body={'a': 1})
+
+        config.json_dumps.assert_called_once_with({'a': 1})
+        self.assertEqual(
+            b'{"a":1}',
+            rest_client.pool_manager.request.call_args.kwargs['body'])
+
+    def test_request_passes_encoded_body_through(self):
+        config = Configuration(proxy='', no_proxy='')
+        config.json_dumps = mock.Mock()
+        rest_client = RESTClientObject(config)
+        rest_client.pool_manager = mock.Mock()
+
+        rest_client.request(
+            'POST', 'http://example.test/api/v1/namespaces',
+            headers={'Content-Type': 'application/json'}, body=b'{"a":1}')
+
+        config.json_dumps.assert_not_called()
+        self.assertEqual(
+            b'{"a":1}',
+            rest_client.pool_manager.request.call_args.kwargs['body'])
+
+    def test_watch_uses_configured_loads(self):
+        watch = kubernetes.watch.Watch()
+        loads = mock.Mock(side_effect=json.loads)
+        watch.api_client.configuration.json_loads = loads
+
+        event = watch.unmarshal_event(
+            '{"type": "ADDED", "object": {"metadata": {"name": "n"}}}',
+            'V1Namespace')
+
+        self.assertEqual('n', event['object'].metadata.name)
+        loads.assert_called_once()
+
+    @unittest.skipUnless(importlib.util.find_spec('orjson'), 'orjson not installed')
+    def test_orjson_backend(self):
+        config = Configuration(json_backend='orjson')
+        client = kubernetes.client.ApiClient(configuration=config)
+
+        pod = client.deserialize(
+            '{"metadata": {"name": "p", "labels": {"a": "b"}}}',
+            'V1Pod', 'application/json')
+
+        self.assertEqual('p', pod.metadata.name)
+        self.assertEqual({"a": "b"}, json.loads(config.json_dumps(
+            client.sanitize_for_serialization(pod.metadata.labels))))
+
+
+def _pod_list():
+    pod = {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": "p1",
+            "namespace": "default",
+            "creationTimestamp": "2026-01-01T00:00:00Z",
+            "labels": {"app": "a"},
+        },
+        "spec": {"containers": [{
+            "name": "app",
+            "image": "app:1",
+            "ports": [{"containerPort": 80}],
+            "resources": {"limits": {"cpu": "1"}},
+        }]},
+        "status": {"phase": "Running", "conditions": [
+            {"type": "Ready", "status": "True",
+             "lastTransitionTime": "2026-01-01T00:00:00Z"},
+        ]},
+    }
+    return {
+        "apiVersion": "v1",
+        "kind": "PodList",
+        "metadata": {"resourceVersion": "5", "continue": "token"},
+        "items": [pod],
+    }
+
+
+def _model_classes():
+    models = kubernetes.client.models
+    return [
+        klass for klass in (getattr(models, name) for name in dir(models))
+        if isinstance(klass, type) and hasattr(klass, "openapi_types")
+    ]
+
+
+class TestValidateResponses(unittest.TestCase):
+    def setUp(self):
+        self.validating = kubernetes.client.ApiClient()
+        self.trusting = kubernetes.client.ApiClient(
+            Configuration(validate_responses=False))
+
+    def test_matches_validated_models(self):
+        validated = self.validating.deserialize_data(_pod_list(), "V1PodList")
+        built = self.trusting.deserialize_data(_pod_list(), "V1PodList")
+
+        self.assertEqual(validated, built)
+        self.assertEqual(
+            self.validating.sanitize_for_serialization(validated),
+            self.validating.sanitize_for_serialization(built))
+        self.assertEqual(built.metadata._continue, "token")
+        self.assertIsInstance(built.items[0].spec.containers[0], kubernetes.client.V1Container)
+        self.assertEqual(
+            built.items[0].metadata.creation_timestamp.isoformat(),
+            "2026-01-01T00:00:00+00:00")
+        self.assertEqual(
+            validated.items[0].model_fields_set, built.items[0].model_fields_set)
+
+    def test_hidden_field_names(self):
+        crd = {
+            "metadata": {"name": "widgets.example.com"},
+            "spec": {
+                "group": "example.com",
+                "names": {"kind": "Widget", "plural": "widgets"},
+                "scope": "Namespaced",
+                "versions": [{
+                    "name": "v1", "served": True, "storage": True,
+                    "schema": {"openAPIV3Schema": {
+                        "type": "object",
+                        "x-kubernetes-preserve-unknown-fields": True,
+                        "properties": {"spec": {
+                            "$ref": "#/spec", "not": {"type": "string"},
+                        }},
+                    }},
+                }],
+            },
+        }
+        validated = self.validating.deserialize_data(crd, "V1CustomResourceDefinition")
+        built = self.trusting.deserialize_data(crd, "V1CustomResourceDefinition")
+        self.assertEqual(validated, built)
+
+    def test_matches_from_dict_for_all_models(self):
+        classes = _model_classes()
+        self.assertGreater(len(classes), 700)
+        for klass in classes:
+            with self.subTest(model=klass.__name__):
+                data = _sample_data(klass)
+                built = self.trusting.deserialize_data(data, klass.__name__)
+                self.assertEqual(built, klass.from_dict(data))
+
+    def test_bytes_fields_keep_encoded_data(self):
+        data = {"metadata": {"name": "s"}, "data": {"key": "dmFsdWU="}}
+        secret = self.trusting.deserialize_data(data, "V1Secret")
+        self.assertEqual(secret.data, {"key": "dmFsdWU="})
+        self.assertEqual(secret.to_dict()["data"], {"key": "dmFsdWU="})
+
+    def test_skips_validation(self):
+        data = {"metadata": {"name": 5}}
+        with self.assertRaises(Exception):
+            self.validating.deserialize_data(data, "V1Pod")
+        self.assertEqual(
+            self.trusting.deserialize_data(data, "V1Pod").metadata.name, 5)
+
+    def test_async_client(self):
+        from kubernetes.aio.client import ApiClient as AsyncApiClient
+
+        api_client = AsyncApiClient(AsyncConfiguration(validate_responses=False))
+        pods = api_client.deserialize_data(_pod_list(), "V1PodList")
+        self.assertEqual(pods.items[0].status.phase, "Running")
+        self.assertTrue(Configuration().validate_responses)
+
+
+class TestLazyResponses(unittest.TestCase):
+    def setUp(self):
+        self.validating = kubernetes.client.ApiClient()
+        self.lazy = kubernetes.client.ApiClient(
+            Configuration(lazy_responses=True))
+
+    def test_builds_fields_on_first_access(self):
+        pods = self.lazy.deserialize_data(_pod_list(), "V1PodList")
+        self.assertNotIn("items", pods.__dict__)
+        pod = pods.items[0]
+        self.assertIsInstance(pod, kubernetes.client.V1Pod)
+        self.assertEqual(pod.kind, "Pod")
+        self.assertNotIn("spec", pod.__dict__)
+
+        self.assertIs(pod.spec, pod.spec)
+        self.assertIsInstance(pod.spec.containers[0], kubernetes.client.V1Container)
+        self.assertEqual(
+            pod.metadata.creation_timestamp.isoformat(), "2026-01-01T00:00:00+00:00")
+
+    def test_matches_validated_models(self):
+        validated = self.validating.deserialize_data(_pod_list(), "V1PodList")
+        for compare in (
+            lambda built: self.assertEqual(validated, built),
+            lambda built: self.assertEqual(validated.to_dict(), built.to_dict()),
+            lambda built: self.assertEqual(
+                self.validating.sanitize_for_serialization(validated),
+                self.validating.sanitize_for_serialization(built)),
+            lambda built: self.assertEqual(
+                validated.model_dump_json(), built.model_dump_json()),
+        ):
+            built = self.lazy.deserialize_data(_pod_list(), "V1PodList")
+            # Load a field out of declaration order first.
+            self.assertEqual(built.items[0].status.phase, "Running")
+            compare(built)
+
+    def test_matches_from_dict_for_all_models(self):
+        for klass in _model_classes():
+            with self.subTest(model=klass.__name__):
+                data = _sample_data(klass)
+                expected = klass.from_dict(data)
+                built = self.lazy.deserialize_data(data, klass.__name__)
+                self.assertEqual(built.to_dict(), expected.to_dict())
+                self.assertEqual(built, expected)
+
+    def test_bytes_fields_keep_encoded_data(self):
+        data = {"binaryData": {"key": "dmFsdWU="}}
+        config_map = self.lazy.deserialize_data(data, "V1ConfigMap")
+        self.assertEqual(config_map.binary_data, {"key": "dmFsdWU="})
+
+    def test_assignment_replaces_pending_field(self):
+        pod = self.lazy.deserialize_data(_pod_list(), "V1PodList").items[0]
+        pod.status = None
+        self.assertIsNone(pod.status)
+        self.assertEqual(pod.spec.containers[0].name, "app")
+
+    def test_copy_and_pickle(self):
+        validated = self.validating.deserialize_data(_pod_list(), "V1PodList")
+
+        self.assertEqual(copy.deepcopy(
+            self.lazy.deserialize_data(_pod_list(), "V1PodList")), validated)
+        restored = pickle.loads(pickle.dumps(
+            self.lazy.deserialize_data(_pod_list(), "V1PodList")))
+        self.assertIs(type(restored.items[0]), kubernetes.client.V1Pod)
+        self.assertEqual(restored, validated)
+
+    def test_async_client(self):
+        from kubernetes.aio.client import ApiClient as AsyncApiClient
+
+        api_client = AsyncApiClient(AsyncConfiguration(lazy_responses=True))
+        pods = api_client.deserialize_data(_pod_list(), "V1PodList")
+        self.assertEqual(pods.items[0].status.phase, "Running")
+
+
+_SAMPLE_VALUES = {
+    "str": "value", "int": 1, "float": 1.5, "bool": True, "bytes": "dmFsdWU=",
+    "date": "2026-01-01", "datetime": "2026-01-01T12:30:00.5+01:00",
+}
+
+
+def _sample_value(openapi_type, annotation, seen):
+    if openapi_type.startswith("List["):
+        return [_sample_value(openapi_type[5:-1], annotation, seen)]
+    if openapi_type.startswith("Dict[str, "):
+        return {"key": _sample_value(openapi_type[10:-1], annotation, seen)}
+    if openapi_type == "object":
+        # IntOrString and similar fields are declared as object too.
+        return {"a": [1, None]} if "Dict" in str(annotation) else "value"
+    if openapi_type in _SAMPLE_VALUES:
+        return _SAMPLE_VALUES[openapi_type]
+    return _sample_data(getattr(kubernetes.client.models, openapi_type), seen)
+
+
+def _sample_data(klass, seen=()):
+    """Return wire data setting every field of klass, nested models included."""
+    if klass in seen:
+        return {}
+    annotations = {
+        field.alias or name: field.annotation
+        for name, field in klass.model_fields.items()
+    }
+    return {
+        klass.attribute_map[name]: _sample_value(
+            openapi_type, annotations[name], seen + (klass,))
+        for name, openapi_type in klass.openapi_types.items()
+    }
+
+
+class TestSerializeBody(unittest.TestCase):
+    def setUp(self):
+        self.client = kubernetes.client.ApiClient()
+
+    def test_matches_sanitized_json_for_all_models(self):
+        for klass in _model_classes():
+            with self.subTest(model=klass.__name__):
+                obj = klass.from_dict(_sample_data(klass))
+                body = self.client.serialize_body(obj)
+
+                self.assertIsInstance(body, bytes)
+                self.assertEqual(
+                    json.loads(body),
+                    json.loads(json.dumps(self.client.sanitize_for_serialization(obj))))
+                self.assertEqual(klass.from_dict(json.loads(body)), obj)
+
+    def test_utc_times_and_lazy_models_round_trip(self):
+        lazy = kubernetes.client.ApiClient(Configuration(lazy_responses=True))
+        pods = lazy.deserialize_data(_pod_list(), "V1PodList")
+
+        body = self.client.serialize_body(pods)
+
+        self.assertIn(b'"creationTimestamp":"2026-01-01T00:00:00Z"', body)
+        self.assertEqual(
+            self.client.deserialize_data(json.loads(body), "V1PodList"),
+            self.client.deserialize_data(_pod_list(), "V1PodList"))
+
+    def test_param_serialize_encodes_models_only(self):
+        pod = kubernetes.client.V1Pod(metadata=kubernetes.client.V1ObjectMeta(name="p"))
+        for body, expected in (
+            (pod, b'{"metadata":{"name":"p"}}'),
+            ({"metadata": {"name": "p"}}, {"metadata": {"name": "p"}}),
+        ):
+            _, _, _, serialized, _ = self.client.param_serialize(
+                "POST", "/api/v1/namespaces/default/pods", body=body)
+            self.assertEqual(serialized, expected)
+
+
+class _Sent(Exception):
+    pass
+
+
+class TestValidateArguments(unittest.TestCase):
+    def _api(self, config):
+        api_client = kubernetes.client.ApiClient(config)
+        api_client.call_api = mock.Mock(side_effect=_Sent)
+        return kubernetes.client.AppsV1Api(api_client), api_client.call_api
+
+    def test_arguments_are_validated_by_default(self):
+        api, call_api = self._api(Configuration())
+
+        with self.assertRaises(pydantic.ValidationError):
+            api.read_namespaced_deployment(name=1, namespace="default")
+        call_api.assert_not_called()
+
+    def test_validation_can_be_turned_off(self):
+        api, call_api = self._api(Configuration(validate_arguments=False))
+
+        with self.assertRaises(_Sent):
+            api.read_namespaced_deployment(name=1, namespace="default")
+        self.assertTrue(call_api.call_args.args[1].endswith(
+            "/apis/apps/v1/namespaces/default/deployments/1"))
+
+    def test_signatures_are_kept(self):
+        method = kubernetes.client.AppsV1Api.read_namespaced_deployment
+        self.assertEqual(
+            list(inspect.signature(method).parameters)[:4],
+            ["self", "name", "namespace", "pretty"])
+
+
+class TestAsyncValidateArguments(unittest.IsolatedAsyncioTestCase):
+    async def test_validation_can_be_turned_off(self):
+        from kubernetes.aio.client import ApiClient, AppsV1Api
+
+        for validate, error in ((True, pydantic.ValidationError), (False, _Sent)):
+            api_client = ApiClient(AsyncConfiguration(validate_arguments=validate))
+            api_client.call_api = mock.AsyncMock(side_effect=_Sent)
+            with self.subTest(validate_arguments=validate):
+                with self.assertRaises(error):
+                    await AppsV1Api(api_client).read_namespaced_deployment(
+                        name=1, namespace="default")
+                self.assertEqual(api_client.call_api.called, not validate)
+            await api_client.close()
+
+
 class TestConfigurationAuthSettings(unittest.TestCase):
     """Regression tests for Configuration.auth_settings() bearer-token lookup.
 
@@ -14,12 +14,32 @@
 
 """Unit tests for kubernetes.informer."""
 
+import datetime
+import functools
+import io
+import json
+import os
+import tempfile
 import threading
 import time
 import unittest
+import urllib.parse
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from kubernetes.informer.cache import ObjectCache, _meta_namespace_key
+import urllib3
+
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.exceptions import ApiException
+from kubernetes.informer.cache import (
+    NAMESPACE_INDEX,
+    JsonCodec,
+    ObjectCache,
+    _meta_namespace_key,
+    meta_namespace_index_func,
+)
+from kubernetes.informer.dispatch import DROP_NEWEST, DROP_OLDEST, QueuedHandler
+from kubernetes.informer.factory import SharedInformerFactory
 from kubernetes.informer.informer import (
     ADDED,
     BOOKMARK,
@@ -28,6 +48,27 @@ from kubernetes.informer.informer import (
     MODIFIED,
     SharedInformer,
 )
+from kubernetes.informer.metrics import event_time
+from kubernetes.informer.persistence import load_snapshot, save_snapshot
+from kubernetes.informer.predicates import (
+    annotations_changed,
+    generation_changed,
+    labels_changed,
+    resource_version_changed,
+    spec_changed,
+)
+from kubernetes.informer.transforms import (
+    LAST_APPLIED_CONFIGURATION,
+    chain,
+    strip_annotations,
+    strip_managed_fields,
+)
+from kubernetes.informer.workqueue import (
+    BucketRateLimiter,
+    ItemExponentialFailureRateLimiter,
+    MaxOfRateLimiter,
+    WorkQueue,
+)
 
 
 def _make_pod(namespace, name):
@@ -123,6 +164,326 @@ class TestObjectCache(unittest.TestCase):
                     "expected key {} in cache".format(key),
                 )
 
+    def test_snapshot_is_read_only_and_stable(self):
+        p1 = _make_pod("default", "p1")
+        self.cache._put(p1)
+        snap = self.cache.snapshot()
+        self.assertIs(snap, self.cache.snapshot())
+        with self.assertRaises(TypeError):
+            snap["default/p2"] = p1
+
+        p2 = _make_pod("default", "p2")
+        self.cache._put(p2)
+        self.cache._remove(p1)
+        self.assertEqual(dict(snap), {"default/p1": p1})
+        self.assertEqual(dict(self.cache.snapshot()), {"default/p2": p2})
+
+    def test_snapshot_after_replace_all(self):
+        self.cache._put(_make_pod("default", "p1"))
+        self.cache.snapshot()
+        pod = _make_pod("default", "p2")
+        self.cache._replace_all([pod])
+        self.assertEqual(list(self.cache.snapshot().values()), [pod])
+
+    def test_concurrent_readers_see_consistent_snapshots(self):
+        errors = []
+        done = threading.Event()
+
+        def writer():
+            for i in range(500):
+                self.cache._put(_make_pod("default", "pod-{}".format(i)))
+            done.set()
+
+        def reader():
+            try:
+                while not done.is_set():
+                    snap = self.cache.snapshot()
+                    self.assertEqual(len(list(snap.values())), len(snap))
+                    self.cache.list()
+                    self.cache.get_by_key("default/pod-0")
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.cache.list_keys()), 500)
+
+    def test_readers_do_not_take_the_lock(self):
+        self.cache._put(_make_pod("default", "p1"))
+        # Publish the snapshot; reads then need no lock until the next write.
+        self.cache.snapshot()
+        results = []
+
+        def reader():
+            results.append(len(self.cache.snapshot()))
+            results.append(len(self.cache.list()))
+            results.append(self.cache.get_by_key("default/p1")["metadata"]["name"])
+            results.append(len(self.cache))
+
+        with self.cache._rlock:
+            t = threading.Thread(target=reader)
+            t.start()
+            t.join(timeout=5)
+            self.assertFalse(t.is_alive())
+        self.assertEqual(results, [1, 1, "p1", 1])
+
+    def test_snapshot_is_reused_until_a_write(self):
+        self.cache._put(_make_pod("default", "p1"))
+        snap = self.cache.snapshot()
+        self.assertIs(self.cache.snapshot(), snap)
+        self.cache._put(_make_pod("default", "p2"))
+        self.assertIsNot(self.cache.snapshot(), snap)
+        self.assertEqual(len(snap), 1)
+
+    def test_list_keeps_insertion_order(self):
+        names = ["pod-{}".format(i) for i in range(200, 0, -1)]
+        for name in names:
+            self.cache._put(_make_pod("default", name))
+        self.assertEqual(self.cache.list_keys(),
+                         ["default/" + name for name in names])
+        self.assertEqual([p["metadata"]["name"] for p in self.cache.list()],
+                         names)
+
+    def test_old_snapshots_survive_later_writes(self):
+        expected = {}
+        history = []
+        for i in range(3000):
+            name = "pod-{}".format(i % 1200)
+            pod = _make_pod("default", name)
+            if i % 7 == 3:
+                self.cache._remove(pod)
+                expected.pop("default/" + name, None)
+            else:
+                self.cache._put(pod)
+                expected["default/" + name] = pod
+            if i % 500 == 0:
+                history.append((self.cache.snapshot(), dict(expected)))
+        history.append((self.cache.snapshot(), dict(expected)))
+        for snap, want in history:
+            self.assertEqual(len(snap), len(want))
+            self.assertEqual(dict(snap), want)
+            for key, obj in want.items():
+                self.assertIs(snap[key], obj)
+            self.assertNotIn("default/missing", snap)
+        self.assertEqual(sorted(self.cache.list_keys()), sorted(expected))
+        self.assertEqual(len(self.cache.list()), len(expected))
+
+
+def _node_index(obj):
+    node = obj.get("spec", {}).get("nodeName")
+    return [node] if node else []
+
+
+def _make_scheduled_pod(namespace, name, node):
+    pod = _make_pod(namespace, name)
+    pod["spec"] = {"nodeName": node}
+    return pod
+
+
+class TestObjectCacheIndexers(unittest.TestCase):
+    def setUp(self):
+        self.cache = ObjectCache(indexers={
+            NAMESPACE_INDEX: meta_namespace_index_func,
+            "node": _node_index,
+        })
+
+    def test_by_index(self):
+        p1 = _make_scheduled_pod("default", "p1", "n1")
+        p2 = _make_scheduled_pod("kube-system", "p2", "n1")
+        p3 = _make_scheduled_pod("default", "p3", "n2")
+        for pod in (p1, p2, p3):
+            self.cache._put(pod)
+        self.assertCountEqual(self.cache.by_index("node", "n1"), [p1, p2])
+        self.assertCountEqual(
+            self.cache.by_index(NAMESPACE_INDEX, "default"), [p1, p3])
+        self.assertCountEqual(
+            self.cache.index_keys("node", "n2"), ["default/p3"])
+        self.assertEqual(self.cache.by_index("node", "n3"), [])
+
+    def test_put_moves_object_between_index_values(self):
+        self.cache._put(_make_scheduled_pod("default", "p1", "n1"))
+        moved = _make_scheduled_pod("default", "p1", "n2")
+        self.cache._put(moved)
+        self.assertEqual(self.cache.by_index("node", "n1"), [])
+        self.assertEqual(self.cache.by_index("node", "n2"), [moved])
+        self.assertEqual(self.cache.list_index_values("node"), ["n2"])
+
+    def test_remove_drops_index_entries(self):
+        pod = _make_scheduled_pod("default", "p1", "n1")
+        self.cache._put(pod)
+        self.cache._remove(pod)
+        self.assertEqual(self.cache.by_index("node", "n1"), [])
+        self.assertEqual(self.cache.list_index_values("node"), [])
+
+    def test_replace_all_rebuilds_indexes(self):
+        self.cache._put(_make_scheduled_pod("default", "p1", "n1"))
+        p2 = _make_scheduled_pod("default", "p2", "n2")
+        self.cache._replace_all([p2])
+        self.assertEqual(self.cache.by_index("node", "n1"), [])
+        self.assertEqual(self.cache.by_index("node", "n2"), [p2])
+
+    def test_add_indexers_indexes_existing_objects(self):
+        cache = ObjectCache()
+        pod = _make_pod("default", "p1")
+        cache._put(pod)
+        cache.add_indexers({NAMESPACE_INDEX: meta_namespace_index_func})
+        self.assertEqual(cache.by_index(NAMESPACE_INDEX, "default"), [pod])
+        with self.assertRaises(ValueError):
+            cache.add_indexers({NAMESPACE_INDEX: meta_namespace_index_func})
+
+    def test_cluster_scoped_objects_not_namespace_indexed(self):
+        self.cache._put({"metadata": {"name": "node1"}})
+        self.assertEqual(self.cache.list_index_values(NAMESPACE_INDEX), [])
+
+    def test_unknown_index_raises(self):
+        with self.assertRaises(KeyError):
+            self.cache.by_index("owner", "uid")
+
+
+class TestObjectCacheCompact(unittest.TestCase):
+    def setUp(self):
+        from kubernetes.client import ApiClient
+
+        self.api_client = ApiClient()
+
+    def _model_pod(self, name, node):
+        from kubernetes.client import V1ObjectMeta, V1Pod, V1PodSpec
+
+        return V1Pod(
+            metadata=V1ObjectMeta(namespace="default", name=name),
+            spec=V1PodSpec(node_name=node, containers=[]),
+        )
+
+    def test_stores_bytes_and_decodes_models(self):
+        from kubernetes.client import V1Pod
+
+        cache = ObjectCache(codec=JsonCodec(self.api_client, V1Pod))
+        pod = self._model_pod("p1", "n1")
+        cache._put(pod)
+        self.assertIsInstance(cache._objects["default/p1"].data, bytes)
+        self.assertEqual(cache.get_by_key("default/p1"), pod)
+        self.assertEqual(cache.list(), [pod])
+        self.assertEqual(dict(cache.snapshot()), {"default/p1": pod})
+        self.assertIsNot(cache.get_by_key("default/p1"), cache.get_by_key("default/p1"))
+
+    def test_indexes_follow_updates(self):
+        cache = ObjectCache(
+            indexers={"node": lambda pod: [pod.spec.node_name]},
+            codec=JsonCodec(self.api_client, "V1Pod"),
+        )
+        cache._put(self._model_pod("p1", "n1"))
+        moved = self._model_pod("p1", "n2")
+        cache._put(moved)
+        self.assertEqual(cache.by_index("node", "n1"), [])
+        self.assertEqual(cache.by_index("node", "n2"), [moved])
+        cache._remove(moved)
+        self.assertEqual(cache.list_index_values("node"), [])
+
+    def test_decoded_cache_reuses_objects_until_updated(self):
+        cache = ObjectCache(codec=JsonCodec(self.api_client), decoded_cache_size=1)
+        cache._put(_make_pod("default", "p1"))
+        cache._put(_make_pod("default", "p2"))
+        first = cache.get_by_key("default/p1")
+        self.assertIs(cache.get_by_key("default/p1"), first)
+        cache.get_by_key("default/p2")
+        self.assertIsNot(cache.get_by_key("default/p1"), first)
+
+        cached = cache.get_by_key("default/p1")
+        updated = _make_pod("default", "p1")
+        updated["metadata"]["labels"] = {"app": "new"}
+        cache._put(updated)
+        self.assertIsNot(cache.get_by_key("default/p1"), cached)
+        self.assertEqual(cache.get_by_key("default/p1"), updated)
+
+    def test_informer_compact_cache(self):
+        list_func = MagicMock()
+        list_func.return_value = _list_page([_make_pod("default", "p1")])
+        informer = SharedInformer(
+            list_func=list_func, compact_cache=True, decoded_cache_size=16)
+        informer._initial_list()
+        self.assertIsInstance(informer.cache._objects["default/p1"].data, bytes)
+        self.assertEqual(informer.cache.list(), [_make_pod("default", "p1")])
+
+    def test_updates_do_not_decode_stored_objects(self):
+        def pods():
+            return [_make_pod("default", "p{}".format(i)) for i in range(3)]
+
+        first = pods()
+        for pod in first:
+            pod["metadata"]["resourceVersion"] = "1"
+        second = pods()
+        for pod in second:
+            pod["metadata"]["resourceVersion"] = "1"
+        second[0]["metadata"]["resourceVersion"] = "2"
+        list_func = MagicMock(side_effect=[
+            _list_page(first), _list_page(second), _list_page(second, rv="6")])
+        informer = SharedInformer(
+            list_func=list_func, compact_cache=True,
+            indexers={NAMESPACE_INDEX: meta_namespace_index_func})
+        modified = []
+        informer.add_event_handler(MODIFIED, modified.append)
+        informer._initial_list()
+
+        with patch.object(informer._codec, "decode",
+                          side_effect=AssertionError("stored object decoded")):
+            informer._initial_list()
+            informer._page_size = 2
+            informer._initial_list()
+            updated = _make_pod("default", "p1")
+            updated["metadata"]["resourceVersion"] = "7"
+            informer._cache._put(updated)
+
+        self.assertEqual(modified, [second[0]])
+        self.assertEqual(
+            sorted(informer.cache.index_keys(NAMESPACE_INDEX, "default")),
+            ["default/p0", "default/p1", "default/p2"])
+
+    def test_predicates_still_receive_old_object(self):
+        informer = SharedInformer(list_func=MagicMock(), compact_cache=True)
+        old = _make_pod("default", "p1")
+        old["metadata"]["resourceVersion"] = "1"
+        new = _make_pod("default", "p1")
+        new["metadata"]["resourceVersion"] = "2"
+        seen = []
+        informer.add_event_handler(
+            MODIFIED, lambda obj: None,
+            predicate=lambda o, n: seen.append((o, n)) or True)
+        informer._cache._put(old)
+
+        informer._fire_modified("default/p1", informer._cache._put(new), new)
+
+        self.assertEqual(seen, [(old, new)])
+
+    def test_snapshot_writes_stored_bytes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pods.snapshot")
+            list_func = MagicMock()
+            list_func.return_value = _list_page(
+                [_make_pod("default", "p1"), _make_pod("default", "p2")])
+            informer = SharedInformer(
+                list_func=list_func, compact_cache=True, snapshot_path=path)
+            informer._initial_list()
+
+            with patch.object(informer._codec, "decode",
+                              side_effect=AssertionError("decoded")), \
+                    patch.object(informer._codec.api_client,
+                                 "sanitize_for_serialization",
+                                 side_effect=AssertionError("re-encoded")):
+                informer._save_snapshot()
+
+            rv, objects = load_snapshot(
+                path, "", informer._codec.api_client,
+                identity=informer._snapshot_identity)
+        self.assertEqual(rv, "5")
+        self.assertEqual(
+            sorted(objects, key=lambda o: o["metadata"]["name"]),
+            [_make_pod("default", "p1"), _make_pod("default", "p2")])
+
 
 class TestSharedInformerHandlers(unittest.TestCase):
     def setUp(self):
@@ -165,6 +526,114 @@ class TestSharedInformerHandlers(unittest.TestCase):
         # Should not raise
         self.informer._fire(ADDED, _make_pod("default", "p1"))
 
+    def test_stop_leaves_shared_queued_handlers_running(self):
+        handler = QueuedHandler(lambda obj: None)
+        other = SharedInformer(list_func=MagicMock())
+        self.informer.add_event_handler(ADDED, handler)
+        other.add_event_handler(ADDED, handler)
+        self.informer._fire(ADDED, _make_pod("default", "p1"))
+        self.informer.stop()
+        other._fire(ADDED, _make_pod("default", "p2"))
+        handler.join()
+        self.assertEqual(handler.metrics()["processed"], 2)
+        self.assertNotEqual(handler._threads, [])
+        handler.stop()
+        self.assertEqual(handler._threads, [])
+
+
+class TestQueuedHandler(unittest.TestCase):
+    def test_runs_handler_off_calling_thread(self):
+        threads = []
+        handler = QueuedHandler(lambda obj: threads.append(threading.current_thread()))
+        handler(_make_pod("default", "p1"))
+        handler.join()
+        handler.stop()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_ordered_keeps_per_key_order(self):
+        seen = {}
+        lock = threading.Lock()
+
+        def record(obj):
+            with lock:
+                seen.setdefault(obj["metadata"]["name"], []).append(obj["n"])
+
+        handler = QueuedHandler(record, workers=4)
+        for n in range(50):
+            for name in ("a", "b", "c"):
+                pod = _make_pod("default", name)
+                pod["n"] = n
+                handler(pod)
+        handler.stop()
+        for name in ("a", "b", "c"):
+            self.assertEqual(seen[name], list(range(50)))
+
+    def test_unordered_uses_all_workers(self):
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def slow(obj):
+            started.release()
+            release.wait()
+
+        handler = QueuedHandler(slow, workers=3, ordered=False)
+        for _ in range(3):
+            handler(_make_pod("default", "same"))
+        for _ in range(3):
+            self.assertTrue(started.acquire(timeout=5))
+        release.set()
+        handler.stop()
+        self.assertEqual(handler.metrics()["processed"], 3)
+
+    def _blocked_handler(self, overflow):
+        release = threading.Event()
+        started = threading.Event()
+        seen = []
+
+        def slow(obj):
+            started.set()
+            release.wait()
+            seen.append(obj)
+
+        handler = QueuedHandler(slow, max_queue=2, overflow=overflow)
+        handler(0)
+        self.assertTrue(started.wait(timeout=5))
+        for n in range(1, 5):
+            handler(n)
+        self.assertEqual(handler.metrics()["queue_depth"], 2)
+        self.assertEqual(handler.metrics()["dropped"], 2)
+        release.set()
+        handler.stop()
+        return seen
+
+    def test_drop_newest(self):
+        self.assertEqual(self._blocked_handler(DROP_NEWEST), [0, 1, 2])
+
+    def test_drop_oldest(self):
+        self.assertEqual(self._blocked_handler(DROP_OLDEST), [0, 3, 4])
+
+    def test_metrics_count_failures_and_latency(self):
+        def flaky(obj):
+            if obj == "bad":
+                raise RuntimeError("boom")
+
+        handler = QueuedHandler(flaky)
+        handler("ok")
+        handler("bad")
+        handler.stop()
+        metrics = handler.metrics()
+        self.assertEqual(metrics["processed"], 2)
+        self.assertEqual(metrics["failed"], 1)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertGreaterEqual(metrics["latency_max"], metrics["latency_avg"])
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            QueuedHandler(print, overflow="spill")
+        with self.assertRaises(ValueError):
+            QueuedHandler(print, workers=0)
+
 
 class TestSharedInformerWatchLoop(unittest.TestCase):
     """Test the watch loop by mocking Watch.stream."""
@@ -533,6 +1002,48 @@ class TestSharedInformerWatchLoop(unittest.TestCase):
         # list_func called once for the initial list + once for the resync = 2
         self.assertEqual(list_func.call_count, 2)
 
+    def test_resync_from_cache_replays_without_list(self):
+        """With resync_from_cache the resync fires MODIFIED from the cache."""
+        pod = _make_pod("default", "resync-pod")
+
+        list_func = MagicMock()
+        list_resp = MagicMock()
+        list_resp.items = [pod]
+        list_resp.metadata = MagicMock(resource_version="5")
+        list_func.return_value = list_resp
+
+        informer = SharedInformer(
+            list_func=list_func, resync_period=60, resync_from_cache=True)
+        modified = []
+        informer.add_event_handler(MODIFIED, modified.append)
+
+        stream_calls = {"n": 0}
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch, \
+                patch("kubernetes.informer.informer.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 61.0, 61.0]
+            mock_time.sleep = time.sleep
+
+            mock_w = MagicMock()
+            mock_w.resource_version = "5"
+
+            def fake_stream(func, **kw):
+                stream_calls["n"] += 1
+                if stream_calls["n"] == 2:
+                    informer._stop_event.set()
+                return iter([])
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        # Only the initial list reaches the API server.
+        self.assertEqual(list_func.call_count, 1)
+        self.assertEqual(modified, [pod])
+        self.assertEqual(stream_calls["n"], 2)
+
     # ------------------------------------------------------------------
     # Tests analogous to the JavaScript cache_test.ts and Java
     # DefaultSharedIndexInformerWireMockTest scenarios.
@@ -1131,6 +1642,1011 @@ class TestSharedInformerWatchLoop(unittest.TestCase):
         self.assertIsNotNone(informer.cache.get_by_key("default/stable-pod"))
 
 
+
+class TestSharedInformerWatchList(unittest.TestCase):
+    """Initial sync through a send_initial_events watch."""
+
+    def _end_bookmark(self, rv):
+        obj = {
+            "metadata": {
+                "resourceVersion": rv,
+                "annotations": {"k8s.io/initial-events-end": "true"},
+            }
+        }
+        return {"type": "BOOKMARK", "object": obj, "raw_object": obj}
+
+    def test_initial_events_populate_cache_without_list(self):
+        pod1 = _make_pod("default", "p1")
+        pod2 = _make_pod("default", "p2")
+        list_func = MagicMock()
+        informer = SharedInformer(list_func=list_func, watch_list=True)
+        added = []
+        informer.add_event_handler(ADDED, added.append)
+        seen_kwargs = []
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = None
+
+            def fake_stream(func, **kw):
+                seen_kwargs.append(kw)
+                yield {"type": "ADDED", "object": pod1}
+                yield {"type": "ADDED", "object": pod2}
+                # Not synced until the initial-events-end bookmark.
+                self.assertIsNone(informer._resource_version)
+                mock_w.resource_version = "42"
+                yield self._end_bookmark("42")
+                informer._stop_event.set()
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        list_func.assert_not_called()
+        self.assertTrue(seen_kwargs[0]["send_initial_events"])
+        self.assertEqual(seen_kwargs[0]["resource_version_match"], "NotOlderThan")
+        self.assertNotIn("resource_version", seen_kwargs[0])
+        self.assertEqual(added, [pod1, pod2])
+        self.assertEqual(informer._resource_version, "42")
+        self.assertEqual(
+            sorted(informer.cache.list_keys()), ["default/p1", "default/p2"])
+
+    def test_resync_drops_objects_missing_from_initial_events(self):
+        stale = _make_pod("default", "stale")
+        kept = _make_pod("default", "kept")
+        informer = SharedInformer(list_func=MagicMock(), watch_list=True)
+        informer._cache._put(stale)
+        informer._cache._put(kept)
+        modified, deleted = [], []
+        informer.add_event_handler(MODIFIED, modified.append)
+        informer.add_event_handler(DELETED, deleted.append)
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = "7"
+
+            def fake_stream(func, **kw):
+                yield {"type": "ADDED", "object": kept}
+                yield self._end_bookmark("7")
+                informer._stop_event.set()
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        self.assertEqual(modified, [kept])
+        self.assertEqual(deleted, [stale])
+        self.assertEqual(informer.cache.list_keys(), ["default/kept"])
+
+    def test_falls_back_to_list_when_rejected(self):
+        from kubernetes.client.exceptions import ApiException
+
+        pod = _make_pod("default", "listed")
+        list_func = MagicMock()
+        list_resp = MagicMock()
+        list_resp.items = [pod]
+        list_resp.metadata = MagicMock(resource_version="5")
+        list_func.return_value = list_resp
+        informer = SharedInformer(list_func=list_func, watch_list=True)
+        seen_kwargs = []
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = "5"
+
+            def fake_stream(func, **kw):
+                seen_kwargs.append(kw)
+                if len(seen_kwargs) == 1:
+                    raise ApiException(status=422, reason="Unprocessable Entity")
+                informer._stop_event.set()
+                return iter([])
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        list_func.assert_called_once()
+        self.assertEqual(list_func.call_args.kwargs["limit"], 500)
+        self.assertFalse(informer._watch_list)
+        self.assertNotIn("send_initial_events", seen_kwargs[1])
+        self.assertEqual(seen_kwargs[1]["resource_version"], "5")
+        self.assertIsNotNone(informer.cache.get_by_key("default/listed"))
+
+    def test_falls_back_to_paged_list_without_end_bookmark(self):
+        # A server without WatchList ignores sendInitialEvents: it streams
+        # the objects as ADDED and the watch ends without the bookmark.
+        streamed = _make_pod("default", "streamed")
+        listed = _make_pod("default", "listed")
+        list_func = MagicMock(return_value=_list_page([listed], rv="9"))
+        informer = SharedInformer(list_func=list_func, watch_list=True, page_size=50)
+        seen_kwargs = []
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = None
+
+            def fake_stream(func, **kw):
+                seen_kwargs.append(kw)
+                if len(seen_kwargs) == 1:
+                    yield {"type": "ADDED", "object": streamed}
+                    return
+                informer._stop_event.set()
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        self.assertEqual(len(seen_kwargs), 2)
+        list_func.assert_called_once()
+        self.assertEqual(list_func.call_args.kwargs["limit"], 50)
+        self.assertFalse(informer._watch_list)
+        self.assertTrue(informer.has_synced())
+        self.assertNotIn("send_initial_events", seen_kwargs[1])
+        self.assertEqual(seen_kwargs[1]["resource_version"], "9")
+        self.assertEqual(informer.cache.list_keys(), ["default/listed"])
+
+    def test_resync_period_applies_after_end_bookmark(self):
+        informer = SharedInformer(
+            list_func=MagicMock(), watch_list=True, resync_period=30)
+        seen_kwargs = []
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = None
+
+            def fake_stream(func, **kw):
+                seen_kwargs.append(kw)
+                if len(seen_kwargs) == 1:
+                    yield {"type": "ADDED", "object": _make_pod("default", "p1")}
+                    mock_w.resource_version = "42"
+                    yield self._end_bookmark("42")
+                    yield {"type": "ADDED", "object": _make_pod("default", "late")}
+                    self.fail("watch-list stream read past its end bookmark")
+                informer._stop_event.set()
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        self.assertNotIn("timeout_seconds", seen_kwargs[0])
+        self.assertNotIn("send_initial_events", seen_kwargs[1])
+        self.assertEqual(seen_kwargs[1]["resource_version"], "42")
+        self.assertEqual(seen_kwargs[1]["timeout_seconds"], 30)
+        self.assertEqual(informer.cache.list_keys(), ["default/p1"])
+
+
+def _list_page(items, rv="5", token=None):
+    return SimpleNamespace(
+        items=items,
+        metadata=SimpleNamespace(resource_version=rv, var_continue=token),
+    )
+
+
+class TestSharedInformerPagedList(unittest.TestCase):
+    def test_pages_follow_continue_token(self):
+        pods = [_make_pod("default", "p{}".format(n)) for n in range(5)]
+        pages = {
+            None: _list_page(pods[:2], token="t1"),
+            "t1": _list_page(pods[2:4], token="t2"),
+            "t2": _list_page(pods[4:]),
+        }
+        calls = []
+
+        def list_func(**kw):
+            calls.append(kw)
+            return pages[kw.get("_continue")]
+
+        informer = SharedInformer(list_func=list_func, page_size=2)
+        added = []
+        informer.add_event_handler(ADDED, added.append)
+        informer._initial_list()
+
+        self.assertEqual(added, pods)
+        self.assertEqual([kw.get("_continue") for kw in calls], [None, "t1", "t2"])
+        self.assertTrue(all(kw["limit"] == 2 for kw in calls))
+        self.assertEqual(len(informer.cache.list()), 5)
+        self.assertEqual(informer._resource_version, "5")
+
+    def test_relist_fires_modified_and_deleted(self):
+        keep = _make_pod("default", "keep")
+        gone = _make_pod("default", "gone")
+        informer = SharedInformer(list_func=MagicMock(), page_size=10)
+        informer.cache._put(keep)
+        informer.cache._put(gone)
+        informer._list_func.return_value = _list_page([keep], rv="9")
+        modified, deleted = [], []
+        informer.add_event_handler(MODIFIED, modified.append)
+        informer.add_event_handler(DELETED, deleted.append)
+
+        informer._initial_list()
+
+        self.assertEqual(modified, [keep])
+        self.assertEqual(deleted, [gone])
+        self.assertIsNone(informer.cache.get_by_key("default/gone"))
+        self.assertEqual(informer._resource_version, "9")
+
+    def test_expired_continue_token_restarts_list(self):
+        from kubernetes.client.exceptions import ApiException
+
+        stale = _make_pod("default", "stale")
+        fresh = _make_pod("default", "fresh")
+        calls = []
+
+        def list_func(**kw):
+            calls.append(kw.get("_continue"))
+            if len(calls) == 1:
+                return _list_page([stale], token="t1")
+            if len(calls) == 2:
+                raise ApiException(status=410, reason="Gone")
+            return _list_page([fresh], rv="7")
+
+        informer = SharedInformer(list_func=list_func, page_size=1)
+        deleted = []
+        informer.add_event_handler(DELETED, deleted.append)
+        informer._initial_list()
+
+        self.assertEqual(calls, [None, "t1", None])
+        self.assertEqual(deleted, [stale])
+        self.assertEqual(informer.cache.list(), [fresh])
+        self.assertEqual(informer._resource_version, "7")
+
+
+
+def _versioned_pod(name, rv, generation=1, labels=None):
+    pod = _make_pod("default", name)
+    pod["metadata"].update(
+        resourceVersion=rv, generation=generation, labels=labels or {})
+    return pod
+
+
+class TestChangeAwareModified(unittest.TestCase):
+    def setUp(self):
+        self.informer = SharedInformer(list_func=MagicMock())
+
+    def _relist(self, *items):
+        self.informer._list_func.return_value = _list_page(list(items))
+        self.informer._initial_list()
+
+    def test_relist_skips_unchanged_resource_version(self):
+        modified = []
+        self.informer.add_event_handler(MODIFIED, modified.append)
+        self._relist(_versioned_pod("a", "1"), _versioned_pod("b", "1"))
+        changed = _versioned_pod("b", "2")
+        self._relist(_versioned_pod("a", "1"), changed)
+        self.assertEqual(modified, [changed])
+
+    def test_paged_relist_skips_unchanged_resource_version(self):
+        self.informer._page_size = 10
+        modified = []
+        self.informer.add_event_handler(MODIFIED, modified.append)
+        self._relist(_versioned_pod("a", "1"))
+        self._relist(_versioned_pod("a", "1"))
+        self.assertEqual(modified, [])
+
+    def test_predicate_receives_old_and_new(self):
+        by_generation, by_labels, unfiltered = [], [], []
+        self.informer.add_event_handler(
+            MODIFIED, by_generation.append, predicate=generation_changed)
+        self.informer.add_event_handler(
+            MODIFIED, by_labels.append, predicate=labels_changed)
+        self.informer.add_event_handler(MODIFIED, unfiltered.append)
+        self._relist(_versioned_pod("a", "1"))
+
+        status_only = _versioned_pod("a", "2")
+        self._relist(status_only)
+        relabelled = _versioned_pod("a", "3", labels={"app": "x"})
+        self._relist(relabelled)
+        respecced = _versioned_pod("a", "4", generation=2, labels={"app": "x"})
+        self._relist(respecced)
+
+        self.assertEqual(unfiltered, [status_only, relabelled, respecced])
+        self.assertEqual(by_labels, [relabelled])
+        self.assertEqual(by_generation, [respecced])
+
+    def test_predicate_only_for_modified(self):
+        with self.assertRaises(ValueError):
+            self.informer.add_event_handler(
+                ADDED, print, predicate=generation_changed)
+
+    def test_remove_handler_with_predicate(self):
+        received = []
+        self.informer.add_event_handler(
+            MODIFIED, received.append, predicate=spec_changed)
+        self.informer.remove_event_handler(MODIFIED, received.append)
+        self.informer._fire(MODIFIED, _versioned_pod("a", "2"))
+        self.assertEqual(received, [])
+
+
+class TestPredicates(unittest.TestCase):
+    def test_resource_version_changed(self):
+        self.assertFalse(resource_version_changed(
+            _versioned_pod("a", "1"), _versioned_pod("a", "1")))
+        self.assertTrue(resource_version_changed(
+            _versioned_pod("a", "1"), _versioned_pod("a", "2")))
+        self.assertTrue(resource_version_changed(None, _versioned_pod("a", "1")))
+        self.assertTrue(resource_version_changed(
+            _make_pod("default", "a"), _make_pod("default", "a")))
+
+    def test_model_objects(self):
+        old = SimpleNamespace(
+            metadata=SimpleNamespace(resource_version="1", generation=1),
+            spec={"replicas": 1})
+        new = SimpleNamespace(
+            metadata=SimpleNamespace(resource_version="2", generation=1),
+            spec={"replicas": 2})
+        self.assertTrue(resource_version_changed(old, new))
+        self.assertFalse(generation_changed(old, new))
+        self.assertTrue(spec_changed(old, new))
+        self.assertFalse(annotations_changed(old, new))
+
+
+
+class TestSharedInformerFactory(unittest.TestCase):
+    def setUp(self):
+        self.api = MagicMock()
+        self.api.list_pods.return_value = _list_page([_make_pod("default", "p1")])
+        self.factory = SharedInformerFactory(page_size=100)
+
+    def test_same_key_shares_informer(self):
+        first = self.factory.informer_for(self.api.list_pods, namespace="default")
+        second = self.factory.informer_for(self.api.list_pods, namespace="default")
+        other = self.factory.informer_for(
+            self.api.list_pods, namespace="default", label_selector="app=x")
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(len(self.factory.informers()), 2)
+        self.assertEqual(first._page_size, 100)
+        self.assertEqual(other._label_selector, "app=x")
+
+    def test_separate_api_objects_share_informer(self):
+        from kubernetes.client import ApiClient, Configuration, CustomObjectsApi
+
+        def api(host):
+            return CustomObjectsApi(ApiClient(Configuration(host=host)))
+
+        def widgets(api, plural="widgets"):
+            return functools.partial(
+                api.list_namespaced_custom_object, "example.com", "v1",
+                plural=plural)
+
+        first = self.factory.informer_for(
+            widgets(api("https://a")), namespace="default")
+        second = self.factory.informer_for(
+            widgets(api("https://a")), namespace="default")
+        self.assertIs(first, second)
+        self.assertIsNot(first, self.factory.informer_for(
+            widgets(api("https://b")), namespace="default"))
+        self.assertIsNot(first, self.factory.informer_for(
+            widgets(api("https://a"), plural="gadgets"), namespace="default"))
+        self.assertIs(
+            self.factory.informer_for(api("https://a").list_cluster_custom_object),
+            self.factory.informer_for(api("https://a").list_cluster_custom_object))
+        self.assertEqual(len(self.factory.informers()), 4)
+
+    def test_start_all_and_wait_for_cache_sync(self):
+        informer = self.factory.informer_for(self.api.list_pods)
+        self.assertFalse(self.factory.wait_for_cache_sync(timeout=0))
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = "5"
+
+            def fake_stream(func, **kw):
+                informer._stop_event.wait(timeout=3)
+                return iter([])
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            self.factory.start_all()
+            self.assertTrue(self.factory.wait_for_cache_sync(timeout=3))
+            self.factory.stop_all()
+
+        self.assertTrue(informer.has_synced())
+        self.assertIsNotNone(informer.cache.get_by_key("default/p1"))
+
+
+
+class _NoDelay:
+    def __init__(self):
+        self.forgotten = []
+
+    def when(self, item):
+        return 0.0
+
+    def num_requeues(self, item):
+        return 0
+
+    def forget(self, item):
+        self.forgotten.append(item)
+
+
+class TestWorkQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = WorkQueue(rate_limiter=_NoDelay())
+
+    def tearDown(self):
+        self.queue.shut_down()
+
+    def test_deduplicates_queued_items(self):
+        for _ in range(3):
+            self.queue.add("default/a")
+        self.queue.add("default/b")
+        self.assertEqual(len(self.queue), 2)
+        self.assertEqual(self.queue.get(), "default/a")
+        self.assertEqual(self.queue.get(), "default/b")
+        self.assertIsNone(self.queue.get(timeout=0.01))
+
+    def test_item_added_while_processing_is_requeued_on_done(self):
+        self.queue.add("a")
+        item = self.queue.get()
+        self.queue.add("a")
+        # Not handed to a second worker while still processing.
+        self.assertIsNone(self.queue.get(timeout=0.01))
+        self.queue.done(item)
+        self.assertEqual(self.queue.get(timeout=1), "a")
+
+    def test_add_object_uses_key_func(self):
+        self.queue.add_object(_make_pod("default", "p1"))
+        self.assertEqual(self.queue.get(), "default/p1")
+
+    def test_add_after_delays_item(self):
+        self.queue.add_after("later", 0.05)
+        self.queue.add_after("later", 10)  # a later time does not postpone it
+        self.assertEqual(self.queue.metrics()["waiting"], 1)
+        self.assertIsNone(self.queue.get(timeout=0.01))
+        self.assertEqual(self.queue.get(timeout=2), "later")
+
+    def test_shut_down_wakes_getters(self):
+        results = []
+        t = threading.Thread(target=lambda: results.append(self.queue.get()))
+        t.start()
+        self.queue.shut_down()
+        t.join(timeout=2)
+        self.assertEqual(results, [None])
+        self.queue.add("ignored")
+        self.assertEqual(len(self.queue), 0)
+
+    def test_metrics(self):
+        self.queue.add("a")
+        self.queue.add_rate_limited("b")
+        self.queue.done(self.queue.get())
+        self.queue.forget("b")
+        metrics = self.queue.metrics()
+        self.assertEqual(metrics["adds"], 2)
+        self.assertEqual(metrics["retries"], 1)
+        self.assertEqual(metrics["depth"], 1)
+        self.assertEqual(metrics["processing"], 0)
+        self.assertEqual(self.queue._rate_limiter.forgotten, ["b"])
+
+
+class TestRateLimiters(unittest.TestCase):
+    def test_exponential_backoff(self):
+        limiter = ItemExponentialFailureRateLimiter(base_delay=0.01, max_delay=0.05)
+        self.assertEqual(
+            [limiter.when("a") for _ in range(4)], [0.01, 0.02, 0.04, 0.05])
+        self.assertEqual(limiter.when("b"), 0.01)
+        self.assertEqual(limiter.num_requeues("a"), 4)
+        limiter.forget("a")
+        self.assertEqual(limiter.when("a"), 0.01)
+
+    def test_bucket(self):
+        limiter = BucketRateLimiter(qps=1, burst=2)
+        self.assertEqual(limiter.when("a"), 0.0)
+        self.assertEqual(limiter.when("b"), 0.0)
+        self.assertAlmostEqual(limiter.when("c"), 1.0, places=1)
+
+    def test_max_of(self):
+        limiter = MaxOfRateLimiter(
+            ItemExponentialFailureRateLimiter(base_delay=0.5),
+            BucketRateLimiter(qps=1, burst=10),
+        )
+        self.assertEqual(limiter.when("a"), 0.5)
+        self.assertEqual(limiter.num_requeues("a"), 1)
+
+
+
+def _bulky_pod(name):
+    pod = _make_pod("default", name)
+    pod["metadata"]["managedFields"] = [{"manager": "kubectl"}]
+    pod["metadata"]["annotations"] = {
+        LAST_APPLIED_CONFIGURATION: "{}", "keep": "yes"}
+    return pod
+
+
+class TestTransforms(unittest.TestCase):
+    def test_strip_dict(self):
+        pod = chain(strip_managed_fields, strip_annotations())(_bulky_pod("p1"))
+        self.assertNotIn("managedFields", pod["metadata"])
+        self.assertEqual(pod["metadata"]["annotations"], {"keep": "yes"})
+
+    def test_strip_model(self):
+        from kubernetes.client import V1ObjectMeta, V1Pod
+
+        pod = V1Pod(metadata=V1ObjectMeta(
+            name="p1",
+            managed_fields=[],
+            annotations={"a": "1", "b": "2"},
+        ))
+        pod = chain(strip_managed_fields, strip_annotations("a"))(pod)
+        self.assertIsNone(pod.metadata.managed_fields)
+        self.assertEqual(pod.metadata.annotations, {"b": "2"})
+
+    def test_objects_without_metadata_pass_through(self):
+        self.assertEqual(strip_managed_fields({}), {})
+        self.assertEqual(strip_annotations()({"metadata": {}}), {"metadata": {}})
+
+    def test_informer_transforms_listed_and_watched_objects(self):
+        list_func = MagicMock()
+        list_func.return_value = _list_page([_bulky_pod("listed")])
+        informer = SharedInformer(
+            list_func=list_func, transform=strip_managed_fields)
+        received = []
+        informer.add_event_handler(ADDED, received.append)
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+
+            def fake_stream(func, **kw):
+                yield {"type": "ADDED", "object": _bulky_pod("watched")}
+                informer._stop_event.set()
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        self.assertEqual(len(received), 2)
+        for obj in received + informer.cache.list():
+            self.assertNotIn("managedFields", obj["metadata"])
+
+
+class TestSnapshotPersistence(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.path = os.path.join(self._dir.name, "pods.snapshot")
+
+    def test_round_trip_models(self):
+        from kubernetes.client import ApiClient, V1ObjectMeta, V1Pod
+
+        api_client = ApiClient()
+        pods = [V1Pod(metadata=V1ObjectMeta(namespace="default", name=n))
+                for n in ("a", "b")]
+        save_snapshot(self.path, pods, "42", api_client)
+
+        rv, loaded = load_snapshot(self.path, V1Pod, api_client)
+
+        self.assertEqual(rv, "42")
+        self.assertEqual([p.metadata.name for p in loaded], ["a", "b"])
+        self.assertIsInstance(loaded[0], V1Pod)
+        self.assertEqual(os.listdir(self._dir.name), ["pods.snapshot"])
+
+    def test_rejects_foreign_file(self):
+        from kubernetes.client import ApiClient
+
+        with open(self.path, "w") as f:
+            f.write("not a snapshot\n")
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path, "", ApiClient())
+
+    def test_rejects_snapshot_of_other_identity(self):
+        from kubernetes.client import ApiClient
+
+        api_client = ApiClient()
+        save_snapshot(self.path, [], "42", api_client,
+                      identity={"resource": "pods", "namespace": "a"})
+        rv, _ = load_snapshot(self.path, "", api_client,
+                              identity={"resource": "pods", "namespace": "a"})
+        self.assertEqual(rv, "42")
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path, "", api_client,
+                          identity={"resource": "pods", "namespace": "b"})
+
+    def test_informer_ignores_snapshot_of_other_selector(self):
+        list_func = MagicMock()
+        list_func.return_value = _list_page([_make_pod("default", "p1")], rv="5")
+        first = SharedInformer(
+            list_func=list_func, snapshot_path=self.path, label_selector="app=a")
+        first._initial_list()
+        first._save_snapshot()
+
+        for kwargs in ({"label_selector": "app=b"},
+                       {"label_selector": "app=a", "namespace": "other"},
+                       {"label_selector": "app=a", "key_func": lambda o: "k"}):
+            informer = SharedInformer(
+                list_func=list_func, snapshot_path=self.path, **kwargs)
+            informer._load_snapshot()
+            self.assertIsNone(informer._resource_version)
+            self.assertEqual(informer.cache.list(), [])
+
+        informer = SharedInformer(
+            list_func=list_func, snapshot_path=self.path, label_selector="app=a")
+        informer._load_snapshot()
+        self.assertEqual(informer._resource_version, "5")
+
+    def test_snapshot_identity_names_the_list_func(self):
+        from kubernetes.client import ApiClient, CustomObjectsApi
+
+        api = CustomObjectsApi(ApiClient())
+        informer = SharedInformer(
+            list_func=functools.partial(
+                api.list_namespaced_custom_object, "example.com", "v1",
+                plural="widgets"),
+            snapshot_path=self.path)
+        self.assertEqual(
+            informer._snapshot_identity["resource"],
+            "kubernetes.client.api.custom_objects_api.CustomObjectsApi."
+            "list_namespaced_custom_object('example.com', 'v1', plural='widgets')")
+
+    def test_informer_resumes_from_snapshot(self):
+        list_func = MagicMock()
+        list_func.return_value = _list_page([_make_pod("default", "p1")], rv="5")
+        first = SharedInformer(list_func=list_func, snapshot_path=self.path)
+        first._initial_list()
+        first._save_snapshot()
+
+        list_func.reset_mock()
+        informer = SharedInformer(list_func=list_func, snapshot_path=self.path)
+        added = []
+        informer.add_event_handler(ADDED, added.append)
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = None
+
+            def fake_stream(func, **kw):
+                informer._stop_event.set()
+                return iter([])
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        list_func.assert_not_called()
+        self.assertEqual(mock_w.stream.call_args.kwargs["resource_version"], "5")
+        self.assertTrue(informer.has_synced())
+        self.assertEqual(informer.cache.list_keys(), ["default/p1"])
+        self.assertEqual(len(added), 1)
+
+    def test_unreadable_snapshot_falls_back_to_list(self):
+        with open(self.path, "w") as f:
+            f.write("garbage")
+        list_func = MagicMock()
+        list_func.return_value = _list_page([], rv="7")
+        informer = SharedInformer(list_func=list_func, snapshot_path=self.path)
+
+        informer._load_snapshot()
+
+        self.assertIsNone(informer._resource_version)
+        self.assertFalse(informer.has_synced())
+
+    def test_stop_writes_committed_state(self):
+        list_func = MagicMock()
+        list_func.return_value = _list_page([_make_pod("default", "p1")], rv="5")
+        informer = SharedInformer(
+            list_func=list_func, snapshot_path=self.path, snapshot_period=0)
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = "6"
+
+            def fake_stream(func, **kw):
+                yield {"type": "ADDED", "object": _make_pod("default", "p2")}
+                informer._stop_event.set()
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+            informer.stop()
+
+        rv, objects = load_snapshot(
+            self.path, "", informer._codec.api_client,
+            identity=informer._snapshot_identity)
+        self.assertEqual(rv, "6")
+        self.assertEqual(len(objects), 2)
+
+
+class TestInformerMetrics(unittest.TestCase):
+    def test_event_time(self):
+        pod = _make_pod("default", "p1")
+        self.assertIsNone(event_time(MODIFIED, pod))
+        pod["metadata"]["creationTimestamp"] = "2026-01-01T00:00:00Z"
+        pod["metadata"]["managedFields"] = [
+            {"manager": "a", "time": "2026-01-01T00:00:05Z"},
+            {"manager": "b", "time": "2026-01-01T00:00:09Z"},
+        ]
+        self.assertEqual(event_time(MODIFIED, pod).second, 9)
+        del pod["metadata"]["managedFields"]
+        self.assertEqual(event_time(ADDED, pod).second, 0)
+        self.assertIsNone(event_time(MODIFIED, pod))
+
+    def test_watch_loop_records_metrics(self):
+        list_func = MagicMock()
+        list_func.return_value = _list_page([_make_pod("default", "p1")])
+        observed = []
+        informer = SharedInformer(
+            list_func=list_func,
+            metrics_hook=lambda name, value, labels: observed.append((name, labels)),
+        )
+        informer.add_event_handler(ADDED, lambda obj: None)
+        fresh = _make_pod("default", "p2")
+        fresh["metadata"]["creationTimestamp"] = datetime.datetime.now(
+            datetime.timezone.utc).isoformat()
+        streams = [
+            [{"type": "ADDED", "object": fresh}],
+            ApiException(status=410, reason="Gone"),
+        ]
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = "6"
+
+            def fake_stream(func, **kw):
+                if not streams:
+                    informer._stop_event.set()
+                    return
+                script = streams.pop(0)
+                if isinstance(script, Exception):
+                    raise script
+                yield from script
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        stats = informer.metrics()
+        self.assertEqual(stats["events"], {"ADDED": 1})
+        self.assertEqual(stats["event_lag_seconds"]["count"], 1)
+        self.assertLess(stats["event_lag_seconds"]["max"], 60)
+        self.assertEqual(stats["reconnects"], 2)
+        self.assertEqual(stats["expired_relists"], 1)
+        self.assertEqual(stats["lists"], 2)
+        self.assertIsNotNone(stats["initial_list_seconds"])
+        self.assertEqual(stats["handler_seconds"][ADDED]["count"], 2)
+        self.assertEqual(stats["cache_objects"], 1)
+        self.assertEqual(
+            stats["cache_bytes"],
+            len(JsonCodec(ApiClient()).encode(informer.cache.list()[0])))
+        self.assertIn(("events", {"type": "ADDED"}), observed)
+        self.assertIn(("expired_relists", {}), observed)
+
+    def test_hook_errors_are_swallowed(self):
+        def bad_hook(name, value, labels):
+            raise RuntimeError("boom")
+
+        informer = SharedInformer(list_func=MagicMock(), metrics_hook=bad_hook)
+        received = []
+        informer.add_event_handler(ADDED, received.append)
+        informer._fire(ADDED, _make_pod("default", "p1"))
+        self.assertEqual(len(received), 1)
+
+    def test_watch_list_initial_events_record_no_lag(self):
+        informer = SharedInformer(list_func=MagicMock(), watch_list=True)
+        old = _make_pod("default", "old")
+        old["metadata"]["creationTimestamp"] = "2020-01-01T00:00:00Z"
+        fresh = _make_pod("default", "fresh")
+        fresh["metadata"]["creationTimestamp"] = datetime.datetime.now(
+            datetime.timezone.utc).isoformat()
+        end = {"metadata": {
+            "resourceVersion": "42",
+            "annotations": {"k8s.io/initial-events-end": "true"},
+        }}
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = "42"
+
+            def fake_stream(func, **kw):
+                yield {"type": "ADDED", "object": old}
+                yield {"type": "BOOKMARK", "object": end, "raw_object": end}
+                yield {"type": "ADDED", "object": fresh}
+                informer._stop_event.set()
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        stats = informer.metrics()
+        self.assertEqual(stats["events"], {"ADDED": 2, "BOOKMARK": 1})
+        self.assertEqual(stats["event_lag_seconds"]["count"], 1)
+        self.assertLess(stats["event_lag_seconds"]["max"], 60)
+
+    def test_cache_size_without_compact_cache(self):
+        informer = SharedInformer(list_func=MagicMock())
+        pods = [_make_pod("default", "pod-{:04}".format(i)) for i in range(1000)]
+        informer._cache._replace_all(pods)
+
+        with patch.object(informer._cache, "snapshot",
+                          side_effect=AssertionError("snapshot copied")):
+            stats = informer.metrics()
+
+        self.assertEqual(stats["cache_objects"], 1000)
+        codec = JsonCodec(ApiClient())
+        self.assertEqual(
+            stats["cache_bytes"], sum(len(codec.encode(p)) for p in pods))
+
+    def test_cache_bytes_with_compact_cache(self):
+        list_func = MagicMock()
+        list_func.return_value = _list_page([_make_pod("default", "p1")])
+        informer = SharedInformer(list_func=list_func, compact_cache=True)
+        informer._initial_list()
+        self.assertEqual(
+            informer.metrics()["cache_bytes"],
+            len(informer.cache._objects["default/p1"].data))
+
+
+def _custom_list(items, rv="5", token=None):
+    metadata = {"resourceVersion": rv}
+    if token:
+        metadata["continue"] = token
+    return {"apiVersion": "example.com/v1", "kind": "WidgetList",
+            "metadata": metadata, "items": items}
+
+
+class _StreamBody(io.BytesIO):
+    """Response body that closes at EOF, as a socket does."""
+
+    def read(self, *args):
+        data = super().read(*args)
+        if not data:
+            self.close()
+        return data
+
+
+def _raw_response(body):
+    return SimpleNamespace(data=json.dumps(body).encode())
+
+
+class TestRawDictInformer(unittest.TestCase):
+    def test_custom_objects_list_and_watch_as_dicts(self):
+        list_func = MagicMock()
+        list_func.return_value = _raw_response(_custom_list([_make_pod("default", "w1")]))
+        informer = SharedInformer(list_func=list_func, deserialize=False)
+        widget = _make_pod("default", "w2")
+
+        with patch("kubernetes.informer.informer.Watch") as MockWatch:
+            mock_w = MagicMock()
+            mock_w.resource_version = "6"
+
+            def fake_stream(func, **kw):
+                yield {"type": "ADDED", "object": widget, "raw_object": widget}
+                informer._stop_event.set()
+
+            mock_w.stream.side_effect = fake_stream
+            MockWatch.return_value = mock_w
+
+            informer.start()
+            informer._thread.join(timeout=3)
+
+        MockWatch.assert_called_with(return_type="object", api_client=None)
+        self.assertFalse(list_func.call_args_list[0].kwargs["_preload_content"])
+        self.assertEqual(mock_w.stream.call_args.kwargs["resource_version"], "5")
+        self.assertEqual(informer.cache.list_keys(), ["default/w1", "default/w2"])
+        self.assertIs(informer.cache.get_by_key("default/w2"), widget)
+
+    def test_paged_dict_list(self):
+        list_func = MagicMock(side_effect=[
+            _raw_response(_custom_list([_make_pod("default", "w1")], token="t1")),
+            _raw_response(_custom_list([_make_pod("default", "w2")], rv="9")),
+        ])
+        informer = SharedInformer(list_func=list_func, deserialize=False, page_size=1)
+        informer._initial_list()
+        self.assertEqual(list_func.call_args.kwargs["_continue"], "t1")
+        self.assertEqual(informer._resource_version, "9")
+        self.assertEqual(len(informer.cache.list()), 2)
+
+    def test_dynamic_resource(self):
+        from kubernetes.client import ApiClient
+        from kubernetes.dynamic import Resource
+
+        dynamic_client = MagicMock()
+        dynamic_client.client = ApiClient()
+        dynamic_client.get.return_value = SimpleNamespace(data=json.dumps(
+            _custom_list([_make_pod("default", "w1")], rv="3")).encode())
+        resource = Resource(
+            prefix="apis", group="example.com", api_version="v1",
+            kind="Widget", namespaced=True, client=dynamic_client)
+        informer = SharedInformer(
+            list_func=resource, namespace="default",
+            key_func=lambda obj: obj["metadata"]["name"])
+
+        informer._initial_list()
+
+        dynamic_client.get.assert_called_once_with(
+            resource, serialize=False, namespace="default")
+        self.assertEqual(informer.cache.get_by_key("w1"), _make_pod("default", "w1"))
+        self.assertEqual(informer._resource_version, "3")
+        self.assertFalse(informer._deserialize)
+
+    def _stub_pool(self, api_client, *bodies):
+        pool_manager = MagicMock()
+        pool_manager.request.side_effect = [
+            urllib3.HTTPResponse(
+                body=_StreamBody(body), status=200, reason="OK",
+                headers={"Content-Type": "application/json"},
+                preload_content=False)
+            for body in bodies
+        ]
+        api_client.rest_client.pool_manager = pool_manager
+        return pool_manager
+
+    def test_generated_list_func_caches_dicts(self):
+        from kubernetes.client import ApiClient, AppsV1Api
+
+        api_client = ApiClient()
+        deployment = {"metadata": {"name": "web", "namespace": "default",
+                                   "resourceVersion": "2"}}
+        self._stub_pool(api_client, json.dumps({
+            "metadata": {"resourceVersion": "3"}, "items": [deployment],
+        }).encode())
+        informer = SharedInformer(
+            list_func=AppsV1Api(api_client).list_namespaced_deployment,
+            namespace="default", deserialize=False)
+
+        informer._initial_list()
+
+        self.assertEqual(informer.cache.get_by_key("default/web"), deployment)
+        self.assertEqual(informer._resource_version, "3")
+
+    def test_dynamic_resource_watch_list(self):
+        from kubernetes.client import ApiClient
+        from kubernetes.dynamic import DynamicClient, Resource
+
+        dynamic_client = DynamicClient.__new__(DynamicClient)
+        dynamic_client.client = ApiClient()
+        widget = _make_pod("default", "w1")
+        bookmark = {"metadata": {
+            "resourceVersion": "7",
+            "annotations": {"k8s.io/initial-events-end": "true"},
+        }}
+        pool_manager = self._stub_pool(dynamic_client.client, b"".join(
+            json.dumps(event).encode() + b"\n" for event in (
+                {"type": "ADDED", "object": widget},
+                {"type": "BOOKMARK", "object": bookmark},
+            )))
+        resource = Resource(
+            prefix="apis", group="example.com", api_version="v1", kind="Widget",
+            name="widgets", namespaced=True, client=dynamic_client)
+        informer = SharedInformer(
+            list_func=resource, namespace="default", watch_list=True)
+
+        def stop(obj):
+            informer._stop_event.set()
+            informer._watch.stop()
+
+        informer.add_event_handler(BOOKMARK, stop)
+
+        informer.start()
+        informer._thread.join(timeout=3)
+
+        self.assertTrue(informer.has_synced())
+        self.assertEqual(informer._resource_version, "7")
+        self.assertEqual(informer.cache.list(), [widget])
+        pool_manager.request.assert_called_once()
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(
+            pool_manager.request.call_args.args[1]).query)
+        self.assertEqual(query["sendInitialEvents"], ["true"])
+        self.assertEqual(query["resourceVersionMatch"], ["NotOlderThan"])
+
+
 if __name__ == "__main__":
     unittest.main()
 
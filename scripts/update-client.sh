@@ -65,6 +65,33 @@ git apply "${SCRIPT_ROOT}/rest_client_patch.diff"
 echo ">>> restoring Kubernetes client-go retry integration..."
 git apply --unidiff-zero "${SCRIPT_ROOT}/client_go_retry_patch.diff"
 
+echo ">>> restoring ApiClient.deserialize_data..."
+git apply "${SCRIPT_ROOT}/deserialize_data_patch.diff"
+
+echo ">>> restoring configurable JSON codec..."
+git apply "${SCRIPT_ROOT}/json_codec_patch.diff"
+
+echo ">>> restoring validate_responses option..."
+git apply "${SCRIPT_ROOT}/validate_responses_patch.diff"
+
+echo ">>> restoring lazy_responses option..."
+git apply "${SCRIPT_ROOT}/lazy_responses_patch.diff"
+
+echo ">>> restoring compiled response deserializers..."
+git apply "${SCRIPT_ROOT}/compiled_deserializers_patch.diff"
+
+echo ">>> restoring direct JSON request bodies..."
+git apply "${SCRIPT_ROOT}/serialize_body_patch.diff"
+
+echo ">>> restoring validate_arguments option..."
+git apply "${SCRIPT_ROOT}/validate_arguments_patch.diff"
+
+echo ">>> routing API argument validation through ApiClient..."
+sed -i'' \
+    -e 's/^from pydantic import \(BaseModel, \)\?validate_call, /from pydantic import \1/' \
+    -e 's/^\(from kubernetes\..*api_client import ApiClient, RequestSerialized\)$/\1, validate_call/' \
+    "${CLIENT_ROOT}"/client/api/*_api.py
+
 echo ">>> updating version information..."
 sed -i'' "s/^CLIENT_VERSION = .*/CLIENT_VERSION = \\\"${CLIENT_VERSION}\\\"/" "${SCRIPT_ROOT}/../setup.py"
 sed -i'' "s/^__version__ = .*/__version__ = \\\"${CLIENT_VERSION}\\\"/" "${CLIENT_ROOT}/__init__.py"